@@ -0,0 +1,13 @@
+from .harness import BenchmarkCase, BenchmarkResult, BenchmarkSuite, compare_results, load_baseline, save_baseline
+from .synthetic import synthetic_mesh, synthetic_obj_file
+
+__all__ = [
+    'BenchmarkCase',
+    'BenchmarkResult',
+    'BenchmarkSuite',
+    'compare_results',
+    'load_baseline',
+    'save_baseline',
+    'synthetic_mesh',
+    'synthetic_obj_file'
+]
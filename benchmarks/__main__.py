@@ -0,0 +1,93 @@
+import argparse
+import sys
+
+from .harness import DEFAULT_THRESHOLD, calibration_time, compare_results, load_baseline, save_baseline, format_seconds
+
+def load_suites() -> dict:
+    from . import micro, frames, imports, accuracy
+    return {suite.name: suite for suite in (micro.SUITE, frames.SUITE, imports.SUITE, accuracy.SUITE)}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Visualizer benchmark runner")
+    parser.add_argument("suites", nargs="*", help="Suites to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="List suites and cases, then exit")
+    parser.add_argument("-k", "--filter", help="Only run cases whose name contains this text")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Override mesh sizes for sized cases")
+    parser.add_argument("--full", action="store_true", help="Include the large synthetic meshes (up to 5M vertices)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--baseline", help="Baseline JSON file (default: benchmarks/baselines/<suite>.json)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown vs baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Re-run a regressed case this many times before reporting it")
+    parser.add_argument("--no-gate", action="store_true", help="Report regressions without failing")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    suites = load_suites()
+
+    selected = args.suites or list(suites)
+    unknown = [name for name in selected if name not in suites]
+    if unknown:
+        print(f"Unknown suite(s): {', '.join(unknown)}. Available: {', '.join(suites)}")
+        return 2
+
+    if args.list:
+        for name in selected:
+            print(f"{name}: {suites[name].description}")
+            for case in suites[name].cases:
+                sizes = "" if case.sizes == (None,) else f" {list(case.sizes)}"
+                print(f"  {case.name}{sizes}")
+        return 0
+
+    regressions = []
+    violations = []
+
+    for name in selected:
+        suite = suites[name]
+        print(f"== {name} ==")
+        calibration = calibration_time()
+        results = suite.run(sizes=args.sizes, full=args.full, name_filter=args.filter)
+
+        # Budget absolut berlaku dengan atau tanpa baseline
+        for result in results:
+            message = result.check_budget()
+            if message:
+                violations.append(result)
+                print(f"OVER BUDGET {result.key}: {message}")
+
+        if args.save_baseline:
+            path = save_baseline(name, results, args.baseline, calibration)
+            print(f"Baseline saved to {path}")
+            continue
+
+        baseline = load_baseline(name, args.baseline)
+        if not baseline:
+            print("No baseline found, skipping regression check")
+            continue
+
+        # Kasus yang terlihat regresi diulang dulu agar noise sesaat tidak menggagalkan run
+        for _ in range(args.retries):
+            suspects = [r for r, _, _, regressed in compare_results(results, baseline, args.threshold, calibration) if regressed]
+            if not suspects:
+                break
+            calibration = min(calibration, calibration_time())
+            results = [suite.rerun(r) if r in suspects else r for r in results]
+
+        for result, ratio, limit, regressed in compare_results(results, baseline, args.threshold, calibration):
+            if regressed:
+                regressions.append(result)
+                print(f"REGRESSION {result.key}: {format_seconds(result.value())} "
+                      f"({ratio:.2f}x baseline, limit {1.0 + limit:.2f}x)")
+
+    if (regressions or violations) and not args.no_gate:
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed past the threshold")
+        if violations:
+            print(f"{len(violations)} benchmark(s) exceeded their budget")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
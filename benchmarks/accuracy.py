@@ -0,0 +1,190 @@
+import time
+
+import numpy as np
+
+from src.visualizer.core.math.euler_angle import EulerAngle
+from src.visualizer.core.math.rotation_conversion import RotationConversion
+
+from .harness import BenchmarkCase, BenchmarkResult, BenchmarkSuite
+
+SUITE = BenchmarkSuite(
+    "accuracy",
+    "rotation error (degrees) of core.math round trips and long composition chains in float32/float64"
+)
+
+# Jumlah rotasi acak per round trip, 5M hanya dengan --full
+ROTATION_COUNTS = (1_000_000,)
+FULL_ROTATION_COUNTS = (1_000_000, 5_000_000)
+
+# Rantai komposisi: CHAIN_COUNT rantai paralel, ukuran kasus adalah jumlah langkah
+CHAIN_COUNT = 4096
+CHAIN_LENGTHS = (10_000,)
+FULL_CHAIN_LENGTHS = (10_000, 100_000)
+# Langkah di mana error dicatat untuk melihat pertumbuhannya (drift)
+CHAIN_CHECKPOINTS = (10, 100, 1_000, 10_000, 100_000)
+# Besar satu langkah rotasi, seperti delta per frame saat rotasi diterapkan berulang
+CHAIN_STEP_DEGREES = (0.01, 5.0)
+
+DTYPES = {'f64': np.float64, 'f32': np.float32}
+
+# Budget error maksimum (derajat). Round trip float64 dibatasi oleh ambang gimbal lock di
+# matrix_to_euler, float32 oleh presisi tunggal; rantai float32 tumbuh kira-kira linear terhadap langkah
+ROUNDTRIP_BUDGETS = {'f64': 1e-8, 'f32': 0.05}
+CHAIN_BUDGETS = {'f64': 1e-8, 'f32': 1.0}
+
+SEED = 0
+
+def random_quaternions(count: int, seed: int = SEED) -> np.ndarray:
+    # Gaussian 4D yang dinormalisasi tersebar merata pada S^3, jadi rotasinya merata pada SO(3)
+    q = np.random.default_rng(seed).standard_normal((count, 4))
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    return RotationConversion.canonicalize_quaternion(q)
+
+def rotation_error(a, b) -> np.ndarray:
+    # Sudut geodesik (derajat) antara dua batch quaternion, dihitung dalam float64.
+    # Bentuk atan2 tetap akurat untuk sudut sangat kecil dan aman terhadap tanda q / -q
+    a = RotationConversion.normalize_quaternion(np.asarray(a, dtype=np.float64))
+    b = RotationConversion.normalize_quaternion(np.asarray(b, dtype=np.float64))
+    minus = np.linalg.norm(a - b, axis=-1)
+    plus = np.linalg.norm(a + b, axis=-1)
+    return np.degrees(4.0 * np.arctan2(np.minimum(minus, plus), np.maximum(minus, plus)))
+
+def format_degrees(value: float) -> str:
+    return f"{value:.3g}°"
+
+class AccuracyResult(BenchmarkResult):
+    # samples berisi error per rotasi (array numpy), bukan waktu; statistik dihitung vektorisasi
+    def stats(self) -> dict:
+        errors = self.samples
+        p50, p95, p99 = np.percentile(errors, (50, 95, 99))
+        return {
+            'min': float(errors.min()),
+            'mean': float(errors.mean()),
+            'median': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+            'max': float(errors.max())
+        }
+
+    def check_budget(self) -> str:
+        if self.budget is not None and self.value() > self.budget:
+            return f"{self.metric} error {format_degrees(self.value())} exceeds budget {format_degrees(self.budget)}"
+        return None
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data['unit'] = "degrees"
+        return data
+
+    def __str__(self):
+        stats = self.stats()
+        lines = [
+            f"{self.key:<48} max {format_degrees(stats['max']):>10}  "
+            f"p99 {format_degrees(stats['p99']):>10}  p50 {format_degrees(stats['median']):>10}"
+        ]
+        for name, value in self.extra.get('orders', {}).items():
+            lines.append(f"    {name:<44} max {format_degrees(value):>10}")
+        for steps, value in self.extra.get('drift', {}).items():
+            lines.append(f"    {'after ' + str(steps) + ' steps':<44} max {format_degrees(value):>10}")
+        for name in ('norm_drift', 'orthogonality_drift'):
+            if name in self.extra:
+                lines.append(f"    {name:<44} max {self.extra[name]:>10.3g}")
+        return "\n".join(lines)
+
+class AccuracyBenchmarkCase(BenchmarkCase):
+    # Error dihitung sekali per ukuran; tidak ada gate terhadap baseline karena budget absolut
+    # sudah menjadi batasnya dan rasio waktu kalibrasi tidak berlaku untuk error
+    def __init__(self, name: str, measure, dtype: str, sizes, full_sizes, budget: float):
+        super().__init__(name, None, sizes, full_sizes, repeat=1, metric="max", gate=False, budget=budget)
+        self.measure = measure
+        self.dtype = dtype
+
+    def run(self, size) -> AccuracyResult:
+        started = time.perf_counter()
+        errors, extra = self.measure(size, DTYPES[self.dtype])
+        extra['elapsed_s'] = round(time.perf_counter() - started, 3)
+        return AccuracyResult(self.name, size, errors, 1, self.metric, self.threshold, self.gate, extra, self.budget)
+
+def roundtrip(representation: str):
+    # q -> representasi -> q, semua konversi dalam dtype yang diuji
+    def measure(count: int, dtype) -> tuple:
+        reference = random_quaternions(count)
+        q = reference.astype(dtype)
+        if representation == "euler":
+            # Error per rotasi adalah yang terburuk dari semua urutan rotasi
+            errors = np.zeros(count)
+            orders = {}
+            for order in EulerAngle.ROTATION_ORDERS:
+                angles = RotationConversion.from_quaternion_array(q, "euler", order)
+                order_errors = rotation_error(reference, RotationConversion.to_quaternion_array(angles, "euler", order))
+                orders[order] = float(order_errors.max())
+                np.maximum(errors, order_errors, out=errors)
+            return errors, {'orders': orders}
+
+        value = RotationConversion.from_quaternion_array(q, representation)
+        return rotation_error(reference, RotationConversion.to_quaternion_array(value, representation)), {}
+    return measure
+
+def _chain_steps(dtype) -> tuple:
+    # Tiap rantai mengulang satu rotasi kecil dengan sumbu acak. Referensinya analitik:
+    # n kali rotasi theta terhadap sumbu a sama dengan satu rotasi n * theta
+    rng = np.random.default_rng(SEED + 1)
+    axes = rng.standard_normal((CHAIN_COUNT, 3))
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+    angles = rng.uniform(*CHAIN_STEP_DEGREES, CHAIN_COUNT)
+    step = RotationConversion.axis_angle_to_quaternion(axes, angles).astype(dtype)
+    return axes, angles, step
+
+def _expected(axes, angles, steps: int) -> np.ndarray:
+    return RotationConversion.axis_angle_to_quaternion(axes, np.mod(angles * steps, 360.0))
+
+def quaternion_chain(length: int, dtype) -> tuple:
+    # q <- q * step tanpa renormalisasi, seperti rotasi kumulatif yang naif
+    axes, angles, step = _chain_steps(dtype)
+    q = np.zeros((CHAIN_COUNT, 4), dtype=dtype)
+    q[:, 0] = 1.0
+    drift = {}
+    for n in range(1, length + 1):
+        q = RotationConversion.quaternion_multiply(q, step)
+        if n in CHAIN_CHECKPOINTS:
+            drift[n] = float(rotation_error(_expected(axes, angles, n), q).max())
+
+    norm_drift = float(np.abs(np.linalg.norm(q.astype(np.float64), axis=1) - 1.0).max())
+    return rotation_error(_expected(axes, angles, length), q), {'drift': drift, 'norm_drift': norm_drift}
+
+def matrix_chain(length: int, dtype) -> tuple:
+    # R <- R @ step, matriks tidak diortogonalkan ulang
+    axes, angles, step = _chain_steps(dtype)
+    step = RotationConversion.quaternion_to_matrix(step)
+    R = np.broadcast_to(np.eye(3, dtype=dtype), (CHAIN_COUNT, 3, 3)).copy()
+    scratch = np.empty_like(R)
+    drift = {}
+    for n in range(1, length + 1):
+        np.matmul(R, step, out=scratch)
+        R, scratch = scratch, R
+        if n in CHAIN_CHECKPOINTS:
+            recovered = RotationConversion.matrix_to_quaternion(R.astype(np.float64))
+            drift[n] = float(rotation_error(_expected(axes, angles, n), recovered).max())
+
+    R = R.astype(np.float64)
+    gram = np.matmul(R.transpose(0, 2, 1), R) - np.eye(3)
+    orthogonality = float(np.linalg.norm(gram, axis=(1, 2)).max())
+    recovered = RotationConversion.matrix_to_quaternion(R)
+    return rotation_error(_expected(axes, angles, length), recovered), {
+        'drift': drift, 'orthogonality_drift': orthogonality
+    }
+
+for _dtype in DTYPES:
+    for _representation in ("matrix", "euler", "tait_bryan", "exp_map", "axis_angle"):
+        SUITE.add(AccuracyBenchmarkCase(
+            f"roundtrip.{_representation}.{_dtype}", roundtrip(_representation), _dtype,
+            ROTATION_COUNTS, FULL_ROTATION_COUNTS, ROUNDTRIP_BUDGETS[_dtype]
+        ))
+    SUITE.add(AccuracyBenchmarkCase(
+        f"chain.quaternion.{_dtype}", quaternion_chain, _dtype,
+        CHAIN_LENGTHS, FULL_CHAIN_LENGTHS, CHAIN_BUDGETS[_dtype]
+    ))
+    SUITE.add(AccuracyBenchmarkCase(
+        f"chain.matrix.{_dtype}", matrix_chain, _dtype,
+        CHAIN_LENGTHS, FULL_CHAIN_LENGTHS, CHAIN_BUDGETS[_dtype]
+    ))
@@ -0,0 +1,168 @@
+import math
+import os
+import time
+
+from src.visualizer.config import MODELS_DIR
+from src.visualizer.core.io.obj_loader import OBJLoader
+from src.visualizer.core.math.vector3 import Vector3
+from src.visualizer.core.math.quaternion import Quaternion
+from src.visualizer.core.math.rotation_conversion import RotationConversion
+from src.visualizer.core.animation.keyframe_animation import KeyframeAnimation
+
+from .harness import BenchmarkCase, BenchmarkResult, BenchmarkSuite, format_seconds
+from .synthetic import synthetic_mesh, quiet
+
+SUITE = BenchmarkSuite(
+    "frames",
+    "per-frame paint time of both renderers replaying a scripted orbit/zoom/rotation path"
+)
+
+# Panjang skrip kamera dan ukuran viewport offscreen
+FRAME_COUNT = 120
+VIEWPORT_SIZE = (1280, 720)
+
+MODELS = ('cube', 'pyramid', 'sphere', 'teapot')
+FRAME_MESH_SIZES = (10_000,)
+FULL_FRAME_MESH_SIZES = (10_000, 100_000)
+
+RENDERERS = ('opengl', 'custom')
+
+_application = None
+
+def application():
+    # QApplication dibuat sekali; tanpa display, jalankan dengan platform offscreen
+    global _application
+    if _application is None:
+        if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PySide6.QtWidgets import QApplication
+        _application = QApplication.instance() or QApplication([])
+    return _application
+
+def camera_script(frame_count: int = FRAME_COUNT) -> list:
+    # Satu putaran orbit penuh, elevasi naik-turun, zoom masuk-keluar dua kali
+    script = []
+    for i in range(frame_count):
+        t = i / max(frame_count - 1, 1)
+        rotation_x = 20.0 + 25.0 * math.sin(2.0 * math.pi * t)
+        rotation_y = 45.0 + 360.0 * t
+        distance = 8.0 + 4.0 * math.sin(4.0 * math.pi * t)
+        script.append((rotation_x, rotation_y, distance))
+    return script
+
+def rotation_script(frame_count: int = FRAME_COUNT) -> tuple:
+    # Pose model mengikuti kurva SQUAD melalui beberapa keyframe
+    keyframes = [
+        Quaternion.IDENTITY,
+        Quaternion.from_axis_angle(Vector3(0, 0, 1), 90.0),
+        Quaternion.from_axis_angle(Vector3(1, 1, 0), 135.0),
+        Quaternion.from_axis_angle(Vector3(0, 1, 0), -60.0)
+    ]
+    duration_ms = 1000.0
+    animation = KeyframeAnimation(keyframes, duration_ms, (frame_count - 1) * 1000.0 / duration_ms)
+    axes, angles = RotationConversion.quaternion_to_axis_angle(animation.quaternions)
+    return animation.matrices[:frame_count], axes[:frame_count], angles[:frame_count]
+
+def load_model(model: str, size: int):
+    if model == 'synthetic':
+        return synthetic_mesh(size)
+    return quiet(lambda: OBJLoader.load_obj(str(MODELS_DIR / f"{model}.obj")))()
+
+def create_view(renderer: str):
+    application()
+    if renderer == 'opengl':
+        from src.visualizer.rendering.opengl.opengl_view import OpenGLView
+        view = OpenGLView()
+    else:
+        from src.visualizer.rendering.custom.custom_renderer import CustomRenderer
+        view = CustomRenderer()
+
+    # Repaint hanya dipicu oleh benchmark, bukan oleh timer internal
+    view.timer.stop()
+    view.resize(*VIEWPORT_SIZE)
+    return view
+
+class FrameResult(BenchmarkResult):
+    def __str__(self):
+        stats = self.stats()
+        lines = [
+            f"{self.key:<48} p50 {format_seconds(stats['median']):>10}  "
+            f"p95 {format_seconds(stats['p95']):>10}  p99 {format_seconds(stats['p99']):>10}"
+        ]
+        for stage, values in self.extra.get('stages', {}).items():
+            lines.append(
+                f"    {stage:<44} p50 {format_seconds(values['p50']):>10}  "
+                f"p95 {format_seconds(values['p95']):>10}  p99 {format_seconds(values['p99']):>10}"
+            )
+        return "\n".join(lines)
+
+class FrameBenchmarkCase(BenchmarkCase):
+    def __init__(self, renderer: str, model: str, sizes=(None,), full_sizes=None, frame_count: int = FRAME_COUNT):
+        super().__init__(f"{renderer}.{model}", None, sizes, full_sizes, repeat=frame_count, metric="p95")
+        self.renderer = renderer
+        self.model = model
+
+    def run(self, size) -> FrameResult:
+        view = create_view(self.renderer)
+        render = self._opengl_frame(view) if self.renderer == 'opengl' else self._custom_frame(view)
+        if render is None:
+            print(f"{self.name}: skipped, OpenGL context is not available on this platform")
+            view.deleteLater()
+            return None
+
+        obj_data = load_model(self.model, size)
+        view.set_obj_data(obj_data)
+        matrices, axes, angles = rotation_script(self.repeat)
+
+        view.frame_stats.enabled = True
+        view.frame_stats.clear()
+
+        samples = []
+        for i, (rotation_x, rotation_y, distance) in enumerate(camera_script(self.repeat)):
+            view.set_camera_state(rotation_x, rotation_y, distance)
+            view.set_rotation_parameters(Vector3(*axes[i].tolist()), float(angles[i]))
+            view.set_model_rotation(obj_data, matrices[i])
+
+            start = time.perf_counter()
+            render()
+            samples.append(time.perf_counter() - start)
+
+        extra = {
+            'renderer': self.renderer,
+            'model': self.model,
+            'vertices': len(obj_data.vertices),
+            'faces': len(obj_data.faces),
+            'stages': view.frame_stats.summary()
+        }
+        view.frame_stats.enabled = False
+        view.deleteLater()
+        return FrameResult(self.name, size, samples, 1, self.metric, self.threshold, self.gate, extra)
+
+    @staticmethod
+    def _custom_frame(view):
+        from PySide6.QtGui import QImage
+        image = QImage(view.size(), QImage.Format.Format_RGB32)
+        return lambda: view.render(image)
+
+    @staticmethod
+    def _opengl_frame(view):
+        import OpenGL.GL as gl
+        app = application()
+        view.show()
+        view.timer.stop()
+        app.processEvents()
+        if not view.isValid() or view.context() is None:
+            return None
+
+        def render():
+            view.repaint()
+            # Tunggu GPU selesai agar waktu frame mencakup eksekusi perintah GL
+            view.makeCurrent()
+            gl.glFinish()
+            view.doneCurrent()
+        return render
+
+for _renderer in RENDERERS:
+    for _model in MODELS:
+        SUITE.add(FrameBenchmarkCase(_renderer, _model))
+    SUITE.add(FrameBenchmarkCase(_renderer, 'synthetic', FRAME_MESH_SIZES, FULL_FRAME_MESH_SIZES))
@@ -0,0 +1,264 @@
+import gc
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.visualizer.rendering.frame_stats import percentile
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+# Batas regresi default: 25% lebih lambat dari baseline dianggap gagal
+DEFAULT_THRESHOLD = 0.25
+# Durasi minimum satu repeat agar timer tidak didominasi noise.
+# Gate default memakai waktu minimum karena paling stabil terhadap gangguan dari proses lain
+MIN_REPEAT_TIME = 0.1
+
+STAT_NAMES = ('min', 'mean', 'median', 'p95', 'p99', 'max')
+
+class BenchmarkResult:
+    def __init__(self, name: str, size: int, samples: list, number: int = 1,
+                 metric: str = "min", threshold: float = None, gate: bool = True, extra: dict = None,
+                 budget: float = None):
+        self.name = name
+        self.size = size
+        self.samples = samples # Detik per panggilan
+        self.number = number
+        self.metric = metric
+        self.threshold = threshold
+        self.gate = gate
+        self.extra = extra or {}
+        self.budget = budget # Batas absolut dalam detik, tidak bergantung baseline
+
+    @property
+    def key(self) -> str:
+        return self.name if self.size is None else f"{self.name}[{self.size}]"
+
+    def stats(self) -> dict:
+        samples = self.samples
+        return {
+            'min': min(samples),
+            'mean': sum(samples) / len(samples),
+            'median': percentile(samples, 50),
+            'p95': percentile(samples, 95),
+            'p99': percentile(samples, 99),
+            'max': max(samples)
+        }
+
+    def value(self) -> float:
+        return self.stats()[self.metric]
+
+    def check_budget(self) -> str:
+        # Kembalikan pesan pelanggaran, atau None jika masih dalam budget
+        if self.budget is not None and self.value() > self.budget:
+            return f"{format_seconds(self.value())} exceeds budget {format_seconds(self.budget)}"
+        return None
+
+    def to_dict(self) -> dict:
+        data = {
+            'name': self.name,
+            'size': self.size,
+            'repeat': len(self.samples),
+            'number': self.number,
+            'metric': self.metric,
+            'gate': self.gate
+        }
+        data.update(self.stats())
+        if self.threshold is not None:
+            data['threshold'] = self.threshold
+        if self.budget is not None:
+            data['budget'] = self.budget
+        if self.extra:
+            data['extra'] = self.extra
+        return data
+
+    def __str__(self):
+        stats = self.stats()
+        return (f"{self.key:<48} median {format_seconds(stats['median']):>10}  "
+                f"p95 {format_seconds(stats['p95']):>10}  min {format_seconds(stats['min']):>10}")
+
+class BenchmarkCase:
+    def __init__(self, name: str, factory, sizes=(None,), full_sizes=None, repeat: int = 7,
+                 metric: str = "min", threshold: float = None, gate: bool = True, budget: float = None):
+        self.name = name
+        self.factory = factory # factory(size) -> callable tanpa argumen
+        self.sizes = tuple(sizes)
+        self.full_sizes = tuple(full_sizes) if full_sizes else self.sizes
+        self.repeat = repeat
+        self.metric = metric
+        self.threshold = threshold
+        self.gate = gate
+        self.budget = budget
+
+    def run(self, size) -> BenchmarkResult:
+        func = self.factory(size)
+        number = calibrate(func)
+        samples = time_callable(func, self.repeat, number)
+        return BenchmarkResult(self.name, size, samples, number, self.metric, self.threshold, self.gate,
+                               budget=self.budget)
+
+class BenchmarkSuite:
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self.cases = []
+
+    def case(self, name: str, sizes=(None,), **options):
+        # Dekorator untuk mendaftarkan factory benchmark
+        def register(factory):
+            self.add(BenchmarkCase(name, factory, sizes, **options))
+            return factory
+        return register
+
+    def add(self, case: BenchmarkCase):
+        self.cases.append(case)
+
+    def find(self, name: str) -> BenchmarkCase:
+        for case in self.cases:
+            if case.name == name:
+                return case
+        raise KeyError(name)
+
+    def rerun(self, result: BenchmarkResult) -> BenchmarkResult:
+        # Ulangi satu kasus dan ambil sampel terbaik dari kedua run
+        retry = self.find(result.name).run(result.size)
+        return retry if retry.value() < result.value() else result
+
+    def run(self, sizes=None, full: bool = False, name_filter: str = None, verbose: bool = True) -> list:
+        results = []
+        for case in self.cases:
+            if name_filter and name_filter not in case.name:
+                continue
+
+            case_sizes = case.full_sizes if full else case.sizes
+            if sizes is not None and case.sizes != (None,):
+                case_sizes = tuple(sizes)
+
+            for size in case_sizes:
+                result = case.run(size)
+                # Kasus boleh mengembalikan None jika tidak bisa dijalankan di lingkungan ini
+                if result is None:
+                    continue
+                results.append(result)
+                if verbose:
+                    print(result, flush=True)
+        return results
+
+def calibrate(func, min_time: float = MIN_REPEAT_TIME) -> int:
+    # Naikkan jumlah panggilan per repeat sampai durasinya cukup panjang
+    number = 1
+    while True:
+        elapsed = sum(time_callable(func, 1, number)) * number
+        if elapsed >= min_time or number >= 1_000_000:
+            return number
+        number *= 10 if elapsed < min_time / 10 else 2
+
+def time_callable(func, repeat: int, number: int = 1) -> list:
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+def _calibration_workload():
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    return total
+
+def calibration_time() -> float:
+    # Beban kerja tetap untuk mengukur kecepatan mesin saat ini,
+    # hasil benchmark dinormalisasi terhadap nilai ini sebelum dibandingkan
+    number = calibrate(_calibration_workload)
+    return min(time_callable(_calibration_workload, 7, number))
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+def environment_info() -> dict:
+    info = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+    numpy = sys.modules.get('numpy')
+    if numpy is not None:
+        info['numpy'] = numpy.__version__
+    return info
+
+def baseline_path(suite_name: str) -> Path:
+    return BASELINES_DIR / f"{suite_name}.json"
+
+def save_baseline(suite_name: str, results: list, path: Path = None, calibration: float = None) -> Path:
+    path = Path(path) if path else baseline_path(suite_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = {
+        'suite': suite_name,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'calibration': calibration,
+        'results': {result.key: result.to_dict() for result in results}
+    }
+    # Run parsial (misalnya dengan --filter) hanya memperbarui kasus yang dijalankan
+    previous = load_baseline(suite_name, path)
+    if previous and previous.get('calibration') and calibration:
+        scale = calibration / previous['calibration']
+        for key, entry in previous.get('results', {}).items():
+            if key not in data['results']:
+                # Hanya waktu yang diskalakan; hasil dengan unit lain (misalnya error) disalin apa adanya
+                factor = scale if 'unit' not in entry else 1.0
+                data['results'][key] = {
+                    name: value * factor if name in STAT_NAMES else value for name, value in entry.items()
+                }
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write('\n')
+    return path
+
+def load_baseline(suite_name: str, path: Path = None) -> dict:
+    path = Path(path) if path else baseline_path(suite_name)
+    if not path.exists():
+        return {}
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def compare_results(results: list, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+                    calibration: float = None) -> list:
+    # Kembalikan list (result, rasio, batas, regresi?) untuk kasus yang ada di baseline
+    scale = 1.0
+    if calibration and baseline.get('calibration'):
+        scale = calibration / baseline['calibration']
+
+    comparisons = []
+    for result in results:
+        reference = baseline.get('results', {}).get(result.key)
+        if not reference:
+            continue
+
+        metric = result.metric
+        reference_value = reference.get(metric)
+        if not reference_value:
+            continue
+
+        limit = result.threshold if result.threshold is not None else threshold
+        ratio = result.value() / (reference_value * scale)
+        comparisons.append((result, ratio, limit, result.gate and ratio > 1.0 + limit))
+    return comparisons
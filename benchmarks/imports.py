@@ -0,0 +1,114 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .harness import BenchmarkCase, BenchmarkResult, BenchmarkSuite
+
+SUITE = BenchmarkSuite(
+    "imports",
+    "cold import and startup time in a fresh interpreter, with budgets for Qt-free core"
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modul GUI yang tidak boleh ikut termuat saat memakai core
+GUI_MODULES = ('PySide6', 'shiboken6', 'OpenGL')
+
+# Budget absolut (detik) untuk import pertama di interpreter baru, di luar startup Python sendiri
+CORE_IMPORT_BUDGET = 0.1
+NUMERIC_IMPORT_BUDGET = 0.3
+
+# Dijalankan di proses anak: ukur import lalu laporkan modul terlarang yang ikut termuat
+_CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+forbidden = {forbidden!r}
+loaded = sorted(name for name in forbidden if name in sys.modules)
+print(json.dumps({{'elapsed': elapsed, 'loaded': loaded, 'modules': len(sys.modules)}}))
+"""
+
+class ImportResult(BenchmarkResult):
+    def check_budget(self) -> str:
+        loaded = self.extra.get('loaded')
+        if loaded:
+            return f"loads forbidden module(s) {', '.join(loaded)}"
+        return super().check_budget()
+
+class ImportBenchmarkCase(BenchmarkCase):
+    def __init__(self, name: str, statement: str, forbidden=(), budget: float = None,
+                 repeat: int = 5, gate: bool = True):
+        super().__init__(name, None, repeat=repeat, metric="min", gate=gate, budget=budget)
+        self.statement = statement
+        self.forbidden = tuple(forbidden)
+
+    def _measure(self) -> dict:
+        script = _CHILD_SCRIPT.format(statement=self.statement, forbidden=self.forbidden)
+        completed = subprocess.run(
+            [sys.executable, "-c", script], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def run(self, size) -> ImportResult:
+        # Run pertama hanya menyiapkan cache bytecode
+        self._measure()
+        reports = [self._measure() for _ in range(self.repeat)]
+        extra = {
+            'statement': self.statement,
+            'loaded': sorted({name for report in reports for name in report['loaded']}),
+            'modules': reports[-1]['modules']
+        }
+        samples = [report['elapsed'] for report in reports]
+        return ImportResult(self.name, size, samples, 1, self.metric, self.threshold, self.gate, extra, self.budget)
+
+class StartupBenchmarkCase(ImportBenchmarkCase):
+    # Waktu dari proses mulai sampai frame pertama aplikasi, memakai --measure-startup
+    def __init__(self, name: str, repeat: int = 3, gate: bool = True):
+        super().__init__(name, "python -m src.visualizer.main --measure-startup", repeat=repeat, gate=gate)
+
+    def _measure(self) -> dict:
+        env = dict(os.environ)
+        if not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+            env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        completed = subprocess.run(
+            [sys.executable, "-m", "src.visualizer.main", "--measure-startup"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True, env=env, timeout=120
+        )
+        phases = json.loads(completed.stdout.strip().splitlines()[-1])
+        return {'elapsed': phases['total'] / 1e3, 'loaded': [], 'modules': None, 'phases': phases}
+
+    def run(self, size) -> ImportResult:
+        self._measure()
+        reports = [self._measure() for _ in range(self.repeat)]
+        best = min(reports, key=lambda report: report['elapsed'])
+        extra = {'statement': self.statement, 'phases_ms': best['phases']}
+        samples = [report['elapsed'] for report in reports]
+        return ImportResult(self.name, size, samples, 1, self.metric, self.threshold, self.gate, extra, self.budget)
+
+SUITE.add(ImportBenchmarkCase(
+    "core.api",
+    "from src.visualizer.core import Vector3, Quaternion, RotationEngine, OBJLoader",
+    forbidden=GUI_MODULES + ('numpy',), budget=CORE_IMPORT_BUDGET
+))
+SUITE.add(ImportBenchmarkCase(
+    "core.numeric",
+    "from src.visualizer.core.math import RotationConversion, RotationOperator, RotationFactory, QuaternionInterpolation\n"
+    "from src.visualizer.core.animation import KeyframeAnimation",
+    forbidden=GUI_MODULES, budget=NUMERIC_IMPORT_BUDGET
+))
+SUITE.add(ImportBenchmarkCase(
+    "diagnostics",
+    "from src.visualizer.diagnostics import tracer, get_logger, profiler",
+    forbidden=GUI_MODULES + ('numpy',), budget=CORE_IMPORT_BUDGET
+))
+# Waktu import aplikasi penuh hanya dicatat, Qt terlalu bervariasi untuk dijadikan gate
+SUITE.add(ImportBenchmarkCase(
+    "app",
+    "from src.visualizer.ui.windows.main_window import MainWindow",
+    repeat=3, gate=False
+))
+SUITE.add(StartupBenchmarkCase("startup.first_frame"))
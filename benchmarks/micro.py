@@ -0,0 +1,139 @@
+import math
+
+import numpy as np
+
+from src.visualizer.core.io.obj_loader import OBJLoader
+from src.visualizer.core.math.vector3 import Vector3
+from src.visualizer.core.math.quaternion import Quaternion
+from src.visualizer.core.math.euler_angle import EulerAngle
+from src.visualizer.core.math.tait_bryan import TaitBryan
+from src.visualizer.core.math.exponential_map import ExponentialMap
+from src.visualizer.core.math.rotation_conversion import RotationConversion
+from src.visualizer.core.math.orientation_average import OrientationAverage
+from src.visualizer.core.math.rotation_factory import RotationFactory, RotationMethod
+from src.visualizer.rendering.custom.matrix4 import Matrix4
+
+from .harness import BenchmarkSuite
+from .synthetic import MESH_SIZES, FULL_MESH_SIZES, synthetic_mesh, synthetic_obj_file, scratch_path, quiet
+
+SUITE = BenchmarkSuite(
+    "micro",
+    "core.math and core.io hot paths; scalar cases time a batch of 1000 operations"
+)
+
+# Jumlah operasi per panggilan untuk kasus skalar
+BATCH = 1000
+
+# Rata-rata orientasi satu juta quaternion harus jauh di bawah satu detik
+AVERAGE_SIZES = (1_000_000,)
+AVERAGE_BUDGET = 0.5
+
+_meshes = {}
+
+def _mesh(size: int):
+    # Mesh sintetis dibuat sekali per ukuran lalu dipakai ulang oleh semua kasus
+    if size not in _meshes:
+        _meshes.clear()
+        _meshes[size] = synthetic_mesh(size)
+    return _meshes[size]
+
+def _sample_vectors(count: int = BATCH) -> list:
+    rng = np.random.default_rng(0)
+    return [Vector3(x, y, z) for x, y, z in rng.standard_normal((count, 3)).tolist()]
+
+def _rotations() -> dict:
+    axis = Vector3(1, 2, 3).normalize()
+    return {
+        'quaternion': Quaternion.from_axis_angle(axis, 37.0),
+        'euler': EulerAngle(30.0, -45.0, 60.0, "ZYX"),
+        'tait_bryan': TaitBryan(10.0, 20.0, 30.0),
+        'exp_map': ExponentialMap(axis * math.radians(37.0))
+    }
+
+@SUITE.case("quaternion.multiply")
+def quaternion_multiply(size):
+    q1 = Quaternion.from_axis_angle(Vector3(0, 0, 1), 30.0)
+    q2 = Quaternion.from_axis_angle(Vector3(1, 0, 0), 45.0)
+    def run():
+        for _ in range(BATCH):
+            q1 * q2
+    return run
+
+@SUITE.case("quaternion.normalize")
+def quaternion_normalize(size):
+    q = Quaternion(1.0, 2.0, 3.0, 4.0)
+    def run():
+        for _ in range(BATCH):
+            q.normalize()
+    return run
+
+@SUITE.case("quaternion.from_axis_angle")
+def quaternion_from_axis_angle(size):
+    axis = Vector3(1, 2, 3)
+    def run():
+        for i in range(BATCH):
+            Quaternion.from_axis_angle(axis, i * 0.1)
+    return run
+
+def _register_representation(name: str):
+    @SUITE.case(f"{name}.to_rotation_matrix")
+    def to_rotation_matrix(size):
+        rotation = _rotations()[name]
+        def run():
+            for _ in range(BATCH):
+                rotation.to_rotation_matrix()
+        return run
+
+    @SUITE.case(f"{name}.rotate_vector")
+    def rotate_vector(size):
+        rotation = _rotations()[name]
+        vectors = _sample_vectors()
+        def run():
+            for vector in vectors:
+                rotation.rotate_vector(vector)
+        return run
+
+for _name in ('quaternion', 'euler', 'tait_bryan', 'exp_map'):
+    _register_representation(_name)
+
+@SUITE.case("matrix4.multiply")
+def matrix4_multiply(size):
+    a = Matrix4.perspective(45.0, 1.5, 0.1, 100.0)
+    b = Matrix4.rotation_y(30.0) * Matrix4.translation(1.0, 2.0, 3.0)
+    def run():
+        for _ in range(BATCH):
+            a * b
+    return run
+
+@SUITE.case("conversion.euler_to_quaternion", sizes=MESH_SIZES, full_sizes=FULL_MESH_SIZES)
+def conversion_euler_to_quaternion(size):
+    angles = np.random.default_rng(0).uniform(-180.0, 180.0, (size, 3))
+    def run():
+        RotationConversion.euler_to_quaternion(angles, "ZYX")
+    return run
+
+@SUITE.case("orientation_average.markley", sizes=AVERAGE_SIZES, repeat=3, budget=AVERAGE_BUDGET)
+def orientation_average_markley(size):
+    quaternions = np.random.default_rng(0).standard_normal((size, 4))
+    def run():
+        OrientationAverage.of(quaternions)
+    return run
+
+@SUITE.case("rotation_factory.rotate_obj_data", sizes=MESH_SIZES, full_sizes=FULL_MESH_SIZES, repeat=3)
+def rotation_factory_rotate_obj_data(size):
+    obj_data = _mesh(size)
+    rotation = _rotations()['quaternion']
+    def run():
+        RotationFactory.rotate_obj_data(obj_data, rotation, RotationMethod.QUATERNION)
+    return run
+
+@SUITE.case("obj_loader.load_obj", sizes=MESH_SIZES, full_sizes=FULL_MESH_SIZES, repeat=3)
+def obj_loader_load_obj(size):
+    path = synthetic_obj_file(size)
+    return quiet(lambda: OBJLoader.load_obj(str(path)))
+
+@SUITE.case("obj_loader.save_obj", sizes=MESH_SIZES, full_sizes=FULL_MESH_SIZES, repeat=3)
+def obj_loader_save_obj(size):
+    obj_data = _mesh(size)
+    path = str(scratch_path(f"saved_{size}.obj"))
+    return quiet(lambda: OBJLoader.save_obj(obj_data, path))
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import math
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from src.visualizer.core.io.obj_loader import OBJData, OBJLoader, Vertex, Face
+
+# Ukuran mesh standar untuk benchmark, 1M dan 5M hanya dijalankan dengan --full
+MESH_SIZES = (1_000, 10_000, 100_000)
+FULL_MESH_SIZES = MESH_SIZES + (1_000_000, 5_000_000)
+
+_CACHE_DIR = Path(tempfile.gettempdir()) / "visualizer-benchmarks"
+
+def sphere_points(vertex_count: int) -> tuple:
+    # Grid lintang-bujur pada bola satuan, jumlah vertex tepat vertex_count
+    cols = max(3, int(math.ceil(math.sqrt(vertex_count))))
+    rows = max(2, int(math.ceil(vertex_count / cols)))
+
+    theta = np.linspace(0.0, math.pi, rows)[:, None]
+    phi = np.linspace(0.0, 2.0 * math.pi, cols, endpoint=False)[None, :]
+    points = np.stack([
+        np.sin(theta) * np.cos(phi),
+        np.cos(theta) * np.ones_like(phi),
+        np.sin(theta) * np.sin(phi)
+    ], axis=-1).reshape(-1, 3)[:vertex_count]
+
+    # Dua segitiga per sel grid, buang yang menunjuk ke luar vertex_count
+    r, c = np.meshgrid(np.arange(rows - 1), np.arange(cols), indexing='ij')
+    a = (r * cols + c).ravel()
+    b = (r * cols + (c + 1) % cols).ravel()
+    d = a + cols
+    e = b + cols
+    faces = np.concatenate([np.stack([a, d, b], axis=1), np.stack([b, d, e], axis=1)])
+    faces = faces[(faces < vertex_count).all(axis=1)]
+    return points, faces
+
+def synthetic_mesh(vertex_count: int) -> OBJData:
+    points, faces = sphere_points(vertex_count)
+
+    obj_data = OBJData()
+    obj_data.filename = f"synthetic_{vertex_count}.obj"
+    obj_data.vertices = [Vertex(x, y, z) for x, y, z in points.tolist()]
+    obj_data.faces = [Face(indices) for indices in faces.tolist()]
+    return obj_data
+
+def synthetic_obj_file(vertex_count: int) -> Path:
+    # File OBJ disimpan di direktori temp dan dipakai ulang antar run
+    path = _CACHE_DIR / f"synthetic_{vertex_count}.obj"
+    if path.exists():
+        return path
+
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    points, faces = sphere_points(vertex_count)
+    temp_path = path.with_suffix('.tmp')
+    with open(temp_path, 'w') as file:
+        file.write(f'# Synthetic sphere, {vertex_count} vertices\n')
+        np.savetxt(file, points, fmt='v %.6f %.6f %.6f')
+        file.write('\n')
+        np.savetxt(file, faces + 1, fmt='f %d %d %d')
+    temp_path.replace(path)
+    return path
+
+def scratch_path(filename: str) -> Path:
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return _CACHE_DIR / filename
+
+def quiet(func):
+    # Redam output console dari kode yang diukur agar output benchmark bersih
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
@@ -1,3 +1,8 @@
-from .main import main
+from .lazy_import import lazy_exports
 
-__all__ = ['main']
\ No newline at end of file
+# main diimport secara lazy agar "import src.visualizer.core" tidak ikut memuat PySide6/OpenGL
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "main": ".main"
+})
+
+__all__ = ['main']
@@ -40,10 +40,71 @@ __all__ = [
     # Pengaturan Animasi
     'ANIMATION_DURATION_MS',
     'SMOOTH_ANIMATION',
+    'ANIMATION_FRAME_RATE',
+    'ORIENTATION_TRAIL_SIZE',
+    'SHOW_ORIENTATION_TRAIL',
+    'TRAIL_MAX_EDGES',
+
+    # Pengaturan Rotasi Kumulatif
+    'CUMULATIVE_ROTATION',
+    'CUMULATIVE_RENORMALIZE_INTERVAL',
+
+    # Pengaturan Riwayat Undo/Redo
+    'ROTATION_HISTORY_SIZE',
+    'UNDO_SHORTCUT',
+    'REDO_SHORTCUT',
+
+    # Pengaturan Perbandingan Metode
+    'COMPARISON_ROUND_INPUTS',
+    'COMPARISON_SLOT_SPACING',
+    'COMPARISON_DEVIATION_RANGE',
+
+    # Pengaturan Sapuan Singularitas
+    'SWEEP_STEP_DEGREES',
+    'SWEEP_CHUNK_SAMPLES',
+    'SWEEP_MAX_SAMPLES',
+    'SWEEP_MIN_STEP_DEGREES',
+    'SWEEP_CONDITION_RANGE',
+    'SWEEP_ERROR_RANGE',
+
+    # Pengaturan Rata-rata Orientasi
+    'ORIENTATION_AVERAGE_CHUNK',
+    'ORIENTATION_CLUSTER_THRESHOLD',
+    'ORIENTATION_CLUSTER_ITERATIONS',
+    'ORIENTATION_CLUSTER_MAX',
+
+    # Pengaturan Playback
+    'PLAYBACK_PREFETCH_S',
+    'ORIENTATION_LOG_CHUNK_ROWS',
+
+    # Pengaturan Feed Live
+    'LIVE_FEED_ADDRESS',
+    'LIVE_FEED_BUFFER_BYTES',
 
     # Pengaturan Kinerja
     'MAX_VERTICES_DISPLAY',
     'ENABLE_WIREFRAME_OPTIMIZATION',
+    'ROTATION_CACHE_SIZE',
+    'ROTATION_WORKER_THREADS',
+    'ROTATION_CHUNK_SIZE',
+    'SHOW_PERFORMANCE_HUD',
+    'PERFORMANCE_HUD_SHORTCUT',
+
+    # Pengaturan Diagnostik
+    'TRACE_BUFFER_SIZE',
+    'TRACE_SHORTCUT',
+    'PROFILE_SHORTCUT',
+    'PROFILE_DURATION_S',
+    'PROFILE_SAMPLE_INTERVAL_MS',
+
+    # Pengaturan Logging
+    'LOG_LEVEL',
+    'LOG_CONSOLE_LEVEL',
+    'LOG_FILE_NAME',
+    'LOG_MAX_BYTES',
+    'LOG_BACKUP_COUNT',
+    'LOG_RATE_LIMIT_BURST',
+    'LOG_RATE_LIMIT_INTERVAL_S',
 
     # Pengaturan Mouse
     'MOUSE_ORBIT_SENSITIVITY',
@@ -73,6 +134,8 @@ __all__ = [
     'MODELS_DIR',
     'ICONS_DIR',
     'APP_ICON',
+    'LOGS_DIR',
+    'CACHE_DIR',
     'VISUALIZER_DIR',
     'CONFIG_DIR',
     'CORE_DIR',
@@ -82,6 +145,7 @@ __all__ = [
     'COMPONENTS_DIR',
     'WIDGETS_DIR',
     'WINDOWS_DIR',
+    'WORKERS_DIR',
     'OPENGL_DIR',
     'CUSTOM_DIR',
 ]
\ No newline at end of file
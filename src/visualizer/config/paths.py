@@ -4,6 +4,8 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
 ASSETS_DIR = PROJECT_ROOT / "assets"
+LOGS_DIR = PROJECT_ROOT / "logs"
+CACHE_DIR = PROJECT_ROOT / ".cache" # Hasil kompilasi yang disimpan antar run
 
 # Subdirektori assets
 MODELS_DIR = ASSETS_DIR / "models"
@@ -26,6 +28,7 @@ STYLES_DIR = UI_DIR / "styles"
 COMPONENTS_DIR = UI_DIR / "components"
 WIDGETS_DIR = UI_DIR / "widgets"
 WINDOWS_DIR = UI_DIR / "windows"
+WORKERS_DIR = UI_DIR / "workers"
 
 # Subdirektori rendering
 OPENGL_DIR = RENDERING_DIR / "opengl"
@@ -61,10 +61,71 @@ VISUALIZATION_COLORS = {
 # Setting animasi
 ANIMATION_DURATION_MS = 300 # Dalam milidetik
 SMOOTH_ANIMATION = True
+ANIMATION_FRAME_RATE = 60 # Jumlah keyframe per detik (mengikuti refresh rate layar)
+ORIENTATION_TRAIL_SIZE = 64 # Jumlah pose bayangan (langkah SLERP atau sampel feed terakhir)
+SHOW_ORIENTATION_TRAIL = False # Tampilkan trail orientasi saat aplikasi dibuka
+TRAIL_MAX_EDGES = 200000 # Batas edge bayangan per frame di custom renderer; pose lama dijarangkan jika lebih
+
+# Setting rotasi kumulatif
+CUMULATIVE_ROTATION = False # Apply Rotation menggabungkan rotasi ke orientasi sebelumnya saat aplikasi dibuka
+CUMULATIVE_RENORMALIZE_INTERVAL = 16 # Quaternion gabungan dinormalisasi ulang setiap sekian langkah
+
+# Setting riwayat undo/redo
+ROTATION_HISTORY_SIZE = 1000 # Jumlah state rotasi yang disimpan (~80 byte per state)
+UNDO_SHORTCUT = "Ctrl+Z"
+REDO_SHORTCUT = "Ctrl+Y"
+
+# Setting perbandingan metode rotasi
+COMPARISON_ROUND_INPUTS = True # Parameter tiap metode dibulatkan ke presisi spinbox-nya sebelum dibandingkan
+COMPARISON_SLOT_SPACING = 3.0 # Jarak antar pose di mode perbandingan (mesh diskalakan agar muat)
+COMPARISON_DEVIATION_RANGE = (1e-9, 1e-1) # Deviasi vertex relatif terhadap radius mesh untuk skala warna (log)
+
+# Setting sapuan singularitas (gimbal lock)
+SWEEP_STEP_DEGREES = 2.0 # Jarak grid sudut; 2 derajat = 180 x 91 x 180 (~2,9 juta) sampel per konvensi
+SWEEP_CHUNK_SAMPLES = 262144 # Sampel per chunk; progress dan pembatalan dicek di antara chunk
+SWEEP_MAX_SAMPLES = 25_000_000 # Batas grid (~200 MB untuk dua peta error float32); langkah 1 derajat ~23,5 juta
+SWEEP_MIN_STEP_DEGREES = 1.0 # Langkah terkecil di jendela sapuan, sesuai SWEEP_MAX_SAMPLES
+SWEEP_CONDITION_RANGE = (1.0, 1e4) # Skala warna (log) peta kondisi Jacobian
+SWEEP_ERROR_RANGE = (1e-12, 1e2) # Skala warna (log) peta error round-trip dalam derajat
+
+# Setting rata-rata dan klaster orientasi
+ORIENTATION_AVERAGE_CHUNK = 262144 # Quaternion per chunk; memori sementara tetap walau datanya jutaan
+ORIENTATION_CLUSTER_THRESHOLD = 10.0 # Jarak geodesik (derajat) dari pusat saat klaster baru dibuat
+ORIENTATION_CLUSTER_ITERATIONS = 10 # Iterasi penugasan ulang + rata-rata Markley per klaster
+ORIENTATION_CLUSTER_MAX = 64 # Batas jumlah klaster
+
+# Setting playback log orientasi
+PLAYBACK_PREFETCH_S = 2.0 # Detik pose yang dikonversi di depan posisi playback (ring buffer)
+ORIENTATION_LOG_CHUNK_ROWS = 100000 # Baris CSV per chunk saat dikonversi ke cache .npy
+
+# Setting feed orientasi live
+LIVE_FEED_ADDRESS = "udp://127.0.0.1:9870" # Alamat default (udp://, tcp://, atau unix://)
+LIVE_FEED_BUFFER_BYTES = 65536 # Ukuran buffer baca socket; satu pesan tidak boleh lebih besar
 
 # Setting performa
 MAX_VERTICES_DISPLAY = 10000 # Limit vertices yang ditampilkan
 ENABLE_WIREFRAME_OPTIMIZATION = True
+ROTATION_CACHE_SIZE = 128 # Jumlah entri maksimum cache rotasi (LRU)
+ROTATION_WORKER_THREADS = 2 # Thread worker untuk rotasi mesh di background
+ROTATION_CHUNK_SIZE = 65536 # Vertex per chunk; progress dan pembatalan dicek di antara chunk
+SHOW_PERFORMANCE_HUD = False # Tampilkan overlay statistik frame saat aplikasi dibuka
+PERFORMANCE_HUD_SHORTCUT = "F3" # Tombol untuk menampilkan/menyembunyikan overlay
+
+# Setting diagnostik
+TRACE_BUFFER_SIZE = 200000 # Jumlah span maksimum di ring buffer tracing
+TRACE_SHORTCUT = "Ctrl+Shift+T" # Mulai/berhenti rekam trace dan simpan ke direktori logs
+PROFILE_SHORTCUT = "Ctrl+Shift+P" # Mulai/berhenti profiling (cProfile + sampler stack)
+PROFILE_DURATION_S = 10 # Lama profiling otomatis dalam detik
+PROFILE_SAMPLE_INTERVAL_MS = 2 # Interval sampling stack untuk file collapsed
+
+# Setting logging
+LOG_LEVEL = "INFO" # Level minimum yang ditulis ke file log
+LOG_CONSOLE_LEVEL = "WARNING" # Level minimum yang ditampilkan di console
+LOG_FILE_NAME = "visualizer.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024 # Ukuran file log sebelum dirotasi
+LOG_BACKUP_COUNT = 3
+LOG_RATE_LIMIT_BURST = 5 # Jumlah pesan identik yang diteruskan per interval
+LOG_RATE_LIMIT_INTERVAL_S = 10.0
 
 # Setting mouse
 MOUSE_ORBIT_SENSITIVITY = 0.5 
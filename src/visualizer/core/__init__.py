@@ -1,5 +1,16 @@
-from .math import Vector3, Quaternion, RotationEngine
-from .io import OBJLoader, OBJData, Vertex, Face
+from ..lazy_import import lazy_exports
+
+# Core tidak boleh bergantung pada Qt/OpenGL; submodule dimuat saat dipakai
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Vector3": ".math",
+    "Quaternion": ".math",
+    "RotationEngine": ".math",
+
+    "OBJLoader": ".io",
+    "OBJData": ".io",
+    "Vertex": ".io",
+    "Face": ".io"
+})
 
 __all__ = [
     "Vector3",
@@ -10,4 +21,4 @@ __all__ = [
     "OBJData",
     "Vertex",
     "Face"
-]
\ No newline at end of file
+]
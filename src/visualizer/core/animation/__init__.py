@@ -0,0 +1,15 @@
+from ...lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "KeyframeAnimation": ".keyframe_animation",
+    "OrientationPlayback": ".orientation_playback",
+    "PoseRingBuffer": ".orientation_playback",
+    "OrientationTrail": ".orientation_trail"
+})
+
+__all__ = [
+    "KeyframeAnimation",
+    "OrientationPlayback",
+    "PoseRingBuffer",
+    "OrientationTrail"
+]
@@ -0,0 +1,57 @@
+import math
+import numpy as np
+
+from ..math.quaternion import Quaternion
+from ..math.rotation_conversion import RotationConversion
+from ..math.quaternion_interpolation import QuaternionInterpolation
+from ...config.settings import ANIMATION_DURATION_MS, ANIMATION_FRAME_RATE
+
+class KeyframeAnimation:
+    def __init__(self, keyframes, duration_ms: float = ANIMATION_DURATION_MS,
+                 frame_rate: float = ANIMATION_FRAME_RATE, ease: bool = True):
+        if duration_ms <= 0:
+            raise ValueError("Durasi animasi harus lebih dari nol.")
+        if frame_rate <= 0:
+            raise ValueError("Frame rate animasi harus lebih dari nol.")
+
+        self.duration_ms = float(duration_ms)
+        self.frame_rate = float(frame_rate)
+
+        # Keyframe boleh berupa list Quaternion atau array (K, 4)
+        if len(keyframes) and isinstance(keyframes[0], Quaternion):
+            keyframes = [[q.w, q.x, q.y, q.z] for q in keyframes]
+        keyframes = RotationConversion.normalize_quaternion(np.asarray(keyframes, dtype=np.float64))
+        if keyframes.ndim != 2 or len(keyframes) < 1:
+            raise ValueError("Animasi membutuhkan minimal satu keyframe.")
+
+        # Buffer pose dihitung sekali di awal, per frame hanya indeks yang dibaca
+        frame_count = max(2, int(math.ceil(self.duration_ms / 1000.0 * self.frame_rate)) + 1)
+        self.quaternions = QuaternionInterpolation.sample_path(keyframes, frame_count, ease=ease)
+        self.matrices = RotationConversion.quaternion_to_matrix(self.quaternions)
+
+    @classmethod
+    def between(cls, start: Quaternion, end: Quaternion, duration_ms: float = ANIMATION_DURATION_MS,
+                frame_rate: float = ANIMATION_FRAME_RATE, ease: bool = True) -> 'KeyframeAnimation':
+        return cls([start, end], duration_ms, frame_rate, ease)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.quaternions)
+
+    def frame_index(self, elapsed_ms: float) -> int:
+        progress = min(max(elapsed_ms / self.duration_ms, 0.0), 1.0)
+        return int(round(progress * (self.frame_count - 1)))
+
+    def is_finished(self, elapsed_ms: float) -> bool:
+        return elapsed_ms >= self.duration_ms
+
+    def matrix_at(self, elapsed_ms: float) -> np.ndarray:
+        return self.matrices[self.frame_index(elapsed_ms)]
+
+    def quaternion_at(self, elapsed_ms: float) -> Quaternion:
+        w, x, y, z = (float(c) for c in self.quaternions[self.frame_index(elapsed_ms)])
+        return Quaternion(w, x, y, z)
+
+    def final_quaternion(self) -> Quaternion:
+        w, x, y, z = (float(c) for c in self.quaternions[-1])
+        return Quaternion(w, x, y, z)
@@ -0,0 +1,114 @@
+import numpy as np
+
+from ..io.orientation_log import OrientationLog
+from ..math.quaternion import Quaternion
+from ..math.rotation_conversion import RotationConversion
+from ...config.settings import ANIMATION_FRAME_RATE, PLAYBACK_PREFETCH_S
+
+class PoseRingBuffer:
+    # Pose frame display (quaternion dan matriks) untuk rentang frame [first, end).
+    # Frame ke-f disimpan di slot f % capacity, frame lama tertimpa saat buffer diisi maju.
+
+    def __init__(self, capacity: int):
+        self.capacity = max(2, int(capacity))
+        self.quaternions = np.zeros((self.capacity, 4), dtype=np.float64)
+        self.matrices = np.zeros((self.capacity, 3, 3), dtype=np.float64)
+        self.first = 0
+        self.end = 0
+
+    def __contains__(self, frame: int) -> bool:
+        return self.first <= frame < self.end
+
+    def clear(self, frame: int = 0):
+        self.first = self.end = frame
+
+    def extend(self, quaternions: np.ndarray):
+        # quaternions untuk frame end, end + 1, ... (maksimal satu kapasitas)
+        quaternions = quaternions[-self.capacity:]
+        slots = (self.end + np.arange(len(quaternions))) % self.capacity
+        self.quaternions[slots] = quaternions
+        self.matrices[slots] = RotationConversion.quaternion_to_matrix(quaternions)
+        self.end += len(quaternions)
+        self.first = max(self.first, self.end - self.capacity)
+
+class OrientationPlayback:
+    # Memutar OrientationLog pada frame rate display. Log didesimasi ke satu sampel per frame
+    # dan dikonversi per blok ke ring buffer, jadi tiap frame hanya membaca satu slot.
+
+    def __init__(self, log: OrientationLog, frame_rate: float = ANIMATION_FRAME_RATE,
+                 prefetch_s: float = PLAYBACK_PREFETCH_S):
+        if frame_rate <= 0:
+            raise ValueError("Frame rate playback harus lebih dari nol.")
+
+        self.log = log
+        self.frame_rate = float(frame_rate)
+        self.buffer = PoseRingBuffer(int(prefetch_s * self.frame_rate))
+
+        self.position = 0.0 # detik sejak awal log
+        self.speed = 1.0
+        self.loop = False
+        self.playing = False
+
+    @property
+    def duration(self) -> float:
+        return self.log.duration
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.duration * self.frame_rate) + 1
+
+    @property
+    def finished(self) -> bool:
+        return not self.loop and self.position >= self.duration
+
+    def play(self):
+        if self.finished:
+            self.position = 0.0
+        self.playing = True
+
+    def pause(self):
+        self.playing = False
+
+    def toggle(self):
+        self.pause() if self.playing else self.play()
+
+    def seek(self, position_s: float):
+        self.position = min(max(float(position_s), 0.0), self.duration)
+
+    def advance(self, elapsed_s: float) -> bool:
+        # Dipanggil tiap tick timer UI dengan waktu dinding sejak tick sebelumnya
+        if not self.playing:
+            return False
+
+        position = self.position + elapsed_s * self.speed
+        if position >= self.duration:
+            if self.loop and self.duration > 0:
+                position %= self.duration
+            else:
+                position = self.duration
+                self.playing = False
+        self.position = position
+        return True
+
+    def frame_at(self, position_s: float) -> int:
+        return min(int(position_s * self.frame_rate), self.frame_count - 1)
+
+    def _slot(self, frame: int) -> int:
+        buffer = self.buffer
+        if frame not in buffer:
+            # Seek di luar jendela: buang isi buffer dan mulai mengisi dari frame ini
+            buffer.clear(frame)
+
+        # Isi ulang setengah kapasitas sekaligus saat sisa frame di depan tinggal separuh
+        while buffer.end < self.frame_count and buffer.end - frame < buffer.capacity // 2:
+            count = min(buffer.capacity // 2, self.frame_count - buffer.end)
+            indices = self.log.decimate(buffer.end / self.frame_rate, count, self.frame_rate)
+            buffer.extend(self.log.quaternions(indices))
+        return frame % buffer.capacity
+
+    def matrix(self) -> np.ndarray:
+        return self.buffer.matrices[self._slot(self.frame_at(self.position))]
+
+    def quaternion(self) -> Quaternion:
+        w, x, y, z = (float(c) for c in self.buffer.quaternions[self._slot(self.frame_at(self.position))])
+        return Quaternion(w, x, y, z)
@@ -0,0 +1,45 @@
+import numpy as np
+
+from ..math.quaternion import Quaternion
+from ..math.rotation_conversion import RotationConversion
+from ..math.quaternion_interpolation import QuaternionInterpolation
+from ...config.settings import ORIENTATION_TRAIL_SIZE
+
+class OrientationTrail:
+    # Pose-pose terakhir sebagai matriks rotasi (N, 3, 3) untuk digambar sebagai "bayangan".
+    # Hanya matriks yang disimpan; renderer menggambar satu mesh sebanyak N kali.
+
+    def __init__(self, capacity: int = ORIENTATION_TRAIL_SIZE):
+        self.capacity = max(1, int(capacity))
+        self._matrices = np.zeros((self.capacity, 3, 3), dtype=np.float64)
+        self._count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._count = 0
+        self._next = 0
+
+    def append(self, rotation_matrix):
+        # Pose terbaru menimpa yang paling lama jika buffer penuh
+        self._matrices[self._next] = np.asarray(rotation_matrix, dtype=np.float64).reshape(3, 3)
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def set_path(self, start: Quaternion, end: Quaternion, steps: int = None):
+        # Isi dengan langkah SLERP dari start ke end (termasuk kedua ujung)
+        steps = min(self.capacity, steps or self.capacity)
+        keyframes = np.array([[start.w, start.x, start.y, start.z], [end.w, end.x, end.y, end.z]], dtype=np.float64)
+        path = QuaternionInterpolation.sample_path(keyframes, max(2, steps), ease=False)
+        count = len(path)
+        self._matrices[:count] = RotationConversion.quaternion_to_matrix(path)
+        self._count = count
+        self._next = count % self.capacity
+
+    def matrices(self) -> np.ndarray:
+        # Urut dari pose terlama ke terbaru
+        if self._count < self.capacity:
+            return self._matrices[:self._count].copy()
+        return np.concatenate((self._matrices[self._next:], self._matrices[:self._next]))
@@ -1,8 +1,21 @@
-from .obj_loader import OBJLoader, OBJData, Vertex, Face
+from ...lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OBJLoader": ".obj_loader",
+    "OBJData": ".obj_loader",
+    "Vertex": ".obj_loader",
+    "Face": ".obj_loader",
+    "OrientationLog": ".orientation_log",
+    "OrientationFeed": ".orientation_feed",
+    "OrientationPublisher": ".orientation_feed"
+})
 
 __all__ = [
     "OBJLoader",
     "OBJData",
     "Vertex",
-    "Face"
-]
\ No newline at end of file
+    "Face",
+    "OrientationLog",
+    "OrientationFeed",
+    "OrientationPublisher"
+]
@@ -1,8 +1,18 @@
 from typing import List
 import os
 
+from ...diagnostics.tracing import traced
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
+
+# Jumlah contoh baris tidak valid yang dicatat satu per satu (level DEBUG)
+_INVALID_LINE_EXAMPLES = 5
+
 # Kelas untuk vertex
 class Vertex:
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -16,6 +26,8 @@ class Vertex:
 
 # Kelas untuk face
 class Face:
+    __slots__ = ('vertex_indices',)
+
     def __init__(self, vertex_indices: List[int]):
         self.vertex_indices = vertex_indices # Dari index 0
 
@@ -35,6 +47,7 @@ class OBJData:
 # Kelas untuk loader file OBJ
 class OBJLoader:
     @staticmethod
+    @traced("OBJLoader.load_obj", "io")
     def load_obj(file_path: str) -> OBJData:
         obj_data = OBJData()
         obj_data.filename = os.path.basename(file_path)
@@ -42,6 +55,12 @@ class OBJLoader:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f" File {file_path} tidak ditemukan.")
 
+        # Baris tidak valid hanya dihitung; ringkasannya dicatat sekali setelah file selesai dibaca
+        invalid_vertex_lines = 0
+        invalid_face_lines = 0
+        first_invalid_vertex = None
+        first_invalid_face = None
+
         try:
             with open(file_path, 'r') as file:
                 line_number = 0
@@ -59,23 +78,25 @@ class OBJLoader:
 
                     # Parse untuk vartices
                     if parts[0] == 'v':
-                        if len(parts) < 4:
-                            print(f"Warning: Baris {line_number} tidak valid untuk vertex: {line}")
-                            continue
                         try:
+                            if len(parts) < 4:
+                                raise ValueError
                             x = float(parts[1])
                             y = float(parts[2])
                             z = float(parts[3])
                             obj_data.vertices.append(Vertex(x, y, z))
                         except ValueError:
-                            print(f"Warning: Baris {line_number} tidak valid untuk vertex: {line}")
+                            invalid_vertex_lines += 1
+                            if first_invalid_vertex is None:
+                                first_invalid_vertex = line_number
+                            if invalid_vertex_lines <= _INVALID_LINE_EXAMPLES:
+                                logger.debug("Baris %d tidak valid untuk vertex: %s", line_number, line)
                     
                     # Parse untuk faces
                     elif parts[0] == 'f':
-                        if len(parts) < 4:
-                            print(f"Warning: Baris {line_number} tidak valid untuk face: {line}")
-                            continue
                         try:
+                            if len(parts) < 4:
+                                raise ValueError
                             face_indices = []
                             for i in range(1, len(parts)):
                                 # Handle untuk tiap format yang berbeda : "1", "1/1", "1/1/1", "1//1"
@@ -90,16 +111,26 @@ class OBJLoader:
                             
                             obj_data.faces.append(Face(face_indices))
                         except (ValueError, IndexError):
-                            print(f"Warning: Baris {line_number} tidak valid untuk face: {line}")
+                            invalid_face_lines += 1
+                            if first_invalid_face is None:
+                                first_invalid_face = line_number
+                            if invalid_face_lines <= _INVALID_LINE_EXAMPLES:
+                                logger.debug("Baris %d tidak valid untuk face: %s", line_number, line)
                     
         except Exception as e:
             raise Exception(f"Error saat membaca file {file_path}: {e}")
+
+        if invalid_vertex_lines:
+            logger.warning("%s: %s baris vertex tidak valid (pertama di baris %d)",
+                           obj_data.filename, f"{invalid_vertex_lines:,}", first_invalid_vertex)
+        if invalid_face_lines:
+            logger.warning("%s: %s baris face tidak valid (pertama di baris %d)",
+                           obj_data.filename, f"{invalid_face_lines:,}", first_invalid_face)
         
         # Validasi data yang dimuat
         OBJLoader._validate_obj_data(obj_data)
 
-        print(f"File {file_path} berhasil dimuat.")
-        print(obj_data.get_attributes())
+        logger.info("File %s berhasil dimuat. %s", file_path, obj_data.get_attributes())
         return obj_data
 
     @staticmethod
@@ -107,15 +138,25 @@ class OBJLoader:
         return OBJLoader.load_obj(file_path)
 
     @staticmethod
+    @traced("OBJLoader.validate", "io")
     def _validate_obj_data(obj_data: OBJData):
         max_vertex_index = len(obj_data.vertices) - 1 # dari index 0
 
+        invalid_count = 0
+        first_invalid = None
         for i, face in enumerate(obj_data.faces):
             for vertex_index in face.vertex_indices:
                 if vertex_index > max_vertex_index:
-                    print(f"Warning: Face {i} mengandung index vertex tidak valid: {vertex_index + 1}")
+                    invalid_count += 1
+                    if first_invalid is None:
+                        first_invalid = (i, vertex_index + 1)
+
+        if invalid_count:
+            logger.warning("%s: %s index vertex tidak valid pada face (pertama: face %d, index %d)",
+                           obj_data.filename, f"{invalid_count:,}", first_invalid[0], first_invalid[1])
     
     @staticmethod
+    @traced("OBJLoader.save_obj", "io")
     def save_obj(obj_data: OBJData, file_path: str):
         try:
             with open(file_path, 'w') as file:
@@ -132,6 +173,6 @@ class OBJLoader:
                     face_str = ' '.join(str(index + 1) for index in face.vertex_indices)
                     file.write(f'f {face_str}\n')
 
-            print(f"File {file_path} berhasil disimpan.")
+            logger.info("File %s berhasil disimpan.", file_path)
         except Exception as e:
             raise Exception(f"Error saat menyimpan file {file_path}: {e}")
\ No newline at end of file
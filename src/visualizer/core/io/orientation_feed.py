@@ -0,0 +1,385 @@
+import json
+import os
+import select
+import socket
+import threading
+import time
+
+from ..math.quaternion import Quaternion
+from ..math.vector3 import Vector3
+from ..math.rotation_factory import RotationFactory, RotationMethod
+from ...config.settings import LIVE_FEED_BUFFER_BYTES
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
+
+FEED_SCHEMES = ("udp", "tcp", "unix")
+
+# Nama metode di pesan: nilai RotationMethod atau singkatan
+_METHOD_ALIASES = {
+    "q": RotationMethod.QUATERNION,
+    "quaternion": RotationMethod.QUATERNION,
+    "e": RotationMethod.EULER_ANGLE,
+    "euler": RotationMethod.EULER_ANGLE,
+    "euler angle": RotationMethod.EULER_ANGLE,
+    "tb": RotationMethod.TAIT_BRYAN,
+    "tait_bryan": RotationMethod.TAIT_BRYAN,
+    "tait-bryan": RotationMethod.TAIT_BRYAN,
+    "exp": RotationMethod.EXPONENTIAL_MAP,
+    "exp_map": RotationMethod.EXPONENTIAL_MAP,
+    "exponential map": RotationMethod.EXPONENTIAL_MAP,
+}
+
+# Bentuk field JSON yang diterima per metode, dan field opsional di luar bentuk tersebut
+_JSON_FIELDS = {
+    RotationMethod.QUATERNION: ((("w", "x", "y", "z"), ("axis", "angle")), ()),
+    RotationMethod.EULER_ANGLE: ((("x_angle", "y_angle", "z_angle"),), ("order",)),
+    RotationMethod.TAIT_BRYAN: ((("roll", "pitch", "yaw"),), ()),
+    RotationMethod.EXPONENTIAL_MAP: ((("omega",), ("omega_x", "omega_y", "omega_z")), ()),
+}
+
+# Field metadata yang boleh ada di pesan JSON mana pun dan diabaikan
+_JSON_METADATA = ("method", "timestamp", "time", "t", "seq")
+
+# Selang waktu maksimum thread penerima menunggu sebelum mengecek permintaan berhenti
+_POLL_INTERVAL_S = 0.2
+
+def parse_address(address: str) -> tuple:
+    # "udp://host:port", "tcp://host:port", atau "unix:///path/ke/socket"
+    scheme, separator, target = address.partition("://")
+    scheme = scheme.lower()
+    if not separator or scheme not in FEED_SCHEMES:
+        raise ValueError(f"Alamat feed tidak valid: {address}, gunakan {', '.join(s + '://' for s in FEED_SCHEMES)}")
+
+    if scheme == "unix":
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("UNIX socket tidak didukung di platform ini.")
+        return scheme, target
+
+    host, _, port = target.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Alamat feed harus berisi host dan port: {address}")
+    return scheme, (host, int(port))
+
+def _method_from_name(name: str) -> RotationMethod:
+    method = _METHOD_ALIASES.get(str(name).strip().lower())
+    if method is None:
+        raise ValueError(f"Metode rotasi tidak dikenal: {name}")
+    return method
+
+def _unit_quaternion(values) -> Quaternion:
+    quaternion = Quaternion(*(float(value) for value in values))
+    if quaternion.magnitude() == 0:
+        raise ValueError("Quaternion nol tidak merepresentasikan rotasi.")
+    return quaternion.normalize()
+
+def parse_orientation_message(message) -> tuple:
+    # Mengembalikan (objek rotasi, RotationMethod). Pesan berupa JSON, misalnya
+    # {"method": "euler", "x_angle": 10, "y_angle": 0, "z_angle": 45, "order": "ZYX"},
+    # atau teks ringkas "q w x y z", "e ZYX x y z", "tb roll pitch yaw", "exp wx wy wz"
+    if isinstance(message, bytes):
+        message = message.decode("utf-8")
+    message = message.strip()
+
+    if message.startswith("{"):
+        return _parse_json_message(json.loads(message))
+
+    tokens = message.replace(",", " ").split()
+    if not tokens:
+        raise ValueError("Pesan orientasi kosong.")
+
+    method = _method_from_name(tokens[0])
+    order = "XYZ"
+    values = tokens[1:]
+    if method == RotationMethod.EULER_ANGLE and values and values[0].isalpha():
+        order, values = values[0], values[1:]
+    values = [float(value) for value in values]
+
+    expected = 4 if method == RotationMethod.QUATERNION else 3
+    if len(values) != expected:
+        raise ValueError(f"{method.value} membutuhkan {expected} nilai, diterima {len(values)}.")
+
+    if method == RotationMethod.QUATERNION:
+        return _unit_quaternion(values), method
+    if method == RotationMethod.EULER_ANGLE:
+        x_angle, y_angle, z_angle = values
+        return RotationFactory.create_rotation(method, x_angle=x_angle, y_angle=y_angle, z_angle=z_angle, order=order.upper()), method
+    if method == RotationMethod.TAIT_BRYAN:
+        roll, pitch, yaw = values
+        return RotationFactory.create_rotation(method, roll=roll, pitch=pitch, yaw=yaw), method
+    return RotationFactory.create_rotation(method, omega=Vector3(*values)), method
+
+def _json_form(data: dict, method: RotationMethod) -> tuple:
+    # Field yang tidak dikenal atau kurang ditolak agar salah ketik tidak tampil sebagai identitas
+    forms, optional = _JSON_FIELDS[method]
+    keys = set(data) - set(_JSON_METADATA)
+    for form in forms:
+        if set(form) <= keys and keys <= set(form) | set(optional):
+            return form
+
+    expected = " atau ".join("{" + ", ".join(form) + "}" for form in forms)
+    if optional:
+        expected += f" (opsional: {', '.join(optional)})"
+    raise ValueError(f"Field {method.value} tidak valid: {sorted(keys)}, harus {expected}")
+
+def _parse_json_message(data: dict) -> tuple:
+    if not isinstance(data, dict):
+        raise ValueError("Pesan JSON harus berupa object.")
+    method = _method_from_name(data.get("method", "quaternion"))
+    form = _json_form(data, method)
+    values = {key: data[key] for key in form}
+
+    if method == RotationMethod.QUATERNION:
+        # Komponen langsung, atau axis-angle seperti RotationFactory.create_rotation
+        if "axis" in values:
+            axis = Vector3(*(float(c) for c in values["axis"]))
+            return RotationFactory.create_rotation(method, axis=axis, angle=float(values["angle"])), method
+        return _unit_quaternion([values[key] for key in form]), method
+
+    if method == RotationMethod.EXPONENTIAL_MAP:
+        omega = values["omega"] if "omega" in values else [values[key] for key in form]
+        omega = [float(c) for c in omega]
+        if len(omega) != 3:
+            raise ValueError(f"omega membutuhkan 3 nilai, diterima {len(omega)}.")
+        return RotationFactory.create_rotation(method, omega=Vector3(*omega)), method
+
+    kwargs = {key: float(value) for key, value in values.items()}
+    if method == RotationMethod.EULER_ANGLE:
+        kwargs["order"] = str(data.get("order", "XYZ")).upper()
+    return RotationFactory.create_rotation(method, **kwargs), method
+
+class OrientationFeed:
+    # Menerima pose dari socket lokal di thread terpisah. Hanya pesan terbaru yang disimpan:
+    # burst ribuan pesan per detik digabung sehingga pembaca (satu kali per frame) selalu
+    # mendapat pose paling baru tanpa antrean yang tumbuh.
+
+    def __init__(self, address: str, buffer_size: int = LIVE_FEED_BUFFER_BYTES):
+        self.address = address
+        self.scheme, self.target = parse_address(address)
+        self.buffer_size = buffer_size
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._socket = None
+
+        self._latest = None
+        self._sequence = 0
+        self._taken = 0
+        self.received = 0
+        self.delivered = 0
+        self.errors = 0
+        self.last_error = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        # Socket dibuka di thread pemanggil agar error bind langsung terlihat
+        self._socket = self._open_socket()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="OrientationFeed", daemon=True)
+        self._thread.start()
+        logger.info("Listening for orientations on %s", self.address)
+
+    def stop(self, timeout_s: float = 1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self.scheme == "unix" and os.path.exists(self.target):
+            os.unlink(self.target)
+
+    def _open_socket(self) -> socket.socket:
+        if self.scheme == "udp":
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        elif self.scheme == "tcp":
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            if os.path.exists(self.target):
+                os.unlink(self.target)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            sock.bind(self.target)
+            if self.scheme != "udp":
+                sock.listen(1)
+        except OSError:
+            sock.close()
+            raise
+        sock.setblocking(False)
+        return sock
+
+    def _publish(self, message: bytes, count: int):
+        with self._lock:
+            self._latest = message
+            self._sequence += 1
+            self.received += count
+
+    def _run(self):
+        try:
+            if self.scheme == "udp":
+                self._receive_datagrams(self._socket)
+            else:
+                self._accept_streams(self._socket)
+        except OSError as e:
+            if not self._stop.is_set():
+                self.last_error = str(e)
+                logger.error("Orientation feed %s stopped: %s", self.address, e)
+
+    def _receive_datagrams(self, sock: socket.socket):
+        # Satu pose per datagram; kosongkan buffer socket dan simpan yang terakhir saja
+        while not self._stop.is_set():
+            readable, _, _ = select.select([sock], [], [], _POLL_INTERVAL_S)
+            if not readable:
+                continue
+
+            latest, count = None, 0
+            while True:
+                try:
+                    latest = sock.recv(self.buffer_size)
+                    count += 1
+                except BlockingIOError:
+                    break
+            if count:
+                self._publish(latest, count)
+
+    def _accept_streams(self, server: socket.socket):
+        # Satu klien dalam satu waktu; klien berikutnya diterima setelah yang lama terputus
+        while not self._stop.is_set():
+            readable, _, _ = select.select([server], [], [], _POLL_INTERVAL_S)
+            if not readable:
+                continue
+            try:
+                connection, _ = server.accept()
+            except BlockingIOError:
+                continue
+            with connection:
+                connection.setblocking(False)
+                self._receive_lines(connection)
+
+    def _receive_lines(self, connection: socket.socket):
+        # Satu pose per baris; hanya baris lengkap terakhir dari tiap pembacaan yang dipakai
+        pending = b""
+        while not self._stop.is_set():
+            readable, _, _ = select.select([connection], [], [], _POLL_INTERVAL_S)
+            if not readable:
+                continue
+
+            chunks = []
+            closed = False
+            while True:
+                try:
+                    chunk = connection.recv(self.buffer_size)
+                except BlockingIOError:
+                    break
+                except ConnectionError:
+                    closed = True
+                    break
+                if not chunk:
+                    closed = True
+                    break
+                chunks.append(chunk)
+
+            data = pending + b"".join(chunks)
+            complete, _, pending = data.rpartition(b"\n")
+            if len(pending) > self.buffer_size:
+                # Baris tanpa newline yang terlalu panjang bukan pose yang valid
+                pending = b""
+            if complete:
+                lines = [line for line in complete.split(b"\n") if line.strip()]
+                if lines:
+                    self._publish(lines[-1], len(lines))
+            if closed:
+                return
+
+    def take_latest(self):
+        # (objek rotasi, RotationMethod) untuk pesan terbaru yang belum diambil, atau None.
+        # Parsing dilakukan di sini sehingga pesan yang tergabung tidak pernah diparse.
+        with self._lock:
+            if self._sequence == self._taken:
+                return None
+            self._taken = self._sequence
+            message = self._latest
+
+        try:
+            rotation = parse_orientation_message(message)
+        except (ValueError, TypeError, KeyError, UnicodeDecodeError) as e:
+            self.errors += 1
+            self.last_error = str(e)
+            logger.warning("Invalid orientation message from %s: %s", self.address, e)
+            return None
+        self.delivered += 1
+        return rotation
+
+    def stats(self) -> dict:
+        with self._lock:
+            received = self.received
+        return {
+            'received': received,
+            'delivered': self.delivered,
+            'coalesced': max(0, received - self.delivered - self.errors),
+            'errors': self.errors
+        }
+
+class OrientationPublisher:
+    # Pengirim uji untuk OrientationFeed: memutar pose sintetis dengan laju tetap
+
+    def __init__(self, address: str):
+        self.address = address
+        self.scheme, self.target = parse_address(address)
+        if self.scheme == "udp":
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.connect(self.target)
+        else:
+            family = socket.AF_UNIX if self.scheme == "unix" else socket.AF_INET
+            self._socket = socket.socket(family, socket.SOCK_STREAM)
+            self._socket.connect(self.target)
+
+    def send(self, message: str):
+        data = message.encode("utf-8")
+        if self.scheme == "udp":
+            self._socket.send(data)
+        else:
+            self._socket.sendall(data + b"\n")
+
+    def close(self):
+        self._socket.close()
+
+    @staticmethod
+    def message_at(t: float, method: str = "quaternion", speed_deg: float = 90.0) -> str:
+        # Pose sintetis: rotasi kontinu terhadap sumbu yang perlahan berputar
+        angle = speed_deg * t
+        if method == "quaternion":
+            axis = Vector3(0.3, 1.0, 0.2)
+            q = Quaternion.from_axis_angle(axis, angle)
+            return f"q {q.w:.6f} {q.x:.6f} {q.y:.6f} {q.z:.6f}"
+        if method == "euler":
+            return f"e ZYX {angle % 360:.4f} {30.0 * (t % 2.0):.4f} {0.5 * angle % 360:.4f}"
+        if method == "tait_bryan":
+            return f"tb {angle % 360:.4f} {20.0:.4f} {0.25 * angle % 360:.4f}"
+        if method == "exp_map":
+            radians = (angle % 360) * 3.141592653589793 / 180.0
+            return f"exp 0 {radians:.6f} 0"
+        raise ValueError(f"Metode publisher tidak valid: {method}")
+
+    def run(self, rate_hz: float, duration_s: float = None, method: str = "quaternion") -> int:
+        # Kirim dengan jadwal absolut agar laju rata-rata tetap walau sleep tidak presisi
+        interval = 1.0 / rate_hz
+        start = time.perf_counter()
+        sent = 0
+        while duration_s is None or time.perf_counter() - start < duration_s:
+            target = start + sent * interval
+            delay = target - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.send(self.message_at(time.perf_counter() - start, method))
+            sent += 1
+        return sent
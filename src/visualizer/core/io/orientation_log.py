@@ -0,0 +1,253 @@
+import bisect
+import glob
+import hashlib
+import itertools
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from ..math.rotation_conversion import RotationConversion
+from ...config.paths import CACHE_DIR
+from ...config.settings import ORIENTATION_LOG_CHUNK_ROWS
+from ...diagnostics.log import get_logger
+from ...diagnostics.tracing import tracer
+
+logger = get_logger(__name__)
+
+# Hasil konversi CSV disimpan sebagai .npy agar bisa di-memory-map pada pembukaan berikutnya
+LOG_CACHE_DIR = CACHE_DIR / "orientation_logs"
+
+# Jumlah kolom sampel (di luar timestamp) untuk setiap representasi
+SAMPLE_WIDTHS = {"quaternion": 4, "euler": 3, "tait_bryan": 3, "exp_map": 3}
+
+# Nama kolom header yang dikenali, dalam urutan yang diharapkan RotationConversion
+_COLUMN_SETS = (
+    ("quaternion", ("qw", "qx", "qy", "qz")),
+    ("quaternion", ("w", "x", "y", "z")),
+    ("euler", ("x_angle", "y_angle", "z_angle")),
+    ("tait_bryan", ("roll", "pitch", "yaw")),
+    ("exp_map", ("omega_x", "omega_y", "omega_z")),
+    ("exp_map", ("rx", "ry", "rz")),
+)
+
+# Satuan timestamp dari akhiran nama kolom pertama (t_ms, timestamp_ns, ...)
+_TIME_UNITS = {"_s": 1.0, "_ms": 1e-3, "_us": 1e-6, "_ns": 1e-9}
+
+def _time_scale(name: str) -> float:
+    for suffix, scale in _TIME_UNITS.items():
+        if name.endswith(suffix):
+            return scale
+    return 1.0
+
+def _is_header(names) -> bool:
+    # Baris pertama adalah header jika ada field yang bukan angka; cek huruf saja salah
+    # membaca 1e-17, nan, atau inf sebagai nama kolom
+    for name in names:
+        if not name:
+            continue
+        try:
+            float(name)
+        except ValueError:
+            return True
+    return False
+
+def _match_columns(names, method: str = None) -> tuple:
+    # Mengembalikan (method, indeks kolom) sesuai urutan kanonik, kolom boleh diacak
+    lookup = {name.strip().lower(): index for index, name in enumerate(names)}
+    for candidate, columns in _COLUMN_SETS:
+        if method and candidate != method:
+            continue
+        if all(column in lookup for column in columns):
+            return candidate, tuple(lookup[column] for column in columns)
+    raise ValueError(f"Kolom log tidak dikenali: {', '.join(names)}")
+
+class OrientationLog:
+    # Log orientasi bertimestamp yang dibaca langsung dari memmap, tanpa objek Python per sampel.
+    # data berbentuk (N, 1 + lebar) dengan kolom pertama timestamp; columns memilih kolom sampel.
+
+    def __init__(self, data: np.ndarray, method: str, columns=None, order: str = "XYZ",
+                 time_scale: float = 1.0, path: Path = None):
+        if method not in SAMPLE_WIDTHS:
+            raise ValueError(f"Representasi log tidak valid: {method}, harus salah satu dari {tuple(SAMPLE_WIDTHS)}")
+        if data.ndim != 2 or len(data) < 1:
+            raise ValueError("Log orientasi harus berisi minimal satu sampel.")
+
+        width = SAMPLE_WIDTHS[method]
+        self.columns = tuple(columns) if columns else tuple(range(1, width + 1))
+        if len(self.columns) != width or max(self.columns) >= data.shape[1]:
+            raise ValueError(f"Log {method} membutuhkan {width} kolom sampel, ditemukan {data.shape[1] - 1}.")
+
+        self.data = data
+        self.method = method
+        self.order = order.upper()
+        self.time_scale = float(time_scale)
+        self.path = Path(path) if path else None
+
+        # Hanya sampel pertama dan terakhir yang dibaca saat membuka log
+        self.start_time = float(data[0, 0]) * self.time_scale
+        self.end_time = float(data[-1, 0]) * self.time_scale
+
+    @classmethod
+    def open(cls, path, method: str = None, order: str = "XYZ") -> 'OrientationLog':
+        # .csv/.txt dikonversi sekali ke cache .npy, .npy di-memmap langsung,
+        # file lain dianggap float64 mentah dengan kolom (t, sampel...)
+        path = Path(path)
+        suffix = path.suffix.lower()
+
+        with tracer.span("OrientationLog.open", "io", path=path.name):
+            if suffix in (".csv", ".txt"):
+                return cls._open_csv(path, method, order)
+            if suffix == ".npy":
+                data = np.load(path, mmap_mode="r")
+                if data.ndim != 2:
+                    raise ValueError(f"Array log harus 2 dimensi, ditemukan {data.shape}")
+                return cls(data, method or cls._method_for_width(data.shape[1] - 1), order=order, path=path)
+
+            method = method or "quaternion"
+            columns = 1 + SAMPLE_WIDTHS.get(method, 0)
+            data = np.memmap(path, dtype="<f8", mode="r")
+            if len(data) % columns:
+                raise ValueError(f"Ukuran file {path.name} bukan kelipatan {columns} kolom float64.")
+            return cls(data.reshape(-1, columns), method, order=order, path=path)
+
+    @staticmethod
+    def _method_for_width(width: int) -> str:
+        # Tanpa header hanya quaternion yang bisa ditebak dari jumlah kolom
+        if width == SAMPLE_WIDTHS["quaternion"]:
+            return "quaternion"
+        raise ValueError("Representasi log dengan 3 kolom sampel harus dipilih secara eksplisit.")
+
+    @classmethod
+    def _open_csv(cls, path: Path, method: str, order: str) -> 'OrientationLog':
+        with open(path, "r", encoding="utf-8") as f:
+            header = f.readline()
+
+        names = [name.strip() for name in header.split(",")]
+        has_header = _is_header(names)
+        if has_header:
+            method, columns = _match_columns(names[1:], method)
+            columns = tuple(index + 1 for index in columns)
+            time_scale = _time_scale(names[0].lower())
+        else:
+            method = method or cls._method_for_width(len(names) - 1)
+            columns = None
+            time_scale = 1.0
+
+        data = np.load(cls.convert_csv(path, skip_header=has_header), mmap_mode="r")
+        return cls(data, method, columns, order, time_scale, path)
+
+    @staticmethod
+    def _source_key(path: Path) -> str:
+        return hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:8]
+
+    @staticmethod
+    def cache_path(path: Path) -> Path:
+        # {stem}-{file sumber}-{versi}: versi berubah jika file diedit, file sumber tidak
+        stat = path.stat()
+        version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:8]
+        return LOG_CACHE_DIR / f"{path.stem}-{OrientationLog._source_key(path)}-{version}.npy"
+
+    @staticmethod
+    def remove_stale_caches(path: Path, keep: Path = None):
+        # Cache versi lama dari file sumber yang sama; tanpa ini setiap edit log berjam-jam
+        # meninggalkan satu .npy seukuran log di direktori cache
+        for stale in LOG_CACHE_DIR.glob(f"{glob.escape(path.stem)}-{OrientationLog._source_key(path)}-*.npy"):
+            if stale == keep:
+                continue
+            try:
+                stale.unlink()
+            except OSError as e:
+                # Di Windows cache yang masih di-memmap tidak bisa dihapus; dicoba lagi pada konversi berikutnya
+                logger.debug("Could not remove stale log cache %s: %s", stale.name, e)
+
+    @staticmethod
+    def convert_csv(path: Path, skip_header: bool = True, chunk_rows: int = ORIENTATION_LOG_CHUNK_ROWS) -> Path:
+        # Baris CSV diparse per chunk dan ditulis sebagai float64 mentah; header .npy ditulis
+        # setelah jumlah baris diketahui, sehingga log berjam-jam tidak pernah dimuat utuh ke memori
+        target = OrientationLog.cache_path(path)
+        if target.exists():
+            return target
+
+        with tracer.span("OrientationLog.convert_csv", "io", path=path.name):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            raw_path = target.with_suffix(".raw")
+            partial = target.with_suffix(".partial")
+            rows, columns = 0, None
+
+            try:
+                with open(path, "r", encoding="utf-8") as source, open(raw_path, "wb") as raw:
+                    if skip_header:
+                        source.readline()
+                    while True:
+                        block = list(itertools.islice(source, chunk_rows))
+                        if not block:
+                            break
+                        lines = [line for line in block if line.strip()]
+                        if not lines:
+                            continue
+                        chunk = np.loadtxt(lines, delimiter=",", dtype="<f8", ndmin=2)
+                        if columns is not None and chunk.shape[1] != columns:
+                            raise ValueError(f"Jumlah kolom CSV tidak konsisten setelah baris {rows}.")
+                        columns = chunk.shape[1]
+                        raw.write(chunk.tobytes())
+                        rows += len(chunk)
+
+                if not rows:
+                    raise ValueError(f"Log {path.name} tidak berisi sampel.")
+
+                with open(raw_path, "rb") as raw, open(partial, "wb") as output:
+                    np.lib.format.write_array_header_1_0(
+                        output, {'descr': '<f8', 'fortran_order': False, 'shape': (rows, columns)}
+                    )
+                    shutil.copyfileobj(raw, output, 1 << 20)
+                os.replace(partial, target)
+                OrientationLog.remove_stale_caches(path, keep=target)
+            finally:
+                for leftover in (raw_path, partial):
+                    if leftover.exists():
+                        leftover.unlink()
+            return target
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end_time - self.start_time)
+
+    @property
+    def sample_rate(self) -> float:
+        return (len(self) - 1) / self.duration if self.duration > 0 else 0.0
+
+    def index_at(self, time_s) -> np.ndarray:
+        # Sampel terakhir yang timestamp-nya <= waktu (detik sejak awal log). Kolom timestamp
+        # memmap tidak kontigu, jadi rentangnya dipersempit dengan bisect sebelum searchsorted
+        raw = np.asarray(time_s, dtype=np.float64) / self.time_scale + self.data[0, 0]
+        flat = raw.reshape(-1)
+        timestamps = self.data[:, 0]
+
+        lo = max(bisect.bisect_right(timestamps, flat.min()) - 1, 0)
+        hi = bisect.bisect_right(timestamps, flat.max(), lo)
+        window = np.ascontiguousarray(timestamps[lo:hi + 1])
+        index = lo + np.searchsorted(window, flat, side="right") - 1
+        return np.clip(index, 0, len(self) - 1).reshape(raw.shape)
+
+    def decimate(self, start_s: float, count: int, rate: float) -> np.ndarray:
+        # Indeks sampel untuk count frame display mulai start_s, satu sampel per frame
+        times = start_s + np.arange(count, dtype=np.float64) / rate
+        return self.index_at(times)
+
+    def samples(self, indices) -> np.ndarray:
+        indices = np.asarray(indices)
+        return np.asarray(self.data[indices][:, self.columns], dtype=np.float64)
+
+    def quaternions(self, indices) -> np.ndarray:
+        return self.rows_to_quaternions(self.data[np.asarray(indices)])
+
+    def rows_to_quaternions(self, rows) -> np.ndarray:
+        # Baris mentah (n, 1 + lebar) dari data ke quaternion (n, 4); dipakai sebagai convert
+        # per chunk oleh OrientationAverage/OrientationClusters agar memmap tidak dibaca sekaligus
+        samples = np.asarray(rows[:, self.columns], dtype=np.float64)
+        return RotationConversion.to_quaternion_array(samples, self.method, self.order)
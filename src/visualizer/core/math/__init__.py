@@ -1,10 +1,32 @@
-from .vector3 import Vector3
-from .quaternion import Quaternion
-from .euler_angle import EulerAngle
-from .tait_bryan import TaitBryan
-from .exponential_map import ExponentialMap
-from .rotation_engine import RotationEngine
-from .rotation_factory import RotationFactory, RotationMethod
+from ...lazy_import import lazy_exports
+
+# Modul berbasis numpy (conversion, operator, interpolation) hanya dimuat bila diakses
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Vector3": ".vector3",
+    "Quaternion": ".quaternion",
+    "EulerAngle": ".euler_angle",
+    "TaitBryan": ".tait_bryan",
+    "ExponentialMap": ".exponential_map",
+    "RotationEngine": ".rotation_engine",
+    "RotationFactory": ".rotation_factory",
+    "RotationMethod": ".rotation_factory",
+    "RotationConversion": ".rotation_conversion",
+    "RotationOperator": ".rotation_operator",
+    "RotationCache": ".rotation_cache",
+    "QuaternionInterpolation": ".quaternion_interpolation",
+    "RotationJob": ".rotation_job",
+    "RotationCancelled": ".rotation_job",
+    "MethodComparison": ".method_comparison",
+    "CumulativeRotation": ".cumulative_rotation",
+    "RotationHistory": ".rotation_history",
+    "RotationState": ".rotation_history",
+    "SO3": ".so3",
+    "OrientationAverage": ".orientation_average",
+    "OrientationClusters": ".orientation_average",
+    "OrientationStatisticsJob": ".orientation_average",
+    "SingularitySweep": ".singularity_sweep",
+    "SweepResult": ".singularity_sweep"
+})
 
 __all__ = [
     "Vector3",
@@ -14,5 +36,21 @@ __all__ = [
     "ExponentialMap",
     "RotationEngine",
     "RotationFactory",
-    "RotationMethod"
-]
\ No newline at end of file
+    "RotationMethod",
+    "RotationConversion",
+    "RotationOperator",
+    "RotationCache",
+    "QuaternionInterpolation",
+    "RotationJob",
+    "RotationCancelled",
+    "MethodComparison",
+    "CumulativeRotation",
+    "RotationHistory",
+    "RotationState",
+    "SO3",
+    "OrientationAverage",
+    "OrientationClusters",
+    "OrientationStatisticsJob",
+    "SingularitySweep",
+    "SweepResult"
+]
@@ -0,0 +1,31 @@
+from .quaternion import Quaternion
+from ...config.settings import CUMULATIVE_RENORMALIZE_INTERVAL
+
+class CumulativeRotation:
+    # Orientasi gabungan dari rotasi-rotasi yang diterapkan berturut-turut, disimpan sebagai satu
+    # quaternion. Vertex tidak pernah diputar ulang: mesh selalu diturunkan dari data asli
+    # dengan satu transformasi, jadi tiap langkah O(1) dan error tidak menumpuk di geometri
+
+    def __init__(self, renormalize_interval: int = CUMULATIVE_RENORMALIZE_INTERVAL):
+        self.renormalize_interval = max(1, int(renormalize_interval))
+        self.orientation = Quaternion.IDENTITY
+        self.steps = 0
+
+    def __len__(self) -> int:
+        return self.steps
+
+    def reset(self, orientation: Quaternion = None):
+        self.orientation = (orientation or Quaternion.IDENTITY).normalize()
+        self.steps = 0
+
+    def compose(self, rotation: Quaternion) -> Quaternion:
+        # Rotasi baru diterapkan setelah orientasi yang ada (frame dunia): q = q_baru * q_lama
+        orientation = rotation * self.orientation
+        self.steps += 1
+
+        # Perkalian quaternion satuan hanya menggeser norma sekitar satu ulp per langkah,
+        # jadi renormalisasi berkala sudah cukup
+        if self.steps % self.renormalize_interval == 0:
+            orientation = orientation.normalize()
+        self.orientation = orientation
+        return orientation
@@ -4,6 +4,8 @@ from .vector3 import Vector3
 from .quaternion import Quaternion
 
 class EulerAngle:
+    __slots__ = ('x_angle', 'y_angle', 'z_angle', 'order', '_operator', '_operator_params')
+
     ROTATION_ORDERS = ["XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"]
 
     def __init__(self, x_angle: float = 0.0, y_angle: float = 0.0, z_angle: float = 0.0, order: str = "XYZ"):
@@ -11,6 +13,8 @@ class EulerAngle:
         self.y_angle = y_angle
         self.z_angle = z_angle
         self.order = order.upper()
+        self._operator = None
+        self._operator_params = None
 
         if order not in self.ROTATION_ORDERS:
             raise ValueError(f"Urutan rotasi tidak valid, harus salah satu dari {self.ROTATION_ORDERS}")
@@ -69,20 +73,22 @@ class EulerAngle:
                     result[i][j] += A[i][k] * B[k][j]
         return result
 
-    def _apply_matrix(self, matrix: list, vector: Vector3) -> Vector3:
-        # Terapkan matriks rotasi ke vektor
-        x = matrix[0][0] * vector.x + matrix[0][1] * vector.y + matrix[0][2] * vector.z
-        y = matrix[1][0] * vector.x + matrix[1][1] * vector.y + matrix[1][2] * vector.z
-        z = matrix[2][0] * vector.x + matrix[2][1] * vector.y + matrix[2][2] * vector.z
-        return Vector3(x, y, z)
-
     def rotate_vector(self, vector: Vector3) -> Vector3:
         # Rotasi vektor dengan Euler Angle
         if vector.magnitude() == 0:
             return Vector3(0, 0, 0)
         
-        rotation_matrix = self.to_rotation_matrix()
-        return self._apply_matrix(rotation_matrix, vector)
+        return self.operator().rotate_vector(vector)
+
+    def operator(self) -> 'RotationOperator':
+        # RotationOperator dari cache RotationFactory; disimpan di objek selama parameternya
+        # tidak berubah sehingga rotate_vector berulang tidak mencari kunci cache setiap kali
+        params = (self.x_angle, self.y_angle, self.z_angle, self.order)
+        if self._operator is None or self._operator_params != params:
+            from .rotation_factory import RotationFactory
+            self._operator = RotationFactory.get_operator(self)
+            self._operator_params = params
+        return self._operator
 
     def get_rotation_axes(self) -> list:
         # Mengambil sumbu rotasi berdasarkan urutan Euler Angle
@@ -90,19 +96,19 @@ class EulerAngle:
 
         for char in self.order:
             if char == 'X':
-                axes.append((Vector3(1, 0, 0), self.x_angle))
+                axes.append((Vector3.UNIT_X, self.x_angle))
             elif char == 'Y':
-                axes.append((Vector3(0, 1, 0), self.y_angle))
+                axes.append((Vector3.UNIT_Y, self.y_angle))
             elif char == 'Z':
-                axes.append((Vector3(0, 0, 1), self.z_angle))
+                axes.append((Vector3.UNIT_Z, self.z_angle))
         
         return axes
     
     def to_quaternion(self) -> Quaternion:
         # Konversi tiap rotasi ke quaternion dan kalikan
-        qx = Quaternion.from_axis_angle(Vector3(1, 0, 0), self.x_angle)
-        qy = Quaternion.from_axis_angle(Vector3(0, 1, 0), self.y_angle)  
-        qz = Quaternion.from_axis_angle(Vector3(0, 0, 1), self.z_angle)
+        qx = Quaternion.from_axis_angle(Vector3.UNIT_X, self.x_angle)
+        qy = Quaternion.from_axis_angle(Vector3.UNIT_Y, self.y_angle)  
+        qz = Quaternion.from_axis_angle(Vector3.UNIT_Z, self.z_angle)
 
         # terapkan urutan rotasi
         if self.order == "XYZ":
@@ -118,4 +124,9 @@ class EulerAngle:
         elif self.order == "ZYX":
             return qx * qy * qz
         
-        return qx * qy * qz  # Default to XYZ
\ No newline at end of file
+        return qx * qy * qz  # Default to XYZ
+
+    @classmethod
+    def from_quaternion(cls, quaternion: Quaternion, order: str = "XYZ") -> 'EulerAngle':
+        from .rotation_conversion import RotationConversion
+        return RotationConversion.from_quaternion(quaternion, "euler", order.upper())
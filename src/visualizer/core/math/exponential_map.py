@@ -3,8 +3,12 @@ from .vector3 import Vector3
 from .quaternion import Quaternion
 
 class ExponentialMap:
+    __slots__ = ('omega', '_operator', '_operator_params')
+
     def __init__(self, omega: Vector3):
         self.omega = omega
+        self._operator = None
+        self._operator_params = None
     
     def __str__(self):
         angle_deg = math.degrees(self.omega.magnitude())
@@ -25,6 +29,11 @@ class ExponentialMap:
 
         return cls(omega)
     
+    @classmethod
+    def from_quaternion(cls, quaternion: Quaternion) -> 'ExponentialMap':
+        from .rotation_conversion import RotationConversion
+        return RotationConversion.from_quaternion(quaternion, "exp_map")
+
     def get_axis_angle(self) -> tuple:
         angle_rad = self.omega.magnitude()
         angle_deg = math.degrees(angle_rad)
@@ -90,18 +99,19 @@ class ExponentialMap:
         
         return result
     
-    def _apply_matrix(self, matrix: list, vector: Vector3) -> Vector3:
-        x = matrix[0][0] * vector.x + matrix[0][1] * vector.y + matrix[0][2] * vector.z
-        y = matrix[1][0] * vector.x + matrix[1][1] * vector.y + matrix[1][2] * vector.z
-        z = matrix[2][0] * vector.x + matrix[2][1] * vector.y + matrix[2][2] * vector.z
-        return Vector3(x, y, z)
-    
     def rotate_vector(self, vector: Vector3) -> Vector3:
         if vector.magnitude() == 0:
             return Vector3(0, 0, 0)
 
-        rotation_matrix = self.to_rotation_matrix()
-        return self._apply_matrix(rotation_matrix, vector)
+        return self.operator().rotate_vector(vector)
+
+    def operator(self) -> 'RotationOperator':
+        params = (self.omega.x, self.omega.y, self.omega.z)
+        if self._operator is None or self._operator_params != params:
+            from .rotation_factory import RotationFactory
+            self._operator = RotationFactory.get_operator(self)
+            self._operator_params = params
+        return self._operator
     
     def to_quaternion(self) -> Quaternion:
         axis, angle_deg = self.get_axis_angle()
@@ -110,6 +120,30 @@ class ExponentialMap:
     def get_logarithmic_coordinates(self) -> Vector3:
         return self.omega
     
+    def compose(self, other: 'ExponentialMap') -> 'ExponentialMap':
+        # log(exp(self) exp(other)), rotasi other diterapkan lebih dulu; versi batch ada di SO3
+        from .so3 import SO3
+        omega = SO3.compose(self.to_array(), other.to_array())
+        return ExponentialMap(Vector3(*(float(v) for v in omega)))
+
+    def left_jacobian(self):
+        from .so3 import SO3
+        return SO3.left_jacobian(self.to_array())
+
+    def right_jacobian(self):
+        from .so3 import SO3
+        return SO3.right_jacobian(self.to_array())
+
+    def to_array(self):
+        import numpy as np
+        return np.array([self.omega.x, self.omega.y, self.omega.z], dtype=np.float64)
+
+    @staticmethod
+    def stack(maps):
+        # Daftar ExponentialMap menjadi array (N, 3) untuk operasi batch SO3
+        import numpy as np
+        return np.array([[m.omega.x, m.omega.y, m.omega.z] for m in maps], dtype=np.float64).reshape(-1, 3)
+
     def get_so3_matrix(self) -> list:
         return [
             [0, -self.omega.z, self.omega.y],
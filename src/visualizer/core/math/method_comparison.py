@@ -0,0 +1,79 @@
+import numpy as np
+
+from .vector3 import Vector3
+from .quaternion import Quaternion
+from .rotation_conversion import RotationConversion
+from .rotation_factory import RotationFactory, RotationMethod
+
+# Jumlah desimal yang bisa dimasukkan lewat panel kontrol tiap metode (sama dengan spinbox)
+INPUT_DECIMALS = {
+    RotationMethod.EULER_ANGLE: 1,
+    RotationMethod.TAIT_BRYAN: 1,
+    RotationMethod.EXPONENTIAL_MAP: 2
+}
+
+class MethodComparison:
+    # Satu rotasi referensi dievaluasi lewat keempat RotationMethod sebagai satu batch (4, 3, 3).
+    # Quaternion menjadi acuan; mesh dipakai bersama, tidak pernah disalin per metode.
+    METHODS = (
+        RotationMethod.QUATERNION,
+        RotationMethod.EULER_ANGLE,
+        RotationMethod.TAIT_BRYAN,
+        RotationMethod.EXPONENTIAL_MAP
+    )
+
+    def __init__(self, reference: Quaternion, euler_order: str = "XYZ", round_inputs: bool = True):
+        self.reference = reference
+        self.euler_order = euler_order
+        self.round_inputs = round_inputs
+        self.rotations = [self._equivalent_rotation(method) for method in self.METHODS]
+
+        # Setiap metode memakai jalur matriksnya sendiri, bukan hasil konversi dari referensi
+        self.matrices = np.array([
+            RotationFactory.get_rotation_matrix(rotation_obj, method)
+            for rotation_obj, method in zip(self.rotations, self.METHODS)
+        ], dtype=np.float64)
+
+    def _equivalent_rotation(self, method: RotationMethod):
+        if method == RotationMethod.QUATERNION:
+            return self.reference
+
+        q = [self.reference.w, self.reference.x, self.reference.y, self.reference.z]
+        if method == RotationMethod.EULER_ANGLE:
+            values = RotationConversion.quaternion_to_euler(q, self.euler_order)
+        elif method == RotationMethod.TAIT_BRYAN:
+            values = RotationConversion.quaternion_to_tait_bryan(q)
+        else:
+            values = RotationConversion.quaternion_to_exp_map(q)
+
+        # Nilai yang benar-benar bisa diketik pengguna, bukan hasil konversi presisi penuh
+        if self.round_inputs:
+            values = np.round(values, INPUT_DECIMALS[method])
+        a, b, c = (float(v) for v in values)
+
+        if method == RotationMethod.EULER_ANGLE:
+            return RotationFactory.create_rotation(method, x_angle=a, y_angle=b, z_angle=c, order=self.euler_order)
+        elif method == RotationMethod.TAIT_BRYAN:
+            return RotationFactory.create_rotation(method, roll=a, pitch=b, yaw=c)
+        return RotationFactory.create_rotation(method, omega=Vector3(a, b, c))
+
+    def angular_deviation(self) -> np.ndarray:
+        # Sudut geodesik (derajat) tiap metode terhadap quaternion: |R_m - R_q|_F = 2*sqrt(2)*sin(theta/2).
+        # Bentuk arcsin tetap akurat untuk selisih yang sangat kecil, tidak seperti acos dari trace
+        delta = np.linalg.norm(self.matrices - self.matrices[0], axis=(1, 2))
+        return np.degrees(2.0 * np.arcsin(np.clip(delta / (2.0 * np.sqrt(2.0)), 0.0, 1.0)))
+
+    def vertex_deviation(self, vertices) -> np.ndarray:
+        # Jarak |R_m v - R_q v| untuk semua metode dan vertex sekaligus: (4, V)
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        delta = self.matrices - self.matrices[0]
+        return np.linalg.norm(np.einsum('mij,vj->mvi', delta, vertices), axis=-1)
+
+    def summary(self, deviation: np.ndarray) -> str:
+        info = f"Method comparison (reference {self.reference}):\n"
+        for method, rotation_obj, angle, per_vertex in zip(self.METHODS, self.rotations, self.angular_deviation(), deviation):
+            max_deviation = float(per_vertex.max()) if per_vertex.size else 0.0
+            mean_deviation = float(per_vertex.mean()) if per_vertex.size else 0.0
+            info += f"  {method.value}: {rotation_obj}\n"
+            info += f"    angle {angle:.2e}°, vertex max {max_deviation:.2e}, mean {mean_deviation:.2e}\n"
+        return info
@@ -0,0 +1,305 @@
+import time
+import itertools
+import threading
+
+import numpy as np
+
+from .quaternion import Quaternion
+from .rotation_conversion import RotationConversion
+from .rotation_job import RotationCancelled
+from ...config.settings import (
+    ORIENTATION_AVERAGE_CHUNK, ORIENTATION_CLUSTER_THRESHOLD,
+    ORIENTATION_CLUSTER_ITERATIONS, ORIENTATION_CLUSTER_MAX
+)
+from ...diagnostics.tracing import tracer
+
+# Pasangan (i, j) segitiga atas matriks 4x4 untuk akumulasi q q^T per klaster dengan bincount
+_UPPER = tuple((i, j) for i in range(4) for j in range(i, 4))
+
+def _as_quaternions(values, convert=None) -> np.ndarray:
+    # Quaternion tunggal, daftar Quaternion, atau array (..., 4) menjadi array (N, 4).
+    # Array (termasuk memmap) tidak disalin di sini; konversi dan normalisasi dilakukan per chunk.
+    # Dengan convert, values adalah array baris mentah (N, ...) yang dikonversi convert per chunk
+    if convert is not None:
+        if not isinstance(values, np.ndarray) or values.ndim != 2:
+            raise ValueError("Data dengan convert harus berupa array 2 dimensi.")
+        return values
+    if isinstance(values, Quaternion):
+        values = [values]
+    if isinstance(values, (list, tuple)) and values and isinstance(values[0], Quaternion):
+        values = [[q.w, q.x, q.y, q.z] for q in values]
+    array = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=np.float64)
+    if array.shape[-1:] != (4,):
+        raise ValueError(f"Bentuk array tidak valid: {array.shape}, dimensi akhir harus (4,)")
+    return array.reshape(-1, 4)
+
+def _chunks(quats: np.ndarray, chunk_size: int, convert=None, on_chunk=None):
+    # Satu pass atas data, chunk demi chunk; on_chunk() dipanggil sebelum tiap chunk
+    # (misalnya untuk progress atau pembatalan job)
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, len(quats), chunk_size):
+        if on_chunk:
+            on_chunk()
+        rows = quats[start:start + chunk_size]
+        chunk = convert(rows) if convert else np.asarray(rows, dtype=np.float64)
+        yield start, RotationConversion.normalize_quaternion(chunk)
+
+def _principal_quaternion(M: np.ndarray) -> tuple:
+    # Vektor eigen dengan nilai eigen terbesar dari M = sum w q q^T (bisa batch (K, 4, 4))
+    values, vectors = np.linalg.eigh(M)
+    return RotationConversion.canonicalize_quaternion(vectors[..., :, -1]), values[..., -1]
+
+class OrientationAverage:
+    # Rata-rata orientasi metode Markley: vektor eigen terbesar dari M = sum w_i q_i q_i^T.
+    # q q^T sama untuk q dan -q, jadi tidak perlu menyamakan hemisfer. Hanya matriks 4x4
+    # yang disimpan, sehingga add bisa dipanggil berulang untuk data yang datang per chunk
+
+    def __init__(self, chunk_size: int = ORIENTATION_AVERAGE_CHUNK):
+        self.chunk_size = max(1, int(chunk_size))
+        self.reset()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def reset(self):
+        self.M = np.zeros((4, 4), dtype=np.float64)
+        self.weight_sum = 0.0
+        self.count = 0
+
+    def add(self, values, weights=None, convert=None, on_chunk=None) -> 'OrientationAverage':
+        quats = _as_quaternions(values, convert)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+            if len(weights) != len(quats):
+                raise ValueError("Jumlah bobot harus sama dengan jumlah quaternion.")
+
+        for start, q in _chunks(quats, self.chunk_size, convert, on_chunk):
+            if weights is None:
+                self.M += q.T @ q
+                self.weight_sum += len(q)
+            else:
+                w = weights[start:start + len(q)]
+                self.M += (q * w[:, None]).T @ q
+                self.weight_sum += float(w.sum())
+        self.count += len(quats)
+        return self
+
+    def mean(self) -> np.ndarray:
+        if self.count == 0 or self.weight_sum <= 0:
+            raise ValueError("Tidak ada quaternion untuk dirata-rata.")
+        return _principal_quaternion(self.M)[0]
+
+    def mean_quaternion(self) -> Quaternion:
+        w, x, y, z = (float(c) for c in self.mean())
+        return Quaternion(w, x, y, z)
+
+    @property
+    def concentration(self) -> float:
+        # lambda_max / sum w di [0.25, 1]: 1 jika semua orientasi sama, 0.25 jika tersebar merata
+        if self.weight_sum <= 0:
+            return 0.0
+        return float(np.linalg.eigvalsh(self.M)[-1] / self.weight_sum)
+
+    @classmethod
+    def of(cls, values, weights=None) -> np.ndarray:
+        return cls().add(values, weights).mean()
+
+class OrientationClusters:
+    # Klaster orientasi berdasarkan jarak geodesik. Pusat awal dipilih dengan leader clustering
+    # (sampel pertama yang lebih jauh dari threshold menjadi pusat baru), lalu disempurnakan seperti
+    # k-means: tiap sampel ke pusat terdekat (|q . c| terbesar), pusat = rata-rata Markley klasternya.
+    # Klaster diurutkan dari yang terbesar; labels (N,) int32 adalah satu-satunya array sebesar input
+
+    def __init__(self, centers: np.ndarray, labels: np.ndarray, counts: np.ndarray,
+                 radius: np.ndarray, threshold_degrees: float, iterations: int = 0, elapsed_s: float = 0.0):
+        self.centers = centers
+        self.labels = labels
+        self.counts = counts
+        self.radius = radius # jarak geodesik terjauh (derajat) ke pusat per klaster
+        self.threshold_degrees = threshold_degrees
+        self.iterations = iterations
+        self.elapsed_s = elapsed_s
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    @property
+    def samples(self) -> int:
+        return len(self.labels)
+
+    def center_quaternion(self, index: int) -> Quaternion:
+        w, x, y, z = (float(c) for c in self.centers[index])
+        return Quaternion(w, x, y, z)
+
+    @classmethod
+    def build(cls, values, threshold_degrees: float = ORIENTATION_CLUSTER_THRESHOLD,
+              iterations: int = ORIENTATION_CLUSTER_ITERATIONS, max_clusters: int = ORIENTATION_CLUSTER_MAX,
+              chunk_size: int = ORIENTATION_AVERAGE_CHUNK, convert=None, on_chunk=None) -> 'OrientationClusters':
+        # Data dibaca ulang per chunk pada setiap pass, jadi memmap dengan convert tidak pernah
+        # dimuat utuh ke memori
+        started = time.perf_counter()
+        quats = _as_quaternions(values, convert)
+        if len(quats) == 0:
+            raise ValueError("Tidak ada quaternion untuk dikelompokkan.")
+
+        def chunks():
+            return _chunks(quats, chunk_size, convert, on_chunk)
+
+        # Jarak geodesik <= threshold setara dengan |q . c| >= cos(threshold / 2)
+        min_dot = np.cos(np.radians(threshold_degrees) / 2.0)
+        max_clusters = max(1, int(max_clusters))
+        labels = np.empty(len(quats), dtype=np.int32)
+
+        # Leader clustering
+        centers = np.empty((0, 4), dtype=np.float64)
+        for start, q in chunks():
+            chunk_labels = labels[start:start + len(q)]
+            if len(centers):
+                dots = np.abs(q @ centers.T)
+                chunk_labels[:] = dots.argmax(axis=1)
+                pending = np.flatnonzero(dots.max(axis=1) < min_dot)
+            else:
+                pending = np.arange(len(q))
+
+            while pending.size:
+                if len(centers) >= max_clusters:
+                    chunk_labels[pending] = np.abs(q[pending] @ centers.T).argmax(axis=1)
+                    break
+                leader = q[pending[0]]
+                close = np.abs(q[pending] @ leader) >= min_dot
+                chunk_labels[pending[close]] = len(centers)
+                centers = np.vstack([centers, leader])
+                pending = pending[~close]
+
+        # Leader yang jatuh di tepi sebaran bisa memecah satu kelompok; pusat yang setelah
+        # penyempurnaan berjarak <= threshold digabung lalu disempurnakan lagi
+        done = 0
+        while True:
+            centers, steps = cls._refine(chunks, labels, centers, iterations)
+            done += steps
+            merged = cls._merge(labels, centers, min_dot)
+            if merged is None:
+                break
+            centers = merged
+
+        # Urutkan dari klaster terbesar dan buang klaster kosong
+        counts = np.bincount(labels, minlength=len(centers))
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0]
+        remap = np.full(len(centers), -1, dtype=np.int32)
+        remap[order] = np.arange(len(order), dtype=np.int32)
+        labels = remap[labels]
+        centers = RotationConversion.canonicalize_quaternion(centers[order])
+        counts = counts[order]
+
+        radius = np.zeros(len(centers), dtype=np.float64)
+        for start, q in chunks():
+            chunk_labels = labels[start:start + len(q)]
+            dots = np.minimum(np.abs(np.einsum('ij,ij->i', q, centers[chunk_labels])), 1.0)
+            np.maximum.at(radius, chunk_labels, np.degrees(2.0 * np.arccos(dots)))
+
+        return cls(centers, labels, counts, radius, threshold_degrees, done, time.perf_counter() - started)
+
+    @staticmethod
+    def _refine(chunks, labels, centers, iterations: int) -> tuple:
+        # Penugasan ulang dan rata-rata Markley dalam satu pass per iterasi; labels diubah di tempat
+        done = 0
+        for done in range(1, max(0, int(iterations)) + 1):
+            M = np.zeros((len(centers), 4, 4), dtype=np.float64)
+            changed = 0
+            for start, q in chunks():
+                chunk_labels = labels[start:start + len(q)]
+                nearest = np.abs(q @ centers.T).argmax(axis=1)
+                changed += int(np.count_nonzero(nearest != chunk_labels))
+                chunk_labels[:] = nearest
+                for i, j in _UPPER:
+                    M[:, i, j] += np.bincount(nearest, weights=q[:, i] * q[:, j], minlength=len(centers))
+
+            counts = np.bincount(labels, minlength=len(centers))
+            M = M + np.triu(M, 1).transpose(0, 2, 1)
+            centers = np.where((counts > 0)[:, None], _principal_quaternion(M)[0], centers)
+            if changed == 0:
+                break
+        return centers, done
+
+    @staticmethod
+    def _merge(labels, centers, min_dot: float):
+        # Gabungkan pasangan pusat terdekat yang masih dalam threshold ke klaster yang lebih besar.
+        # Mengembalikan pusat baru (labels sudah dipetakan ulang) atau None jika tidak ada yang digabung
+        if len(centers) < 2:
+            return None
+        counts = np.bincount(labels, minlength=len(centers))
+        dots = np.abs(centers @ centers.T)
+        np.fill_diagonal(dots, 0.0)
+        target = np.arange(len(centers))
+        for a, b in zip(*np.nonzero(np.triu(dots >= min_dot))):
+            a, b = target[a], target[b]
+            if a == b:
+                continue
+            keep, drop = (a, b) if counts[a] >= counts[b] else (b, a)
+            target[target == drop] = keep
+            counts[keep] += counts[drop]
+        if np.all(target == np.arange(len(centers))):
+            return None
+
+        kept, remap = np.unique(target, return_inverse=True)
+        labels[:] = remap.astype(np.int32)[labels]
+        return centers[kept]
+
+    def summary(self, limit: int = 5) -> str:
+        info = (f"{self.samples:,} orientations in {len(self)} clusters "
+                f"(threshold {self.threshold_degrees:g}°, {self.iterations} iterations, {self.elapsed_s:.2f} s)\n")
+        axes, angles = RotationConversion.quaternion_to_axis_angle(self.centers[:limit])
+        for index in range(min(limit, len(self))):
+            x, y, z = axes[index]
+            info += (f"  #{index + 1}: {self.counts[index]:,} ({self.counts[index] / self.samples:.1%}), "
+                     f"{angles[index]:.2f}° about ({x:.3f}, {y:.3f}, {z:.3f}), radius {self.radius[index]:.2f}°\n")
+        if len(self) > limit:
+            info += f"  ... {len(self) - limit} more\n"
+        return info
+
+class OrientationStatisticsJob:
+    # Rata-rata dan klaster seluruh data sebagai job RotationWorker (run(progress), cancel(), job_id),
+    # misalnya memmap log orientasi dengan convert per chunk. Pembatalan dicek di antara chunk
+    _ids = itertools.count(1)
+
+    def __init__(self, values, convert=None, chunk_size: int = ORIENTATION_AVERAGE_CHUNK,
+                 iterations: int = ORIENTATION_CLUSTER_ITERATIONS):
+        self.job_id = next(OrientationStatisticsJob._ids)
+        self.values = _as_quaternions(values, convert)
+        self.convert = convert
+        self.chunk_size = max(1, int(chunk_size))
+        self.iterations = iterations
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self, progress=None) -> tuple:
+        # Jumlah pass klaster baru diketahui di akhir; progress diperkirakan dari
+        # pass rata-rata + leader + iterasi maksimum + radius
+        chunks_per_pass = -(-len(self.values) // self.chunk_size)
+        total = max(1, chunks_per_pass * (3 + max(0, int(self.iterations))))
+        done = 0
+
+        def on_chunk():
+            nonlocal done
+            if self.cancelled:
+                raise RotationCancelled(self.job_id)
+            if progress:
+                progress(min(done / total, 0.99))
+            done += 1
+
+        with tracer.span("OrientationStatisticsJob.run", "rotation", job=self.job_id, samples=len(self.values)):
+            average = OrientationAverage(self.chunk_size).add(self.values, convert=self.convert, on_chunk=on_chunk)
+            clusters = OrientationClusters.build(
+                self.values, iterations=self.iterations, chunk_size=self.chunk_size,
+                convert=self.convert, on_chunk=on_chunk
+            )
+        if progress:
+            progress(1.0)
+        return average, clusters
@@ -3,6 +3,8 @@ import math
 from .vector3 import Vector3
 
 class Quaternion:
+    __slots__ = ('w', 'x', 'y', 'z')
+
     def __init__(self, w:float = 1.0, x:float = 0.0, y:float = 0.0, z:float = 0.0):
         self.w = w
         self.x = x
@@ -60,17 +62,20 @@ class Quaternion:
         return Quaternion(self.w / mag, self.x / mag, self.y / mag, self.z / mag)
     
     def rotate_vector(self, vector: Vector3) -> Vector3:
-        # Cek apakah vector yang diberikan adalah nol
-        if vector.magnitude() == 0:
-            return Vector3(0, 0, 0)
-        
-        # Konversi vector ke quaternion
-        vector_quat = Quaternion(0, vector.x, vector.y, vector.z)
+        w, x, y, z = self.w, self.x, self.y, self.z
+        vx, vy, vz = vector.x, vector.y, vector.z
 
-        # Rotasi vector dengan quaternion
-        rotated_vector_quat = self * vector_quat * self.conjugate()
+        # Bentuk gabungan dari q * v * q^-1 tanpa quaternion sementara:
+        # v' = (w^2 - |u|^2) v + 2 (u . v) u + 2 w (u x v)
+        s = w * w - x * x - y * y - z * z
+        d = 2.0 * (x * vx + y * vy + z * vz)
+        w2 = 2.0 * w
 
-        return Vector3(rotated_vector_quat.x, rotated_vector_quat.y, rotated_vector_quat.z)
+        return Vector3(
+            s * vx + d * x + w2 * (y * vz - z * vy),
+            s * vy + d * y + w2 * (z * vx - x * vz),
+            s * vz + d * z + w2 * (x * vy - y * vx)
+        )
     
     def to_axis_angle(self) -> tuple[Vector3, float]:
         # Normalisasi quaternion
@@ -95,5 +100,37 @@ class Quaternion:
 
         return axis.normalize(), angle_degrees
 
+    def to_rotation_matrix(self) -> list:
+        from .rotation_conversion import RotationConversion
+        return RotationConversion.to_rotation_matrix(self)
+
+    @staticmethod
+    def from_rotation_matrix(matrix: list) -> 'Quaternion':
+        from .rotation_conversion import RotationConversion
+        w, x, y, z = (float(c) for c in RotationConversion.matrix_to_quaternion(matrix))
+        return Quaternion(w, x, y, z)
+
     def copy(self) -> 'Quaternion':
-        return Quaternion(self.w, self.x, self.y, self.z)
\ No newline at end of file
+        return Quaternion(self.w, self.x, self.y, self.z)
+
+class _FrozenQuaternion(Quaternion):
+    # Quaternion read-only untuk konstanta bersama; copy() dan operasi lain mengembalikan Quaternion biasa
+    __slots__ = ()
+
+    def __init__(self, w: float = 1.0, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        object.__setattr__(self, 'w', w)
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Konstanta {self} tidak boleh diubah, gunakan copy().")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Konstanta {self} tidak boleh diubah, gunakan copy().")
+
+    def __reduce__(self):
+        return (type(self), (self.w, self.x, self.y, self.z))
+
+# Konstanta bersama, read-only agar tidak bisa diubah lewat objek yang dikembalikan
+Quaternion.IDENTITY = _FrozenQuaternion(1.0, 0.0, 0.0, 0.0)
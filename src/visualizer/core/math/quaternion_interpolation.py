@@ -0,0 +1,107 @@
+import numpy as np
+
+from .rotation_conversion import RotationConversion
+
+# Batas sudut kecil, di bawahnya SLERP diganti interpolasi linear ternormalisasi
+_SLERP_LINEAR_THRESHOLD = 1e-6
+
+class QuaternionInterpolation:
+    # Semua quaternion berupa array (..., 4) dengan urutan (w, x, y, z)
+
+    @staticmethod
+    def slerp(q0, q1, t, shortest_path: bool = True) -> np.ndarray:
+        q0 = RotationConversion.normalize_quaternion(q0)
+        q1 = RotationConversion.normalize_quaternion(q1)
+        t = np.asarray(t, dtype=q0.dtype)[..., None]
+
+        dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+        if shortest_path:
+            # Ambil lintasan terpendek: q dan -q adalah rotasi yang sama
+            q1 = np.where(dot < 0, -q1, q1)
+            dot = np.abs(dot)
+        dot = np.clip(dot, -1.0, 1.0)
+
+        theta = np.arccos(dot)
+        sin_theta = np.sin(theta)
+        linear = sin_theta < _SLERP_LINEAR_THRESHOLD
+        safe_sin = np.where(linear, 1.0, sin_theta)
+
+        w0 = np.where(linear, 1.0 - t, np.sin((1.0 - t) * theta) / safe_sin)
+        w1 = np.where(linear, t, np.sin(t * theta) / safe_sin)
+        return RotationConversion.normalize_quaternion(w0 * q0 + w1 * q1)
+
+    @staticmethod
+    def log(q) -> np.ndarray:
+        # Logaritma quaternion unit, hasilnya vektor (..., 3) = axis * sudut / 2
+        return 0.5 * RotationConversion.quaternion_to_exp_map(q)
+
+    @staticmethod
+    def exp(v) -> np.ndarray:
+        return RotationConversion.exp_map_to_quaternion(2.0 * np.asarray(v))
+
+    @staticmethod
+    def inverse(q) -> np.ndarray:
+        q = RotationConversion.normalize_quaternion(q)
+        return q * np.array([1.0, -1.0, -1.0, -1.0], dtype=q.dtype)
+
+    @staticmethod
+    def align_hemispheres(quats) -> np.ndarray:
+        # Samakan tanda quaternion berurutan agar interpolasi tidak berputar jauh
+        quats = RotationConversion.normalize_quaternion(quats).copy()
+        for i in range(1, len(quats)):
+            if np.dot(quats[i - 1], quats[i]) < 0:
+                quats[i] = -quats[i]
+        return quats
+
+    @staticmethod
+    def squad_control_points(keyframes) -> np.ndarray:
+        q = QuaternionInterpolation.align_hemispheres(keyframes)
+        count = len(q)
+        if count < 3:
+            return q.copy()
+
+        prev_q = np.concatenate([q[:1], q[:-1]])
+        next_q = np.concatenate([q[1:], q[-1:]])
+        q_inv = QuaternionInterpolation.inverse(q)
+
+        # s_i = q_i * exp(-(log(q_i^-1 q_{i+1}) + log(q_i^-1 q_{i-1})) / 4)
+        log_next = QuaternionInterpolation.log(RotationConversion.quaternion_multiply(q_inv, next_q))
+        log_prev = QuaternionInterpolation.log(RotationConversion.quaternion_multiply(q_inv, prev_q))
+        controls = RotationConversion.quaternion_multiply(q, QuaternionInterpolation.exp(-0.25 * (log_next + log_prev)))
+
+        # Titik ujung tidak memiliki tetangga, gunakan keyframe itu sendiri
+        controls[0] = q[0]
+        controls[-1] = q[-1]
+        return controls
+
+    @staticmethod
+    def squad(q0, q1, s0, s1, t) -> np.ndarray:
+        t = np.asarray(t)
+        # Interpolasi dalam SQUAD tidak boleh membalik tanda agar kurva tetap kontinu
+        outer = QuaternionInterpolation.slerp(q0, q1, t, shortest_path=False)
+        inner = QuaternionInterpolation.slerp(s0, s1, t, shortest_path=False)
+        return QuaternionInterpolation.slerp(outer, inner, 2.0 * t * (1.0 - t), shortest_path=False)
+
+    @staticmethod
+    def sample_path(keyframes, sample_count: int, ease: bool = False) -> np.ndarray:
+        keyframes = QuaternionInterpolation.align_hemispheres(keyframes)
+        if len(keyframes) < 2 or sample_count < 2:
+            return np.repeat(keyframes[:1], max(sample_count, 1), axis=0)
+
+        # Parameter global u di [0, jumlah segmen], dipecah per segmen
+        segments = len(keyframes) - 1
+        u = np.linspace(0.0, 1.0, sample_count)
+        if ease:
+            # Smoothstep: mulai dan berhenti perlahan
+            u = u * u * (3.0 - 2.0 * u)
+        u = u * segments
+        index = np.minimum(u.astype(np.int64), segments - 1)
+        t = u - index
+
+        if len(keyframes) == 2:
+            return QuaternionInterpolation.slerp(keyframes[index], keyframes[index + 1], t)
+
+        controls = QuaternionInterpolation.squad_control_points(keyframes)
+        return QuaternionInterpolation.squad(
+            keyframes[index], keyframes[index + 1], controls[index], controls[index + 1], t
+        )
@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+
+from .quaternion import Quaternion
+from .euler_angle import EulerAngle
+from .tait_bryan import TaitBryan
+from .exponential_map import ExponentialMap
+
+# Jumlah digit pembulatan parameter agar nilai yang hampir sama memakai entri yang sama
+_KEY_DIGITS = 9
+
+class RotationCacheEntry:
+    __slots__ = ('quaternion', 'matrix', 'operator', 'axis_angle', 'visualization_data', 'info')
+
+    def __init__(self):
+        self.quaternion = None
+        self.matrix = None
+        self.operator = None
+        self.axis_angle = None
+        self.visualization_data = None
+        self.info = None
+
+class RotationCache:
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError("Ukuran cache harus lebih dari nol.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _canonical(value: float) -> float:
+        # Tambah 0.0 agar -0.0 dan 0.0 menjadi kunci yang sama
+        return round(float(value), _KEY_DIGITS) + 0.0
+
+    @staticmethod
+    def make_key(rotation_obj, method) -> tuple:
+        c = RotationCache._canonical
+        method_name = getattr(method, 'value', method)
+
+        if isinstance(rotation_obj, Quaternion):
+            params = (c(rotation_obj.w), c(rotation_obj.x), c(rotation_obj.y), c(rotation_obj.z))
+        elif isinstance(rotation_obj, EulerAngle):
+            params = (c(rotation_obj.x_angle), c(rotation_obj.y_angle), c(rotation_obj.z_angle), rotation_obj.order)
+        elif isinstance(rotation_obj, TaitBryan):
+            params = (c(rotation_obj.roll), c(rotation_obj.pitch), c(rotation_obj.yaw))
+        elif isinstance(rotation_obj, ExponentialMap):
+            omega = rotation_obj.omega
+            params = (c(omega.x), c(omega.y), c(omega.z))
+        else:
+            raise ValueError(f"Objek rotasi tidak didukung: {type(rotation_obj).__name__}")
+
+        return (method_name, type(rotation_obj).__name__) + params
+
+    def lookup(self, rotation_obj, method) -> RotationCacheEntry:
+        key = self.make_key(rotation_obj, method)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+
+            self.misses += 1
+            entry = RotationCacheEntry()
+            self._entries[key] = entry
+
+            # Buang entri yang paling lama tidak dipakai
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+            return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / total if total else 0.0
+        }
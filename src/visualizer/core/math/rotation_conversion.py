@@ -0,0 +1,344 @@
+import numpy as np
+
+from .vector3 import Vector3
+from .quaternion import Quaternion
+from .euler_angle import EulerAngle
+from .tait_bryan import TaitBryan
+from .exponential_map import ExponentialMap
+
+# Indeks sumbu untuk urutan rotasi Euler
+_AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# Batas untuk deteksi gimbal lock dan sudut kecil
+_GIMBAL_EPSILON = 1e-9
+_SMALL_ANGLE = 1e-8
+
+class RotationConversion:
+    # Semua representasi yang didukung oleh hub konversi
+    REPRESENTATIONS = ("matrix", "quaternion", "euler", "tait_bryan", "exp_map", "axis_angle")
+
+    # Konvensi:
+    # - quaternion: (..., 4) dengan urutan (w, x, y, z)
+    # - matrix: (..., 3, 3)
+    # - euler: (..., 3) sudut (x, y, z) dalam derajat, urutan rotasi mengikuti EulerAngle
+    # - tait_bryan: (..., 3) sudut (roll, pitch, yaw) dalam derajat
+    # - exp_map: (..., 3) vektor rotasi omega dalam radian
+    # - axis_angle: tuple (axis (..., 3), angle (...)) dengan sudut dalam derajat
+
+    @staticmethod
+    def _as_array(values, trailing_shape: tuple) -> np.ndarray:
+        array = np.asarray(values)
+        if not np.issubdtype(array.dtype, np.floating):
+            array = array.astype(np.float64)
+
+        if array.shape[array.ndim - len(trailing_shape):] != trailing_shape:
+            raise ValueError(f"Bentuk array tidak valid: {array.shape}, dimensi akhir harus {trailing_shape}")
+        return array
+
+    @staticmethod
+    def _order_axes(order: str) -> tuple:
+        order = order.upper()
+        if order not in EulerAngle.ROTATION_ORDERS:
+            raise ValueError(f"Urutan rotasi tidak valid, harus salah satu dari {EulerAngle.ROTATION_ORDERS}")
+
+        i, j, k = (_AXIS_INDEX[char] for char in order)
+        # Paritas positif untuk urutan siklik (XYZ, YZX, ZXY)
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+        return i, j, k, sign
+
+    # Operasi dasar quaternion
+
+    @staticmethod
+    def normalize_quaternion(q) -> np.ndarray:
+        q = RotationConversion._as_array(q, (4,))
+        norm = np.linalg.norm(q, axis=-1, keepdims=True)
+
+        # Quaternion nol dianggap sebagai identitas
+        identity = np.zeros_like(q)
+        identity[..., 0] = 1.0
+        safe_norm = np.where(norm > 0, norm, 1.0)
+        return np.where(norm > 0, q / safe_norm, identity)
+
+    @staticmethod
+    def canonicalize_quaternion(q) -> np.ndarray:
+        # Pilih hemisfer w >= 0 agar q dan -q memiliki representasi yang sama
+        q = RotationConversion._as_array(q, (4,))
+        return np.where(q[..., :1] < 0, -q, q)
+
+    @staticmethod
+    def quaternion_multiply(a, b) -> np.ndarray:
+        a = RotationConversion._as_array(a, (4,))
+        b = RotationConversion._as_array(b, (4,))
+        aw, ax, ay, az = np.moveaxis(a, -1, 0)
+        bw, bx, by, bz = np.moveaxis(b, -1, 0)
+
+        return np.stack([
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw
+        ], axis=-1)
+
+    # Matrix <-> Quaternion
+
+    @staticmethod
+    def quaternion_to_matrix(q) -> np.ndarray:
+        q = RotationConversion.normalize_quaternion(q)
+        w, x, y, z = np.moveaxis(q, -1, 0)
+
+        xx, yy, zz = x * x, y * y, z * z
+        xy, xz, yz = x * y, x * z, y * z
+        wx, wy, wz = w * x, w * y, w * z
+
+        matrix = np.stack([
+            1 - 2 * (yy + zz), 2 * (xy - wz), 2 * (xz + wy),
+            2 * (xy + wz), 1 - 2 * (xx + zz), 2 * (yz - wx),
+            2 * (xz - wy), 2 * (yz + wx), 1 - 2 * (xx + yy)
+        ], axis=-1)
+        return matrix.reshape(q.shape[:-1] + (3, 3))
+
+    @staticmethod
+    def matrix_to_quaternion(matrix) -> np.ndarray:
+        R = RotationConversion._as_array(matrix, (3, 3))
+        r00, r01, r02 = R[..., 0, 0], R[..., 0, 1], R[..., 0, 2]
+        r10, r11, r12 = R[..., 1, 0], R[..., 1, 1], R[..., 1, 2]
+        r20, r21, r22 = R[..., 2, 0], R[..., 2, 1], R[..., 2, 2]
+
+        # Metode Shepperd: pilih komponen terbesar sebagai pembagi agar stabil
+        traces = np.stack([
+            1.0 + r00 + r11 + r22,
+            1.0 + r00 - r11 - r22,
+            1.0 - r00 + r11 - r22,
+            1.0 - r00 - r11 + r22
+        ], axis=-1)
+        choice = np.argmax(traces, axis=-1)
+        root = np.sqrt(np.maximum(np.take_along_axis(traces, choice[..., None], axis=-1)[..., 0], 0.0))
+        half = 0.5 * root
+        quarter_inv = np.where(root > 0, 0.5 / np.where(root > 0, root, 1.0), 0.0)
+
+        candidates = np.stack([
+            np.stack([half, (r21 - r12) * quarter_inv, (r02 - r20) * quarter_inv, (r10 - r01) * quarter_inv], axis=-1),
+            np.stack([(r21 - r12) * quarter_inv, half, (r01 + r10) * quarter_inv, (r02 + r20) * quarter_inv], axis=-1),
+            np.stack([(r02 - r20) * quarter_inv, (r01 + r10) * quarter_inv, half, (r12 + r21) * quarter_inv], axis=-1),
+            np.stack([(r10 - r01) * quarter_inv, (r02 + r20) * quarter_inv, (r12 + r21) * quarter_inv, half], axis=-1)
+        ], axis=-2)
+        q = np.take_along_axis(candidates, choice[..., None, None], axis=-2)[..., 0, :]
+
+        return RotationConversion.canonicalize_quaternion(RotationConversion.normalize_quaternion(q))
+
+    # Euler <-> Quaternion
+
+    @staticmethod
+    def euler_to_quaternion(angles_degrees, order: str = "XYZ") -> np.ndarray:
+        angles = RotationConversion._as_array(angles_degrees, (3,))
+        i, j, k, sign = RotationConversion._order_axes(order)
+
+        half = np.radians(angles) * 0.5
+        cos_half = np.cos(half)
+        sin_half = np.sin(half)
+        ca, cb, cc = cos_half[..., i], cos_half[..., j], cos_half[..., k]
+        sa, sb, sc = sin_half[..., i], sin_half[..., j], sin_half[..., k]
+
+        # q_k(c) * q_j(b) * q_i(a) dijabarkan langsung (rotasi pertama paling kanan, sama seperti
+        # EulerAngle.to_quaternion); e_j x e_i = -sign * e_k untuk paritas urutan
+        q = np.empty(angles.shape[:-1] + (4,), dtype=angles.dtype)
+        q[..., 0] = cc * cb * ca + sign * sc * sb * sa
+        q[..., i + 1] = cc * cb * sa - sign * sc * sb * ca
+        q[..., j + 1] = cc * sb * ca + sign * sc * cb * sa
+        q[..., k + 1] = sc * cb * ca - sign * cc * sb * sa
+        return q
+
+    @staticmethod
+    def matrix_to_euler(matrix, order: str = "XYZ") -> np.ndarray:
+        R = RotationConversion._as_array(matrix, (3, 3))
+        i, j, k, sign = RotationConversion._order_axes(order)
+
+        # R = R_k(c) * R_j(b) * R_i(a)
+        sin_b = np.clip(-sign * R[..., k, i], -1.0, 1.0)
+        b = np.arcsin(sin_b)
+
+        a = np.arctan2(sign * R[..., k, j], R[..., k, k])
+        c = np.arctan2(sign * R[..., j, i], R[..., i, i])
+
+        # Gimbal lock: sudut a dan c tidak bisa dipisahkan, tetapkan c = 0
+        locked = np.abs(sin_b) > 1.0 - _GIMBAL_EPSILON
+        a_locked = np.arctan2(-sign * R[..., j, k], R[..., j, j])
+        a = np.where(locked, a_locked, a)
+        c = np.where(locked, 0.0, c)
+
+        angles = np.empty(R.shape[:-2] + (3,), dtype=R.dtype)
+        angles[..., i] = a
+        angles[..., j] = b
+        angles[..., k] = c
+        return np.degrees(angles)
+
+    @staticmethod
+    def quaternion_to_euler(q, order: str = "XYZ") -> np.ndarray:
+        return RotationConversion.matrix_to_euler(RotationConversion.quaternion_to_matrix(q), order)
+
+    # Tait-Bryan <-> Quaternion (roll-pitch-yaw sama dengan Euler XYZ)
+
+    @staticmethod
+    def tait_bryan_to_quaternion(roll_pitch_yaw_degrees) -> np.ndarray:
+        return RotationConversion.euler_to_quaternion(roll_pitch_yaw_degrees, "XYZ")
+
+    @staticmethod
+    def quaternion_to_tait_bryan(q) -> np.ndarray:
+        return RotationConversion.quaternion_to_euler(q, "XYZ")
+
+    # Exponential map <-> Quaternion
+
+    @staticmethod
+    def exp_map_to_quaternion(omega) -> np.ndarray:
+        omega = RotationConversion._as_array(omega, (3,))
+        angle = np.linalg.norm(omega, axis=-1, keepdims=True)
+
+        # sin(theta/2)/theta dengan deret Taylor untuk sudut kecil
+        safe_angle = np.where(angle > _SMALL_ANGLE, angle, 1.0)
+        scale = np.where(angle > _SMALL_ANGLE, np.sin(0.5 * angle) / safe_angle, 0.5 - angle * angle / 48.0)
+
+        return np.concatenate([np.cos(0.5 * angle), omega * scale], axis=-1)
+
+    @staticmethod
+    def quaternion_to_exp_map(q) -> np.ndarray:
+        q = RotationConversion.canonicalize_quaternion(RotationConversion.normalize_quaternion(q))
+        w = q[..., :1]
+        v = q[..., 1:]
+        sin_half = np.linalg.norm(v, axis=-1, keepdims=True)
+
+        # theta = 2 * atan2(|v|, w), lebih stabil daripada acos(w)
+        angle = 2.0 * np.arctan2(sin_half, w)
+        safe_sin = np.where(sin_half > _SMALL_ANGLE, sin_half, 1.0)
+        scale = np.where(sin_half > _SMALL_ANGLE, angle / safe_sin, 2.0 / np.where(w > 0, w, 1.0))
+        return v * scale
+
+    # Axis-angle <-> Quaternion
+
+    @staticmethod
+    def axis_angle_to_quaternion(axis, angle_degrees) -> np.ndarray:
+        axis = RotationConversion._as_array(axis, (3,))
+        angle = np.asarray(angle_degrees, dtype=axis.dtype)
+
+        norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+        if np.any(norm == 0):
+            raise ValueError("Axis rotasi tidak boleh nol.")
+
+        half = np.radians(angle)[..., None] * 0.5
+        return np.concatenate([np.cos(half), (axis / norm) * np.sin(half)], axis=-1)
+
+    @staticmethod
+    def quaternion_to_axis_angle(q) -> tuple:
+        q = RotationConversion.canonicalize_quaternion(RotationConversion.normalize_quaternion(q))
+        v = q[..., 1:]
+        sin_half = np.linalg.norm(v, axis=-1, keepdims=True)
+
+        angle = np.degrees(2.0 * np.arctan2(sin_half[..., 0], q[..., 0]))
+
+        # Axis tidak terdefinisi untuk rotasi nol, gunakan sumbu Z seperti default aplikasi
+        default_axis = np.zeros_like(v)
+        default_axis[..., 2] = 1.0
+        safe_sin = np.where(sin_half > _SMALL_ANGLE, sin_half, 1.0)
+        axis = np.where(sin_half > _SMALL_ANGLE, v / safe_sin, default_axis)
+        return axis, angle
+
+    # Hub konversi untuk semua pasangan representasi
+
+    @staticmethod
+    def to_quaternion_array(value, source: str, order: str = "XYZ") -> np.ndarray:
+        if source == "quaternion":
+            return RotationConversion.canonicalize_quaternion(RotationConversion.normalize_quaternion(value))
+        elif source == "matrix":
+            return RotationConversion.matrix_to_quaternion(value)
+        elif source == "euler":
+            return RotationConversion.euler_to_quaternion(value, order)
+        elif source == "tait_bryan":
+            return RotationConversion.tait_bryan_to_quaternion(value)
+        elif source == "exp_map":
+            return RotationConversion.exp_map_to_quaternion(value)
+        elif source == "axis_angle":
+            axis, angle = value
+            return RotationConversion.axis_angle_to_quaternion(axis, angle)
+        else:
+            raise ValueError(f"Representasi tidak valid: {source}, harus salah satu dari {RotationConversion.REPRESENTATIONS}")
+
+    @staticmethod
+    def from_quaternion_array(q, target: str, order: str = "XYZ"):
+        if target == "quaternion":
+            return RotationConversion.canonicalize_quaternion(RotationConversion.normalize_quaternion(q))
+        elif target == "matrix":
+            return RotationConversion.quaternion_to_matrix(q)
+        elif target == "euler":
+            return RotationConversion.quaternion_to_euler(q, order)
+        elif target == "tait_bryan":
+            return RotationConversion.quaternion_to_tait_bryan(q)
+        elif target == "exp_map":
+            return RotationConversion.quaternion_to_exp_map(q)
+        elif target == "axis_angle":
+            return RotationConversion.quaternion_to_axis_angle(q)
+        else:
+            raise ValueError(f"Representasi tidak valid: {target}, harus salah satu dari {RotationConversion.REPRESENTATIONS}")
+
+    @staticmethod
+    def convert(value, source: str, target: str, order: str = "XYZ", target_order: str = None):
+        if target_order is None:
+            target_order = order
+
+        # Matriks ke Euler bisa langsung tanpa melalui quaternion
+        if source == "matrix" and target == "euler":
+            return RotationConversion.matrix_to_euler(value, target_order)
+
+        q = RotationConversion.to_quaternion_array(value, source, order)
+        return RotationConversion.from_quaternion_array(q, target, target_order)
+
+    # Konversi untuk objek rotasi dari core.math
+
+    @staticmethod
+    def rotation_to_array(rotation_obj) -> np.ndarray:
+        if isinstance(rotation_obj, Quaternion):
+            q = [rotation_obj.w, rotation_obj.x, rotation_obj.y, rotation_obj.z]
+            return RotationConversion.to_quaternion_array(q, "quaternion")
+        elif isinstance(rotation_obj, EulerAngle):
+            angles = [rotation_obj.x_angle, rotation_obj.y_angle, rotation_obj.z_angle]
+            return RotationConversion.euler_to_quaternion(angles, rotation_obj.order)
+        elif isinstance(rotation_obj, TaitBryan):
+            angles = [rotation_obj.roll, rotation_obj.pitch, rotation_obj.yaw]
+            return RotationConversion.tait_bryan_to_quaternion(angles)
+        elif isinstance(rotation_obj, ExponentialMap):
+            omega = rotation_obj.omega
+            return RotationConversion.exp_map_to_quaternion([omega.x, omega.y, omega.z])
+        else:
+            raise ValueError(f"Objek rotasi tidak didukung: {type(rotation_obj).__name__}")
+
+    @staticmethod
+    def to_quaternion(rotation_obj) -> Quaternion:
+        w, x, y, z = (float(c) for c in RotationConversion.rotation_to_array(rotation_obj))
+        return Quaternion(w, x, y, z)
+
+    @staticmethod
+    def to_rotation_matrix(rotation_obj) -> list:
+        matrix = RotationConversion.quaternion_to_matrix(RotationConversion.rotation_to_array(rotation_obj))
+        return matrix.tolist()
+
+    @staticmethod
+    def to_axis_angle(rotation_obj) -> tuple[Vector3, float]:
+        axis, angle = RotationConversion.quaternion_to_axis_angle(RotationConversion.rotation_to_array(rotation_obj))
+        return Vector3(float(axis[0]), float(axis[1]), float(axis[2])), float(angle)
+
+    @staticmethod
+    def from_quaternion(quaternion: Quaternion, target: str, order: str = "XYZ"):
+        q = [quaternion.w, quaternion.x, quaternion.y, quaternion.z]
+        values = RotationConversion.from_quaternion_array(q, target, order)
+
+        if target == "quaternion":
+            return Quaternion(*(float(c) for c in values))
+        elif target == "matrix":
+            return values.tolist()
+        elif target == "euler":
+            return EulerAngle(float(values[0]), float(values[1]), float(values[2]), order)
+        elif target == "tait_bryan":
+            return TaitBryan(float(values[0]), float(values[1]), float(values[2]))
+        elif target == "exp_map":
+            return ExponentialMap(Vector3(float(values[0]), float(values[1]), float(values[2])))
+        else:
+            axis, angle = values
+            return Vector3(float(axis[0]), float(axis[1]), float(axis[2])), float(angle)
@@ -13,18 +13,18 @@ class RotationEngine:
         if axis.magnitude() == 0:
             raise ValueError("Axis rotasi tidak boleh nol.")
 
+        # Operator berbasis numpy diimport di sini agar import core tetap ringan
+        from .rotation_operator import RotationOperator
+
         rotation_quat = Quaternion.from_axis_angle(axis, angle_degrees)
+        operator = RotationOperator.from_quaternion(rotation_quat)
 
         rotated_data = OBJData()
         rotated_data.filename = f"{obj_data.filename}_rotated_{angle_degrees:.1f}deg"
 
         rotated_data.faces = obj_data.faces.copy()
 
-        for vertex in obj_data.vertices:
-            vector = Vector3(vertex.x, vertex.y, vertex.z)
-            rotated_vector = rotation_quat.rotate_vector(vector)
-            rotated_vertex = rotated_vector.to_vertex()
-            rotated_data.vertices.append(rotated_vertex)
+        rotated_data.vertices = operator.rotate_vertices(obj_data.vertices)
         
         return rotated_data
     
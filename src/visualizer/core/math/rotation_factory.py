@@ -4,7 +4,12 @@ from .quaternion import Quaternion
 from .euler_angle import EulerAngle
 from .tait_bryan import TaitBryan
 from .exponential_map import ExponentialMap
+from .rotation_operator import RotationOperator
+from .rotation_conversion import RotationConversion
+from .rotation_cache import RotationCache
 from ..io.obj_loader import OBJData
+from ...config.settings import ROTATION_CACHE_SIZE
+from ...diagnostics.tracing import traced
 
 class RotationMethod(Enum):
     QUATERNION = "Quaternion"
@@ -13,8 +18,17 @@ class RotationMethod(Enum):
     EXPONENTIAL_MAP = "Exponential Map"
 
 class RotationFactory:
+    # Cache LRU untuk hasil turunan (matriks, quaternion, axis-angle, dst.), dengan kunci parameter
+    # yang dikanonisasi. Objek rotasi sendiri bisa diubah pemanggil, jadi tidak pernah disimpan;
+    # hasil turunan disimpan sebagai tuple dan dibuatkan objek baru setiap kali dikembalikan
+    _cache = RotationCache(ROTATION_CACHE_SIZE)
+
     @staticmethod
     def create_rotation(method: RotationMethod, **kwargs):
+        return RotationFactory._build_rotation(method, **kwargs)
+
+    @staticmethod
+    def _build_rotation(method: RotationMethod, **kwargs):
         if method == RotationMethod.QUATERNION:
             axis = kwargs.get('axis', Vector3(0, 0, 1))
             angle = kwargs.get('angle', 0.0)
@@ -37,6 +51,7 @@ class RotationFactory:
             raise ValueError(f"Method tidak valid: {method}")
     
     @staticmethod
+    @traced("RotationFactory.rotate_obj_data", "rotation")
     def rotate_obj_data(obj_data: OBJData, rotation_obj, method: RotationMethod) -> OBJData:
         if not obj_data or not obj_data.vertices:
             raise ValueError("OBJ data yang tersedia tidak valid atau tidak memiliki vertex.")
@@ -45,28 +60,21 @@ class RotationFactory:
         rotated_data.filename = f"{obj_data.filename}_rotated_{method.value}"
         rotated_data.faces = obj_data.faces.copy()
 
-        for vertex in obj_data.vertices:
-            vector = Vector3(vertex.x, vertex.y, vertex.z)
-
-            # Sesuaikan rotasi berdasarkan metode
-            if method == RotationMethod.QUATERNION:
-                rotated_vector = rotation_obj.rotate_vector(vector)
-            elif method == RotationMethod.EULER_ANGLE:
-                rotated_vector = rotation_obj.rotate_vector(vector)
-            elif method == RotationMethod.TAIT_BRYAN:
-                rotated_vector = rotation_obj.rotate_vector(vector)
-            elif method == RotationMethod.EXPONENTIAL_MAP:
-                rotated_vector = rotation_obj.rotate_vector(vector)
-            else:
-                rotated_vector = vector
-            
-            rotated_vertex = rotated_vector.to_vertex()
-            rotated_data.vertices.append(rotated_vertex)
+        # Matriks rotasi dihitung sekali untuk semua vertex
+        operator = RotationFactory.get_operator(rotation_obj, method)
+        rotated_data.vertices = operator.rotate_vertices(obj_data.vertices)
         
         return rotated_data
     
     @staticmethod
     def get_rotation_info(rotation_obj, method: RotationMethod) -> str:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.info is None:
+            entry.info = RotationFactory._build_rotation_info(rotation_obj, method)
+        return entry.info
+
+    @staticmethod
+    def _build_rotation_info(rotation_obj, method: RotationMethod) -> str:
         info = f"Method: {method.value}\n"
         info += f"Rotation Object: {rotation_obj}\n"
 
@@ -96,6 +104,19 @@ class RotationFactory:
 
     @staticmethod
     def get_visualization_data(rotation_obj, method: RotationMethod) -> dict:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.visualization_data is None:
+            entry.visualization_data = RotationFactory._build_visualization_data(rotation_obj, method)
+
+        # Salin list dan axis agar data di cache tidak berubah oleh pemanggil
+        viz_data = dict(entry.visualization_data)
+        viz_data['axes'] = [Vector3(axis.x, axis.y, axis.z) for axis in viz_data['axes']]
+        viz_data['angles'] = list(viz_data['angles'])
+        viz_data['colors'] = list(viz_data['colors'])
+        return viz_data
+
+    @staticmethod
+    def _build_visualization_data(rotation_obj, method: RotationMethod) -> dict:
         viz_data = {
             'method': method,
             'axes': [],
@@ -137,4 +158,64 @@ class RotationFactory:
             viz_data['angles'] = [angle]
             viz_data['colors'] = [(0.5, 1.0, 0.5)]
         
-        return viz_data
\ No newline at end of file
+        return viz_data
+
+    @staticmethod
+    def get_method(rotation_obj) -> RotationMethod:
+        if isinstance(rotation_obj, Quaternion):
+            return RotationMethod.QUATERNION
+        elif isinstance(rotation_obj, EulerAngle):
+            return RotationMethod.EULER_ANGLE
+        elif isinstance(rotation_obj, TaitBryan):
+            return RotationMethod.TAIT_BRYAN
+        elif isinstance(rotation_obj, ExponentialMap):
+            return RotationMethod.EXPONENTIAL_MAP
+        else:
+            raise ValueError(f"Objek rotasi tidak didukung: {type(rotation_obj).__name__}")
+
+    @staticmethod
+    def _entry(rotation_obj, method: RotationMethod = None):
+        if method is None:
+            method = RotationFactory.get_method(rotation_obj)
+        return RotationFactory._cache.lookup(rotation_obj, method)
+
+    @staticmethod
+    def get_quaternion(rotation_obj, method: RotationMethod = None) -> Quaternion:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.quaternion is None:
+            q = RotationConversion.to_quaternion(rotation_obj)
+            entry.quaternion = (q.w, q.x, q.y, q.z)
+        return Quaternion(*entry.quaternion)
+
+    @staticmethod
+    def get_rotation_matrix(rotation_obj, method: RotationMethod = None) -> list:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.matrix is None:
+            if entry.operator is None:
+                entry.operator = RotationOperator.from_rotation(rotation_obj)
+            entry.matrix = entry.operator.as_matrix()
+        return [row[:] for row in entry.matrix]
+
+    @staticmethod
+    def get_operator(rotation_obj, method: RotationMethod = None) -> RotationOperator:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.operator is None:
+            entry.operator = RotationOperator.from_rotation(rotation_obj)
+        return entry.operator
+
+    @staticmethod
+    def get_axis_angle(rotation_obj, method: RotationMethod = None) -> tuple:
+        entry = RotationFactory._entry(rotation_obj, method)
+        if entry.axis_angle is None:
+            axis, angle = RotationConversion.to_axis_angle(rotation_obj)
+            entry.axis_angle = ((axis.x, axis.y, axis.z), angle)
+        axis, angle = entry.axis_angle
+        return Vector3(*axis), angle
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        return RotationFactory._cache.stats()
+
+    @staticmethod
+    def clear_cache():
+        RotationFactory._cache.clear()
@@ -0,0 +1,139 @@
+import numpy as np
+
+from .vector3 import Vector3
+from .quaternion import Quaternion
+from .euler_angle import EulerAngle
+from .tait_bryan import TaitBryan
+from .exponential_map import ExponentialMap
+from .rotation_factory import RotationMethod
+from ...config.settings import ROTATION_HISTORY_SIZE
+
+_METHODS = tuple(RotationMethod)
+
+# Satu langkah riwayat sebagai satu record ~80 byte; mesh tidak pernah disimpan,
+# hanya input rotasi, pose gabungan, dan kamera yang cukup untuk menurunkannya lagi
+STATE_DTYPE = np.dtype([
+    ('method', np.uint8),           # indeks RotationMethod
+    ('order', np.uint8),            # indeks EulerAngle.ROTATION_ORDERS (hanya Euler)
+    ('applied', np.bool_),          # objek rotated ditampilkan untuk pose ini
+    ('params', np.float64, (4,)),   # parameter input metode, lihat RotationState.params
+    ('pose', np.float64, (4,)),     # quaternion gabungan yang ditampilkan (w, x, y, z)
+    ('camera', np.float32, (3,))    # rotasi x, rotasi y, jarak kamera
+])
+
+class RotationState:
+    __slots__ = ('method', 'rotation', 'pose', 'camera', 'applied')
+
+    def __init__(self, method: RotationMethod, rotation, pose: Quaternion,
+                 camera: tuple = None, applied: bool = True):
+        self.method = method
+        self.rotation = rotation
+        self.pose = pose
+        self.camera = camera
+        self.applied = applied
+
+    def __repr__(self):
+        return f"RotationState({self.method.value}, {self.rotation}, pose={self.pose}, applied={self.applied})"
+
+    @staticmethod
+    def params(rotation) -> tuple:
+        # (parameter, indeks urutan) dengan panjang tetap empat
+        if isinstance(rotation, Quaternion):
+            return (rotation.w, rotation.x, rotation.y, rotation.z), 0
+        elif isinstance(rotation, EulerAngle):
+            order = EulerAngle.ROTATION_ORDERS.index(rotation.order)
+            return (rotation.x_angle, rotation.y_angle, rotation.z_angle, 0.0), order
+        elif isinstance(rotation, TaitBryan):
+            return (rotation.roll, rotation.pitch, rotation.yaw, 0.0), 0
+        elif isinstance(rotation, ExponentialMap):
+            omega = rotation.omega
+            return (omega.x, omega.y, omega.z, 0.0), 0
+        raise ValueError(f"Objek rotasi tidak didukung: {type(rotation).__name__}")
+
+    @staticmethod
+    def rotation_from_params(method: RotationMethod, params, order: int):
+        a, b, c, d = (float(value) for value in params)
+        if method == RotationMethod.QUATERNION:
+            return Quaternion(a, b, c, d)
+        elif method == RotationMethod.EULER_ANGLE:
+            return EulerAngle(a, b, c, EulerAngle.ROTATION_ORDERS[order])
+        elif method == RotationMethod.TAIT_BRYAN:
+            return TaitBryan(a, b, c)
+        return ExponentialMap(Vector3(a, b, c))
+
+    def write(self, record):
+        params, order = self.params(self.rotation)
+        record['method'] = _METHODS.index(self.method)
+        record['order'] = order
+        record['applied'] = self.applied
+        record['params'] = params
+        record['pose'] = (self.pose.w, self.pose.x, self.pose.y, self.pose.z)
+        record['camera'] = self.camera if self.camera is not None else (np.nan, np.nan, np.nan)
+
+    @classmethod
+    def read(cls, record) -> 'RotationState':
+        method = _METHODS[int(record['method'])]
+        camera = None if np.isnan(record['camera']).any() else tuple(float(v) for v in record['camera'])
+        return cls(
+            method,
+            cls.rotation_from_params(method, record['params'], int(record['order'])),
+            Quaternion(*(float(v) for v in record['pose'])),
+            camera,
+            bool(record['applied'])
+        )
+
+class RotationHistory:
+    # Stack undo/redo di atas satu array record berukuran tetap. State yang aktif ada di _index;
+    # push setelah undo membuang cabang redo, dan state tertua dibuang jika kapasitas penuh
+
+    def __init__(self, capacity: int = ROTATION_HISTORY_SIZE):
+        self.capacity = max(2, int(capacity))
+        self._states = np.zeros(self.capacity, dtype=STATE_DTYPE)
+        self._count = 0
+        self._index = -1
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        # Memori yang dipakai state tersimpan, bukan kapasitas
+        return self._count * STATE_DTYPE.itemsize
+
+    @property
+    def can_undo(self) -> bool:
+        return self._index > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._index < self._count - 1
+
+    def clear(self):
+        self._count = 0
+        self._index = -1
+
+    def push(self, state: RotationState):
+        count = self._index + 1
+        if count == self.capacity:
+            self._states[:-1] = self._states[1:]
+            count -= 1
+        state.write(self._states[count])
+        self._index = count
+        self._count = count + 1
+
+    def current(self) -> RotationState:
+        if self._index < 0:
+            return None
+        return RotationState.read(self._states[self._index])
+
+    def undo(self) -> RotationState:
+        if not self.can_undo:
+            return None
+        self._index -= 1
+        return self.current()
+
+    def redo(self) -> RotationState:
+        if not self.can_redo:
+            return None
+        self._index += 1
+        return self.current()
@@ -0,0 +1,79 @@
+import itertools
+import threading
+
+import numpy as np
+
+from .rotation_factory import RotationFactory, RotationMethod
+from .rotation_operator import RotationOperator
+from ..io.obj_loader import OBJData, Vertex
+from ...config.settings import ROTATION_CHUNK_SIZE
+from ...diagnostics.tracing import tracer
+
+class RotationCancelled(Exception):
+    pass
+
+class RotationJob:
+    # Satu permintaan rotasi mesh; dijalankan di thread worker, dibatalkan lewat cancel()
+    _ids = itertools.count(1)
+
+    def __init__(self, obj_data: OBJData, rotation_obj, method: RotationMethod, chunk_size: int = ROTATION_CHUNK_SIZE):
+        if not obj_data or not obj_data.vertices:
+            raise ValueError("OBJ data yang tersedia tidak valid atau tidak memiliki vertex.")
+
+        self.job_id = next(RotationJob._ids)
+        self.obj_data = obj_data
+        self.rotation_obj = rotation_obj
+        self.method = method
+        self.chunk_size = max(1, chunk_size)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def operator(self) -> RotationOperator:
+        # Operator jadi (misalnya dari perbandingan metode) tidak punya kunci cache
+        if isinstance(self.rotation_obj, RotationOperator):
+            return self.rotation_obj
+        return RotationFactory.get_operator(self.rotation_obj, self.method)
+
+    def run(self, progress=None) -> OBJData:
+        # progress(fraction) dipanggil setelah tiap chunk; pembatalan dicek di antara chunk
+        # sehingga job yang sudah usang berhenti tanpa menunggu seluruh mesh selesai
+        vertices = self.obj_data.vertices
+        count = len(vertices)
+
+        with tracer.span("RotationJob.run", "rotation", job=self.job_id, vertices=count):
+            operator = self.operator()
+            rotated = np.empty((count, 3), dtype=np.float64)
+
+            for start in range(0, count, self.chunk_size):
+                if self.cancelled:
+                    raise RotationCancelled(self.job_id)
+
+                chunk = vertices[start:start + self.chunk_size]
+                coords = np.fromiter(
+                    (c for vertex in chunk for c in (vertex.x, vertex.y, vertex.z)),
+                    dtype=np.float64, count=len(chunk) * 3
+                ).reshape(len(chunk), 3)
+                rotated[start:start + len(chunk)] = operator.rotate_array(coords)
+
+                if progress:
+                    progress(min(start + self.chunk_size, count) / count)
+
+            if self.cancelled:
+                raise RotationCancelled(self.job_id)
+
+            # Hasil tetap berupa array sampai semua chunk selesai, lalu list Vertex dibuat sekali;
+            # job yang dibatalkan tidak pernah membuat objek Python per vertex
+            x, y, z = rotated.T.tolist()
+            rotated_vertices = list(map(Vertex, x, y, z))
+
+            rotated_data = OBJData()
+            rotated_data.filename = f"{self.obj_data.filename}_rotated_{self.method.value}"
+            rotated_data.faces = self.obj_data.faces.copy()
+            rotated_data.vertices = rotated_vertices
+            return rotated_data
@@ -0,0 +1,105 @@
+import numpy as np
+
+from .vector3 import Vector3
+from .quaternion import Quaternion
+from ..io.obj_loader import Vertex
+
+class RotationOperator:
+    __slots__ = ('m00', 'm01', 'm02', 'm10', 'm11', 'm12', 'm20', 'm21', 'm22', '_array')
+
+    def __init__(self, matrix: list = None):
+        if matrix is None:
+            matrix = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+        (self.m00, self.m01, self.m02), (self.m10, self.m11, self.m12), (self.m20, self.m21, self.m22) = (
+            (float(row[0]), float(row[1]), float(row[2])) for row in matrix
+        )
+        self._array = None
+
+    def __str__(self):
+        return f"RotationOperator({self.as_matrix()})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    @classmethod
+    def from_quaternion(cls, quaternion: Quaternion) -> 'RotationOperator':
+        w, x, y, z = quaternion.w, quaternion.x, quaternion.y, quaternion.z
+
+        # q * v * q^-1 dalam bentuk matriks: (w^2 - |u|^2) I + 2 u u^T + 2 w [u]x
+        # Sama persis dengan dua perkalian Hamilton, termasuk untuk quaternion tidak unit
+        s = w * w - x * x - y * y - z * z
+        return cls([
+            [s + 2 * x * x, 2 * (x * y - w * z), 2 * (x * z + w * y)],
+            [2 * (x * y + w * z), s + 2 * y * y, 2 * (y * z - w * x)],
+            [2 * (x * z - w * y), 2 * (y * z + w * x), s + 2 * z * z]
+        ])
+
+    @classmethod
+    def from_matrix(cls, matrix) -> 'RotationOperator':
+        return cls(matrix)
+
+    @classmethod
+    def from_rotation(cls, rotation_obj) -> 'RotationOperator':
+        if isinstance(rotation_obj, RotationOperator):
+            return rotation_obj
+        if isinstance(rotation_obj, Quaternion):
+            return cls.from_quaternion(rotation_obj)
+        if hasattr(rotation_obj, 'to_rotation_matrix'):
+            return cls(rotation_obj.to_rotation_matrix())
+
+        raise ValueError(f"Objek rotasi tidak didukung: {type(rotation_obj).__name__}")
+
+    def as_matrix(self) -> list:
+        return [
+            [self.m00, self.m01, self.m02],
+            [self.m10, self.m11, self.m12],
+            [self.m20, self.m21, self.m22]
+        ]
+
+    def as_array(self) -> np.ndarray:
+        # Matriks numpy dibuat sekali lalu disimpan
+        if self._array is None:
+            self._array = np.array(self.as_matrix(), dtype=np.float64)
+            self._array.setflags(write=False)
+        return self._array
+
+    def rotate_xyz(self, x: float, y: float, z: float) -> tuple:
+        return (
+            self.m00 * x + self.m01 * y + self.m02 * z,
+            self.m10 * x + self.m11 * y + self.m12 * z,
+            self.m20 * x + self.m21 * y + self.m22 * z
+        )
+
+    def rotate_vector(self, vector: Vector3) -> Vector3:
+        x, y, z = vector.x, vector.y, vector.z
+        return Vector3(
+            self.m00 * x + self.m01 * y + self.m02 * z,
+            self.m10 * x + self.m11 * y + self.m12 * z,
+            self.m20 * x + self.m21 * y + self.m22 * z
+        )
+
+    def rotate_array(self, points, out: np.ndarray = None) -> np.ndarray:
+        points = np.asarray(points)
+        if points.shape[-1] != 3:
+            raise ValueError(f"Bentuk array tidak valid: {points.shape}, dimensi akhir harus 3")
+
+        matrix = self.as_array()
+        if np.issubdtype(points.dtype, np.floating) and points.dtype != matrix.dtype:
+            matrix = matrix.astype(points.dtype)
+
+        # p' = p * R^T untuk setiap baris
+        return np.matmul(points, matrix.T, out=out)
+
+    def rotate_vertices(self, vertices: list) -> list:
+        count = len(vertices)
+        if count == 0:
+            return []
+
+        coords = np.fromiter(
+            (c for vertex in vertices for c in (vertex.x, vertex.y, vertex.z)),
+            dtype=np.float64, count=count * 3
+        ).reshape(count, 3)
+
+        rotated = self.rotate_array(coords)
+        return [Vertex(x, y, z) for x, y, z in rotated.tolist()]
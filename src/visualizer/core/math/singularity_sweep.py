@@ -0,0 +1,211 @@
+import time
+import itertools
+import threading
+
+import numpy as np
+
+from .euler_angle import EulerAngle
+from .rotation_conversion import RotationConversion
+from .rotation_job import RotationCancelled
+from ...config.settings import SWEEP_STEP_DEGREES, SWEEP_CHUNK_SAMPLES, SWEEP_MAX_SAMPLES
+from ...diagnostics.tracing import tracer
+
+TAIT_BRYAN = "Tait-Bryan"
+
+class SweepResult:
+    # Hasil sapuan pada grid (sudut pertama, tengah, terakhir) sesuai urutan penerapan rotasi.
+    # Error disimpan sebagai float32 (N_first, N_middle, N_last) agar grid jutaan sampel tetap ringan.
+
+    def __init__(self, convention: str, axis_names: tuple, first, middle, last,
+                 condition, parameter_error, rotation_error, elapsed_s: float = 0.0):
+        self.convention = convention
+        self.axis_names = axis_names
+        self.first = first
+        self.middle = middle
+        self.last = last
+        self.condition = condition
+        self.parameter_error = parameter_error
+        self.rotation_error = rotation_error
+        self.elapsed_s = elapsed_s
+
+    @property
+    def samples(self) -> int:
+        return self.parameter_error.size
+
+    def condition_map(self) -> np.ndarray:
+        # Kondisi Jacobian hanya bergantung pada sudut tengah; disebar ke (N_middle, N_first)
+        return np.broadcast_to(self.condition[:, None], (len(self.middle), len(self.first)))
+
+    def error_map(self, name: str) -> np.ndarray:
+        # Error terburuk atas sudut terakhir: (N_middle, N_first)
+        errors = self.parameter_error if name == "parameter" else self.rotation_error
+        return errors.max(axis=2).T
+
+    def arrays(self) -> dict:
+        return {
+            'first': self.first,
+            'middle': self.middle,
+            'last': self.last,
+            'condition': self.condition,
+            'parameter_error': self.parameter_error,
+            'rotation_error': self.rotation_error
+        }
+
+    def save(self, path):
+        # Sumbu dan konvensi ikut disimpan agar file bisa dibaca tanpa aplikasi
+        np.savez_compressed(
+            path, convention=np.array(self.convention), axis_names=np.array(self.axis_names), **self.arrays()
+        )
+
+    def summary(self, condition_limit: float = 100.0, tolerance_degrees: float = 1e-6) -> str:
+        middle_name = self.axis_names[1]
+        info = f"Sweep {self.convention}: {self.samples:,} samples in {self.elapsed_s:.2f} s\n"
+
+        finite = np.isfinite(self.condition)
+        info += f"Max finite condition: {self.condition[finite].max():.3g}\n"
+        ill = self.middle[~finite | (self.condition > condition_limit)]
+        if len(ill):
+            info += f"Condition > {condition_limit:g} at |{middle_name}| >= {np.abs(ill).min():.1f}°\n"
+
+        # Sudut tengah terkecil di mana round-trip parameter mulai gagal
+        failed = self.parameter_error > tolerance_degrees
+        if failed.any():
+            failed_middle = self.middle[failed.any(axis=(0, 2))]
+            info += (f"Parameter error > {tolerance_degrees:g}°: {failed.mean():.2%} of samples, "
+                     f"at |{middle_name}| >= {np.abs(failed_middle).min():.1f}° (max {self.parameter_error.max():.3g}°)\n")
+        else:
+            info += f"Parameter error within {tolerance_degrees:g}° everywhere\n"
+        info += f"Rotation round-trip error: max {self.rotation_error.max():.3g}°\n"
+        return info
+
+class SingularitySweep:
+    # Sapuan padat sudut Euler/Tait-Bryan: kondisi Jacobian laju sudut -> kecepatan sudut dan
+    # error round-trip sudut -> quaternion -> sudut. Dijalankan per chunk seperti RotationJob.
+    CONVENTIONS = tuple(EulerAngle.ROTATION_ORDERS) + (TAIT_BRYAN,)
+    _ids = itertools.count(1)
+
+    def __init__(self, convention: str = "XYZ", step_degrees: float = SWEEP_STEP_DEGREES,
+                 chunk_size: int = SWEEP_CHUNK_SAMPLES, max_samples: int = SWEEP_MAX_SAMPLES):
+        if convention not in self.CONVENTIONS:
+            raise ValueError(f"Konvensi tidak valid, harus salah satu dari {self.CONVENTIONS}")
+        if step_degrees <= 0:
+            raise ValueError("Langkah sapuan harus lebih besar dari nol.")
+
+        self.job_id = next(SingularitySweep._ids)
+        self.convention = convention
+        self.step_degrees = float(step_degrees)
+        self.chunk_size = max(1, int(chunk_size))
+        self._cancelled = threading.Event()
+
+        # Tait-Bryan (roll, pitch, yaw) sama dengan Euler XYZ
+        self.order = "XYZ" if convention == TAIT_BRYAN else convention
+        self.axes = RotationConversion._order_axes(self.order)[:3]
+        if convention == TAIT_BRYAN:
+            self.axis_names = ("roll", "pitch", "yaw")
+        else:
+            self.axis_names = tuple(self.order)
+
+        # Sudut tengah dibatasi ke rentang utamanya [-90, 90]; singularitas ada di kedua ujung
+        count = int(round(360.0 / self.step_degrees))
+        self.first = np.linspace(-180.0, 180.0, count, endpoint=False)
+        self.middle = np.linspace(-90.0, 90.0, int(round(180.0 / self.step_degrees)) + 1)
+        self.last = self.first.copy()
+
+        # Peta error disimpan penuh (dua float32 per sampel); np.empty yang terlalu besar berhasil
+        # secara lazy di Linux lalu proses di-OOM-kill di tengah sapuan, jadi tolak sejak awal
+        if self.samples > max_samples:
+            raise ValueError(
+                f"Langkah {self.step_degrees:g}° menghasilkan {self.samples:,} sampel, "
+                f"melebihi batas {max_samples:,}; gunakan langkah yang lebih besar."
+            )
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def samples(self) -> int:
+        return len(self.first) * len(self.middle) * len(self.last)
+
+    def _to_quaternion(self, angles: np.ndarray) -> np.ndarray:
+        if self.convention == TAIT_BRYAN:
+            return RotationConversion.tait_bryan_to_quaternion(angles)
+        return RotationConversion.euler_to_quaternion(angles, self.order)
+
+    def _from_quaternion(self, q: np.ndarray) -> np.ndarray:
+        if self.convention == TAIT_BRYAN:
+            return RotationConversion.quaternion_to_tait_bryan(q)
+        return RotationConversion.quaternion_to_euler(q, self.order)
+
+    def condition_numbers(self) -> np.ndarray:
+        # R = R_k(c) R_j(b) R_i(a), kecepatan sudut w = J [a', b', c'] dengan
+        # J = R_k(c) [R_j(b) e_i, e_j, e_k]. R_k(c) ortogonal dan kolom e_i tidak bergantung
+        # pada a, jadi nilai singular J cukup dihitung untuk tiap sudut tengah b
+        i, j, k = self.axes
+        b = np.radians(self.middle)
+        cos_b, sin_b = np.cos(b), np.sin(b)
+
+        # R_j(b) e_i lewat rumus Rodrigues: e_i cos b + (e_j x e_i) sin b (e_i tegak lurus e_j)
+        e = np.eye(3)
+        rotated_first = np.outer(cos_b, e[i]) + np.outer(sin_b, np.cross(e[j], e[i]))
+        jacobian = np.empty((len(b), 3, 3))
+        jacobian[:, :, 0] = rotated_first
+        jacobian[:, :, 1] = e[j]
+        jacobian[:, :, 2] = e[k]
+
+        singular = np.linalg.svd(jacobian, compute_uv=False)
+        with np.errstate(divide='ignore'):
+            condition = singular[:, 0] / singular[:, -1]
+        # Di titik singular nilai singular terkecil tinggal sisa pembulatan
+        return np.where(singular[:, -1] > 1e-12, condition, np.inf)
+
+    def run(self, progress=None) -> SweepResult:
+        # progress(fraction) dipanggil setelah tiap chunk; pembatalan dicek di antara chunk
+        i, j, k = self.axes
+        first, middle, last = self.first, self.middle, self.last
+        shape = (len(first), len(middle), len(last))
+        started = time.perf_counter()
+
+        with tracer.span("SingularitySweep.run", "rotation", convention=self.convention, samples=self.samples):
+            condition = self.condition_numbers()
+            parameter_error = np.empty(shape, dtype=np.float32)
+            rotation_error = np.empty(shape, dtype=np.float32)
+
+            # Satu chunk berisi beberapa baris sudut pertama (grid penuh sudut tengah x terakhir)
+            rows = max(1, self.chunk_size // (shape[1] * shape[2]))
+            for start in range(0, shape[0], rows):
+                if self.cancelled:
+                    raise RotationCancelled(self.job_id)
+
+                block = first[start:start + rows]
+                angles = np.empty((len(block),) + shape[1:] + (3,))
+                angles[..., i] = block[:, None, None]
+                angles[..., j] = middle[None, :, None]
+                angles[..., k] = last[None, None, :]
+
+                q = self._to_quaternion(angles)
+                recovered = self._from_quaternion(q)
+                q_recovered = self._to_quaternion(recovered)
+
+                # Selisih sudut dibungkus ke (-180, 180]; besar di dekat gimbal lock karena sudut
+                # pertama dan terakhir tidak lagi bisa dipisahkan
+                difference = np.abs((recovered - angles + 180.0) % 360.0 - 180.0)
+                parameter_error[start:start + len(block)] = difference.max(axis=-1)
+
+                # Sudut geodesik antar quaternion, aman terhadap tanda: 4 * atan2(|q - q'|, |q + q'|)
+                minus = np.linalg.norm(q - q_recovered, axis=-1)
+                plus = np.linalg.norm(q + q_recovered, axis=-1)
+                rotation_error[start:start + len(block)] = np.degrees(
+                    4.0 * np.arctan2(np.minimum(minus, plus), np.maximum(minus, plus))
+                )
+
+                if progress:
+                    progress(min(start + rows, shape[0]) / shape[0])
+
+        return SweepResult(
+            self.convention, self.axis_names, first, middle, last,
+            condition, parameter_error, rotation_error, time.perf_counter() - started
+        )
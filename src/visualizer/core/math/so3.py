@@ -0,0 +1,192 @@
+import numpy as np
+
+from .rotation_conversion import RotationConversion
+
+# Di bawah sudut ini (radian) koefisien Rodrigues dan Jacobian memakai deret Taylor.
+# Rumus tertutupnya kehilangan presisi sekitar eps / theta^2 karena pengurangan yang saling meniadakan;
+# suku hingga theta^4 menyisakan error orde theta^6, jauh di bawah eps pada batas ini
+_TAYLOR_THRESHOLD = 1e-2
+
+# Batas iterasi Karcher mean; konvergensi biasanya tercapai dalam beberapa langkah
+_KARCHER_MAX_ITERATIONS = 32
+_KARCHER_TOLERANCE = 1e-12
+
+class SO3:
+    # Operasi grup Lie SO(3) dalam batch. Vektor tangen (..., 3) adalah exponential map
+    # (axis * sudut, radian, sama dengan ExponentialMap.omega); matriks (..., 3, 3);
+    # quaternion (..., 4) dengan urutan (w, x, y, z)
+
+    @staticmethod
+    def _angle_terms(omega) -> tuple:
+        omega = RotationConversion._as_array(omega, (3,))
+        theta_sq = np.sum(omega * omega, axis=-1)
+        theta = np.sqrt(theta_sq)
+        small = theta < _TAYLOR_THRESHOLD
+        safe_theta = np.where(small, 1.0, theta)
+        return omega, theta, theta_sq, small, safe_theta
+
+    @staticmethod
+    def hat(omega) -> np.ndarray:
+        # Vektor (..., 3) ke matriks skew-symmetric (..., 3, 3), seperti get_so3_matrix
+        omega = RotationConversion._as_array(omega, (3,))
+        x, y, z = omega[..., 0], omega[..., 1], omega[..., 2]
+        zero = np.zeros_like(x)
+        return np.stack([
+            zero, -z, y,
+            z, zero, -x,
+            -y, x, zero
+        ], axis=-1).reshape(omega.shape[:-1] + (3, 3))
+
+    @staticmethod
+    def vee(matrix) -> np.ndarray:
+        # Kebalikan hat; bagian simetris (jika ada) diabaikan
+        K = RotationConversion._as_array(matrix, (3, 3))
+        return 0.5 * np.stack([
+            K[..., 2, 1] - K[..., 1, 2],
+            K[..., 0, 2] - K[..., 2, 0],
+            K[..., 1, 0] - K[..., 0, 1]
+        ], axis=-1)
+
+    # Exp / Log
+
+    @staticmethod
+    def exp(omega) -> np.ndarray:
+        # Rodrigues: R = I + A K + B K^2, A = sin(t)/t, B = (1 - cos(t))/t^2
+        omega, theta, theta_sq, small, safe_theta = SO3._angle_terms(omega)
+        A = np.where(small, 1.0 - theta_sq / 6.0 + theta_sq * theta_sq / 120.0, np.sin(theta) / safe_theta)
+        B = np.where(
+            small, 0.5 - theta_sq / 24.0 + theta_sq * theta_sq / 720.0,
+            (1.0 - np.cos(safe_theta)) / (safe_theta * safe_theta)
+        )
+
+        K = SO3.hat(omega)
+        identity = np.eye(3, dtype=omega.dtype)
+        return identity + A[..., None, None] * K + B[..., None, None] * np.matmul(K, K)
+
+    @staticmethod
+    def log(matrix) -> np.ndarray:
+        # Lewat quaternion (Shepperd + atan2) agar tetap stabil di dekat 0 dan pi,
+        # tempat rumus acos((trace - 1) / 2) kehilangan presisi
+        return RotationConversion.quaternion_to_exp_map(RotationConversion.matrix_to_quaternion(matrix))
+
+    @staticmethod
+    def exp_quaternion(omega) -> np.ndarray:
+        return RotationConversion.exp_map_to_quaternion(omega)
+
+    @staticmethod
+    def log_quaternion(q) -> np.ndarray:
+        # q dan -q menghasilkan vektor yang sama (sudut di [0, pi])
+        return RotationConversion.quaternion_to_exp_map(q)
+
+    # Komposisi di ruang tangen
+
+    @staticmethod
+    def compose(a, b) -> np.ndarray:
+        # log(exp(a) exp(b)): rotasi b diterapkan lebih dulu, sama seperti perkalian matriks
+        q = RotationConversion.quaternion_multiply(SO3.exp_quaternion(a), SO3.exp_quaternion(b))
+        return SO3.log_quaternion(q)
+
+    @staticmethod
+    def inverse(omega) -> np.ndarray:
+        return -RotationConversion._as_array(omega, (3,))
+
+    @staticmethod
+    def between(a, b) -> np.ndarray:
+        # log(exp(a)^-1 exp(b)): rotasi relatif dari a ke b dalam frame lokal a
+        return SO3.compose(SO3.inverse(a), b)
+
+    @staticmethod
+    def retract(q, delta) -> np.ndarray:
+        # q * exp(delta): perturbasi kanan seperti yang dipakai estimator (EKF, optimisasi)
+        return RotationConversion.normalize_quaternion(
+            RotationConversion.quaternion_multiply(q, SO3.exp_quaternion(delta))
+        )
+
+    # Jacobian
+
+    @staticmethod
+    def _jacobian_terms(theta, theta_sq, small, safe_theta) -> tuple:
+        # B = (1 - cos t)/t^2, C = (t - sin t)/t^3
+        B = np.where(
+            small, 0.5 - theta_sq / 24.0 + theta_sq * theta_sq / 720.0,
+            (1.0 - np.cos(safe_theta)) / (safe_theta * safe_theta)
+        )
+        C = np.where(
+            small, 1.0 / 6.0 - theta_sq / 120.0 + theta_sq * theta_sq / 5040.0,
+            (safe_theta - np.sin(safe_theta)) / (safe_theta * safe_theta * safe_theta)
+        )
+        return B, C
+
+    @staticmethod
+    def left_jacobian(omega) -> np.ndarray:
+        # J_l = I + B K + C K^2; exp(a + d) ~ exp(J_l(a) d) exp(a)
+        omega, theta, theta_sq, small, safe_theta = SO3._angle_terms(omega)
+        B, C = SO3._jacobian_terms(theta, theta_sq, small, safe_theta)
+        K = SO3.hat(omega)
+        identity = np.eye(3, dtype=omega.dtype)
+        return identity + B[..., None, None] * K + C[..., None, None] * np.matmul(K, K)
+
+    @staticmethod
+    def right_jacobian(omega) -> np.ndarray:
+        # J_r(a) = J_l(-a); exp(a + d) ~ exp(a) exp(J_r(a) d)
+        return SO3.left_jacobian(SO3.inverse(omega))
+
+    @staticmethod
+    def left_jacobian_inverse(omega) -> np.ndarray:
+        # J_l^-1 = I - K/2 + D K^2, D = 1/t^2 - (1 + cos t) / (2 t sin t).
+        # Tidak terdefinisi di t = 2 pi, tetapi exponential map dari log selalu |t| <= pi
+        omega, theta, theta_sq, small, safe_theta = SO3._angle_terms(omega)
+        D = np.where(
+            small, 1.0 / 12.0 + theta_sq / 720.0 + theta_sq * theta_sq / 30240.0,
+            1.0 / (safe_theta * safe_theta)
+            - (1.0 + np.cos(safe_theta)) / (2.0 * safe_theta * np.sin(safe_theta))
+        )
+        K = SO3.hat(omega)
+        identity = np.eye(3, dtype=omega.dtype)
+        return identity - 0.5 * K + D[..., None, None] * np.matmul(K, K)
+
+    @staticmethod
+    def right_jacobian_inverse(omega) -> np.ndarray:
+        return SO3.left_jacobian_inverse(SO3.inverse(omega))
+
+    # Jarak dan rata-rata
+
+    @staticmethod
+    def geodesic_distance(q0, q1) -> np.ndarray:
+        # Sudut rotasi relatif (radian) di [0, pi], aman terhadap tanda q / -q.
+        # Bentuk atan2 dari |q0 - q1| dan |q0 + q1| akurat juga untuk sudut sangat kecil
+        q0 = RotationConversion.normalize_quaternion(q0)
+        q1 = RotationConversion.normalize_quaternion(q1)
+        minus = np.linalg.norm(q0 - q1, axis=-1)
+        plus = np.linalg.norm(q0 + q1, axis=-1)
+        return 4.0 * np.arctan2(np.minimum(minus, plus), np.maximum(minus, plus))
+
+    @staticmethod
+    def karcher_mean(quats, weights=None, initial=None, max_iterations: int = _KARCHER_MAX_ITERATIONS,
+                     tolerance: float = _KARCHER_TOLERANCE) -> np.ndarray:
+        # Rata-rata Riemannian (Karcher/Frechet): minimalkan jumlah kuadrat jarak geodesik.
+        # Iterasi Gauss-Newton: mean <- mean * exp(rata-rata log(mean^-1 q_i))
+        quats = RotationConversion.normalize_quaternion(np.asarray(quats).reshape(-1, 4))
+        if len(quats) == 0:
+            raise ValueError("Tidak ada quaternion untuk dirata-rata.")
+
+        if weights is None:
+            weights = np.full(len(quats), 1.0 / len(quats), dtype=quats.dtype)
+        else:
+            weights = np.asarray(weights, dtype=quats.dtype).reshape(-1)
+            weights = weights / weights.sum()
+
+        if initial is None:
+            # Rata-rata kordal setelah tanda disamakan dengan sampel pertama
+            signs = np.where(quats @ quats[0] < 0, -1.0, 1.0)
+            initial = (weights * signs) @ quats
+        mean = RotationConversion.normalize_quaternion(initial)
+
+        inverse = np.array([1.0, -1.0, -1.0, -1.0], dtype=quats.dtype)
+        for _ in range(max_iterations):
+            tangent = SO3.log_quaternion(RotationConversion.quaternion_multiply(mean * inverse, quats))
+            step = weights @ tangent
+            mean = SO3.retract(mean, step)
+            if np.linalg.norm(step) < tolerance:
+                break
+        return RotationConversion.canonicalize_quaternion(mean)
@@ -3,10 +3,14 @@ from .vector3 import Vector3
 from .quaternion import Quaternion
 
 class TaitBryan:
+    __slots__ = ('roll', 'pitch', 'yaw', '_operator', '_operator_params')
+
     def __init__(self, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0):
         self.roll = roll # Roll (X-axis rotation)
         self.pitch = pitch # Pitch (Y-axis rotation)
         self.yaw = yaw # Yaw (Z-axis rotation)
+        self._operator = None
+        self._operator_params = None
     
     def __str__(self):
         return f"TaitBryan(roll={self.roll:.3f}, pitch={self.pitch:.3f}, yaw={self.yaw:.3f})"
@@ -36,24 +40,25 @@ class TaitBryan:
         ]
         return R
 
-    def _apply_matrix(self, matrix: list, vector: Vector3) -> Vector3:
-        x = matrix[0][0] * vector.x + matrix[0][1] * vector.y + matrix[0][2] * vector.z
-        y = matrix[1][0] * vector.x + matrix[1][1] * vector.y + matrix[1][2] * vector.z
-        z = matrix[2][0] * vector.x + matrix[2][1] * vector.y + matrix[2][2] * vector.z
-        return Vector3(x, y, z)
-    
     def rotate_vector(self, vector: Vector3) -> Vector3:
         if vector.magnitude() == 0:
             return Vector3(0, 0, 0)
 
-        rotation_matrix = self.to_rotation_matrix()
-        return self._apply_matrix(rotation_matrix, vector)
+        return self.operator().rotate_vector(vector)
+
+    def operator(self) -> 'RotationOperator':
+        params = (self.roll, self.pitch, self.yaw)
+        if self._operator is None or self._operator_params != params:
+            from .rotation_factory import RotationFactory
+            self._operator = RotationFactory.get_operator(self)
+            self._operator_params = params
+        return self._operator
     
     def get_rotation_sequence(self) -> list:
         return [
-            (Vector3(0, 0, 1), self.yaw, "Yaw"),
-            (Vector3(1, 0, 0), self.pitch, "Pitch"),
-            (Vector3(0, 1, 0), self.roll, "Roll")
+            (Vector3.UNIT_Z, self.yaw, "Yaw"),
+            (Vector3.UNIT_X, self.pitch, "Pitch"),
+            (Vector3.UNIT_Y, self.roll, "Roll")
         ]
     
     def to_quaternion(self) -> Quaternion:
@@ -78,6 +83,11 @@ class TaitBryan:
 
         return Quaternion(w, x, y, z)
     
+    @classmethod
+    def from_quaternion(cls, quaternion: Quaternion) -> 'TaitBryan':
+        from .rotation_conversion import RotationConversion
+        return RotationConversion.from_quaternion(quaternion, "tait_bryan")
+
     def get_aircraft_orientation(self) -> dict:
         return {
             "roll": f"{self.roll:.1f}° {'left' if self.roll < 0 else 'right'}",
@@ -1,10 +1,8 @@
 import math
-import sys
-import os
-
-from ..io.obj_loader import Vertex
 
 class Vector3:
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.x = x
         self.y = y
@@ -41,6 +39,8 @@ class Vector3:
         return Vector3(vertex.x, vertex.y, vertex.z)
     
     def to_vertex(self):
+        # Import lokal agar membuat vektor tidak ikut memuat modul I/O
+        from ..io.obj_loader import Vertex
         return Vertex(self.x, self.y, self.z)
     
     def cross(self, other):
@@ -48,4 +48,28 @@ class Vector3:
             self.y * other.z - self.z * other.y,
             self.z * other.x - self.x * other.z,
             self.x * other.y - self.y * other.x
-        )
\ No newline at end of file
+        )
+
+class _FrozenVector3(Vector3):
+    # Vector3 read-only untuk konstanta bersama; operasi aritmetika tetap mengembalikan Vector3 biasa
+    __slots__ = ()
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Konstanta {self} tidak boleh diubah, buat Vector3 baru.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Konstanta {self} tidak boleh diubah, buat Vector3 baru.")
+
+    def __reduce__(self):
+        return (type(self), (self.x, self.y, self.z))
+
+# Konstanta bersama, read-only agar tidak bisa diubah lewat objek yang dikembalikan
+Vector3.ZERO = _FrozenVector3(0.0, 0.0, 0.0)
+Vector3.UNIT_X = _FrozenVector3(1.0, 0.0, 0.0)
+Vector3.UNIT_Y = _FrozenVector3(0.0, 1.0, 0.0)
+Vector3.UNIT_Z = _FrozenVector3(0.0, 0.0, 1.0)
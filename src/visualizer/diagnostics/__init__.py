@@ -0,0 +1,21 @@
+from .tracing import Tracer, Span, tracer, traced
+from .profiler import Profiler, StackSampler, profiler, profile_duration_from_env
+from .log import RateLimitFilter, get_logger, setup_logging, shutdown_logging
+from .startup import StartupTimer, startup_timer
+
+__all__ = [
+    "Tracer",
+    "Span",
+    "tracer",
+    "traced",
+    "Profiler",
+    "StackSampler",
+    "profiler",
+    "profile_duration_from_env",
+    "RateLimitFilter",
+    "get_logger",
+    "setup_logging",
+    "shutdown_logging",
+    "StartupTimer",
+    "startup_timer"
+]
@@ -0,0 +1,117 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from pathlib import Path
+
+from ..config.paths import LOGS_DIR
+from ..config.settings import (
+    LOG_LEVEL, LOG_CONSOLE_LEVEL, LOG_FILE_NAME, LOG_MAX_BYTES, LOG_BACKUP_COUNT,
+    LOG_RATE_LIMIT_BURST, LOG_RATE_LIMIT_INTERVAL_S
+)
+
+# Semua logger aplikasi berada di bawah namespace ini
+ROOT_LOGGER_NAME = "visualizer"
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s"
+
+class RateLimitFilter(logging.Filter):
+    # Batasi pesan yang sama (logger + template pesan) menjadi `burst` record per interval.
+    # Jumlah yang dibuang dilaporkan pada record berikutnya yang lolos.
+
+    def __init__(self, burst: int = LOG_RATE_LIMIT_BURST, interval_s: float = LOG_RATE_LIMIT_INTERVAL_S):
+        super().__init__()
+        self.burst = burst
+        self.interval_s = interval_s
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+
+        with self._lock:
+            window_start, count, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - window_start >= self.interval_s:
+                window_start, count = now, 0
+
+            if count >= self.burst:
+                self._windows[key] = (window_start, count, suppressed + 1)
+                return False
+
+            self._windows[key] = (window_start, count + 1, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed:,} similar messages suppressed)"
+        return True
+
+class _LoggingState:
+    listener = None
+    queue_handler = None
+
+def get_logger(name: str) -> logging.Logger:
+    # Nama modul (__name__) dipetakan ke namespace visualizer.*
+    if name.startswith("src."):
+        name = name[len("src."):]
+    if not name.startswith(ROOT_LOGGER_NAME):
+        name = f"{ROOT_LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
+
+def setup_logging(log_dir: Path = LOGS_DIR, level: str = LOG_LEVEL, console_level: str = LOG_CONSOLE_LEVEL) -> Path:
+    # Record dimasukkan ke queue di thread pemanggil; penulisan file dan console
+    # dilakukan QueueListener di thread terpisah agar GUI tidak terblokir I/O
+    if _LoggingState.listener is not None:
+        return Path(log_dir) / LOG_FILE_NAME
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / LOG_FILE_NAME
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(level)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(console_level)
+
+    record_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(record_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    logger.setLevel(level)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(
+        record_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    _LoggingState.listener = listener
+    _LoggingState.queue_handler = queue_handler
+    atexit.register(shutdown_logging)
+    return log_path
+
+def shutdown_logging():
+    # Kosongkan queue lalu tutup handler
+    listener = _LoggingState.listener
+    if listener is None:
+        return
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    logger.removeHandler(_LoggingState.queue_handler)
+    logger.propagate = True
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    _LoggingState.listener = None
+    _LoggingState.queue_handler = None
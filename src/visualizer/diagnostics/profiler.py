@@ -0,0 +1,115 @@
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from ..config.paths import LOGS_DIR
+from ..config.settings import PROFILE_DURATION_S, PROFILE_SAMPLE_INTERVAL_MS
+
+# Variabel environment untuk memulai profiling saat aplikasi dibuka
+PROFILE_ENV_VAR = "VISUALIZER_PROFILE"
+
+class StackSampler:
+    # Sampler stack berbiaya rendah: thread terpisah membaca frame thread target
+    # secara berkala dan menghitung stack yang sama (format collapsed untuk flamegraph)
+
+    def __init__(self, thread_id: int, interval_ms: float = PROFILE_SAMPLE_INTERVAL_MS):
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000.0
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            # Format collapsed: root lebih dulu, dipisah titik koma
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def write_collapsed(self, file_path):
+        with open(file_path, 'w') as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+class Profiler:
+    def __init__(self, output_dir: Path = LOGS_DIR, sample_interval_ms: float = PROFILE_SAMPLE_INTERVAL_MS):
+        self.output_dir = Path(output_dir)
+        self.sample_interval_ms = sample_interval_ms
+        self._profile = None
+        self._sampler = None
+        self._started_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    def start(self):
+        # Harus dipanggil dari thread yang ingin diprofil (thread GUI / event loop Qt)
+        if self.running:
+            return
+        self._sampler = StackSampler(threading.get_ident(), self.sample_interval_ms)
+        self._sampler.start()
+        self._profile = cProfile.Profile()
+        self._started_at = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self) -> dict:
+        # Simpan pstats dan collapsed stack, kembalikan path file yang ditulis
+        if not self.running:
+            return {}
+
+        self._profile.disable()
+        self._sampler.stop()
+        elapsed = time.perf_counter() - self._started_at
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.output_dir / f"profile-{time.strftime('%Y%m%d-%H%M%S')}"
+        paths = {
+            'pstats': stem.with_suffix('.pstats'),
+            'collapsed': stem.with_suffix('.collapsed.txt')
+        }
+        self._profile.dump_stats(str(paths['pstats']))
+        self._sampler.write_collapsed(paths['collapsed'])
+
+        paths['duration'] = elapsed
+        paths['samples'] = sum(self._sampler.samples.values())
+        self._profile = None
+        self._sampler = None
+        return paths
+
+def profile_duration_from_env(environ=None) -> float:
+    # VISUALIZER_PROFILE=1 memakai durasi default, angka lain = durasi dalam detik
+    value = (environ if environ is not None else os.environ).get(PROFILE_ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return float(PROFILE_DURATION_S)
+    try:
+        return float(value)
+    except ValueError:
+        return float(PROFILE_DURATION_S)
+
+# Profiler global untuk hotkey, flag CLI dan variabel environment
+profiler = Profiler()
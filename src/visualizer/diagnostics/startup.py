@@ -0,0 +1,44 @@
+import time
+
+from .tracing import tracer
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+class StartupTimer:
+    # Mencatat durasi tiap fase startup (import, QApplication, window, frame pertama)
+
+    def __init__(self):
+        self.origin_ns = time.perf_counter_ns()
+        self.phases = [] # (nama, start_ns, end_ns)
+        self._last_ns = self.origin_ns
+
+    def mark(self, phase: str, **args):
+        # Fase berakhir saat mark dipanggil dan dimulai di akhir fase sebelumnya
+        now = time.perf_counter_ns()
+        self.phases.append((phase, self._last_ns, now))
+        tracer.record(f"startup.{phase}", "startup", self._last_ns, now, args or None)
+        self._last_ns = now
+        return (now - self.origin_ns) / 1e6
+
+    def has_phase(self, phase: str) -> bool:
+        return any(name == phase for name, _, _ in self.phases)
+
+    def elapsed_ms(self) -> float:
+        return (self._last_ns - self.origin_ns) / 1e6
+
+    def summary(self) -> dict:
+        # Durasi per fase dalam milidetik, ditambah total sejak timer dibuat
+        phases = {name: (end - start) / 1e6 for name, start, end in self.phases}
+        phases['total'] = self.elapsed_ms()
+        return phases
+
+    def report(self):
+        summary = self.summary()
+        logger.info("Startup %.1f ms: %s", summary['total'], ", ".join(
+            f"{name} {duration:.1f} ms" for name, duration in summary.items() if name != 'total'
+        ))
+        return summary
+
+# Dibuat saat modul pertama kali diimport; main.py mengimportnya sebelum PySide6
+startup_timer = StartupTimer()
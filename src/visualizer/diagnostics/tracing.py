@@ -0,0 +1,136 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from ..config.settings import TRACE_BUFFER_SIZE
+
+class _NullSpan:
+    # Span kosong yang dipakai saat tracing mati, tidak mencatat apa pun
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.tracer.record(self.name, self.category, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+class Tracer:
+    # Perekam span dengan ring buffer; event lama dibuang saat buffer penuh
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE):
+        self.enabled = False
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity)
+        self._threads = {}
+        self._started_at = None
+
+    def start(self):
+        self.clear()
+        self._started_at = time.perf_counter_ns()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def clear(self):
+        self._events.clear()
+        self._threads.clear()
+
+    def __len__(self):
+        return len(self._events)
+
+    def span(self, name: str, category: str = "app", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args or None)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, args: dict = None):
+        # Dipanggil dari thread mana pun; deque.append atomik di CPython
+        if not self.enabled:
+            return
+        thread_id = threading.get_ident()
+        if thread_id not in self._threads:
+            self._threads[thread_id] = threading.current_thread().name
+        self._events.append((name, category, start_ns, end_ns - start_ns, thread_id, args))
+
+    def instant(self, name: str, category: str = "app", **args):
+        now = time.perf_counter_ns()
+        self.record(name, category, now, now, args or None)
+
+    def to_chrome_trace(self) -> dict:
+        pid = os.getpid()
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'Quaternion Visualizer'}}
+        ]
+        for thread_id, thread_name in list(self._threads.items()):
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name}})
+
+        # Timestamp Chrome trace dalam mikrodetik
+        for name, category, start_ns, duration_ns, thread_id, args in list(self._events):
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': start_ns / 1000.0,
+                'dur': duration_ns / 1000.0,
+                'pid': pid,
+                'tid': thread_id
+            }
+            if args:
+                event['args'] = {key: _json_value(value) for key, value in args.items()}
+            events.append(event)
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, file_path) -> int:
+        trace = self.to_chrome_trace()
+        with open(file_path, 'w') as file:
+            json.dump(trace, file)
+        return len(trace['traceEvents'])
+
+def _json_value(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+# Tracer global yang dipakai seluruh aplikasi
+tracer = Tracer()
+
+def traced(name: str = None, category: str = "app"):
+    # Dekorator span; saat tracing mati biayanya hanya satu pengecekan atribut
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
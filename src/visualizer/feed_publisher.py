@@ -0,0 +1,36 @@
+import sys
+import argparse
+
+from .config import LIVE_FEED_ADDRESS
+from .core.io.orientation_feed import OrientationPublisher
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.visualizer.feed_publisher",
+        description="Send synthetic orientations to a running visualizer's live feed"
+    )
+    parser.add_argument("--address", default=LIVE_FEED_ADDRESS, help=f"Feed address (default {LIVE_FEED_ADDRESS})")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Messages per second (default 1000)")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after SECONDS (default: run until interrupted)")
+    parser.add_argument(
+        "--method", default="quaternion", choices=("quaternion", "euler", "tait_bryan", "exp_map"),
+        help="Representation used in the messages"
+    )
+    return parser.parse_args(argv[1:])
+
+def main():
+    args = parse_arguments(sys.argv)
+    publisher = OrientationPublisher(args.address)
+    print(f"Publishing {args.method} at {args.rate:g} Hz to {args.address} (Ctrl+C to stop)")
+    sent = 0
+    try:
+        sent = publisher.run(args.rate, args.duration, args.method)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+    if sent:
+        print(f"Sent {sent} messages")
+
+if __name__ == "__main__":
+    main()
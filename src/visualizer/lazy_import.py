@@ -0,0 +1,19 @@
+import importlib
+
+def lazy_exports(package_name: str, exports: dict):
+    # exports: nama atribut -> submodule relatif (misal {"Quaternion": ".quaternion"})
+    # Submodule baru diimport saat atribut pertama kali diakses (PEP 562)
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package_name)
+        value = getattr(module, name)
+        # Simpan di namespace package agar akses berikutnya tidak lewat __getattr__
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package_name))) | set(exports))
+
+    return __getattr__, __dir__
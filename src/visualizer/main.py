@@ -1,27 +1,49 @@
 import sys
-import os
-from pathlib import Path
+import json
+import argparse
 
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# Imported first so the startup clock also covers the Qt/OpenGL imports below
+from .diagnostics.startup import startup_timer
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QEvent, QTimer
 from PySide6.QtGui import QIcon
 
 from .config import (
     APP_NAME, 
     ICONS_DIR,
+    LOGS_DIR,
     DEFAULT_WINDOW_WIDTH,
     DEFAULT_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH,
-    MIN_WINDOW_HEIGHT
+    MIN_WINDOW_HEIGHT,
+    PROFILE_DURATION_S
 )
+from .diagnostics.profiler import profile_duration_from_env
+from .diagnostics.log import setup_logging
 from .ui.windows.main_window import MainWindow
+from .ui.styles.theme_engine import ThemeEngine
 
-def setup_application():
-    app = QApplication(sys.argv)
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog="python -m src.visualizer.main", description=APP_NAME)
+    parser.add_argument(
+        "--profile", nargs="?", type=float, const=PROFILE_DURATION_S, metavar="SECONDS",
+        help=f"Profile the first SECONDS of the session (default {PROFILE_DURATION_S}) into the logs directory"
+    )
+    parser.add_argument(
+        "--measure-startup", action="store_true",
+        help="Print startup phase timings as JSON after the first frame and exit"
+    )
+    parser.add_argument(
+        "--feed", metavar="ADDRESS",
+        help="Listen for live orientations on ADDRESS (udp://host:port, tcp://host:port or unix:///path)"
+    )
+    # Remaining arguments are passed through to Qt
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
+
+def setup_application(argv=None):
+    app = QApplication(argv if argv is not None else sys.argv)
     app.setApplicationName(APP_NAME)
     
     app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
@@ -32,28 +54,69 @@ def setup_application():
         app.setWindowIcon(QIcon(str(icon_path)))
     
     app.setStyle("Fusion")
+    ThemeEngine.apply(app)
     
     return app
 
+class FirstFrameWatcher(QObject):
+    # Marks the end of startup once the renderer has finished its first paint
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self.widget = widget
+        self.callback = callback
+        widget.installEventFilter(self)
+    
+    def eventFilter(self, watched, event):
+        if watched is self.widget and event.type() == QEvent.Type.Paint:
+            self.widget.removeEventFilter(self)
+            # Runs on the next event loop pass, after the paint event has been handled
+            QTimer.singleShot(0, self.callback)
+        return False
+
+def finish_startup(exit_after: bool):
+    if startup_timer.has_phase("first_frame"):
+        return
+    startup_timer.mark("first_frame")
+    summary = startup_timer.report()
+    if exit_after:
+        print(json.dumps(summary), flush=True)
+        QApplication.instance().quit()
+
 def setup_directories():
     try:
         ICONS_DIR.mkdir(parents=True, exist_ok=True)
-        logs_dir = Path(__file__).parent.parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
+        LOGS_DIR.mkdir(exist_ok=True)
     except Exception as e:
         print(f"Warning: Could not create directories: {e}")
 
 def main():
     try:
+        startup_timer.mark("imports")
+        args, qt_argv = parse_arguments(sys.argv)
         setup_directories()
-        app = setup_application()
+        setup_logging()
+        app = setup_application(qt_argv)
+        startup_timer.mark("application")
         
         main_window = MainWindow()
         main_window.resize(DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT)
         main_window.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
+        startup_timer.mark("main_window")
+        
+        renderer = main_window.get_current_renderer() or main_window
+        FirstFrameWatcher(renderer, lambda: finish_startup(args.measure_startup))
         main_window.showMaximized()
 
         main_window.show()
+        startup_timer.mark("show")
+        
+        # CLI flag takes precedence over the environment variable
+        profile_duration = args.profile if args.profile is not None else profile_duration_from_env()
+        if profile_duration:
+            main_window.start_profiling(profile_duration)
+        
+        if args.feed:
+            main_window.live_feed_controls.start_feed(args.feed)
         
         sys.exit(app.exec())
     
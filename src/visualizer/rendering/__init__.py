@@ -1,4 +1,12 @@
-from .opengl import OpenGLView
-from .custom import CustomRenderer
+from ..lazy_import import lazy_exports
 
-__all__ = ["OpenGLView", "CustomRenderer"]
\ No newline at end of file
+# Renderers are imported on first use so the hidden one costs nothing at startup
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OpenGLView": ".opengl",
+    "CustomRenderer": ".custom",
+    "FrameStats": ".frame_stats",
+    "MeshArrays": ".mesh_arrays",
+    "HeatMap": ".heatmap"
+})
+
+__all__ = ["OpenGLView", "CustomRenderer", "FrameStats", "MeshArrays", "HeatMap"]
@@ -1,11 +1,15 @@
-from .custom_renderer import CustomRenderer
-from .matrix4 import Matrix4
-from .camera import Camera
-from .projection import ProjectionEngine
+from ...lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CustomRenderer": ".custom_renderer",
+    "Matrix4": ".matrix4",
+    "Camera": ".camera",
+    "ProjectionEngine": ".projection"
+})
 
 __all__ = [
     'CustomRenderer',
     'Matrix4', 
     'Camera',
     'ProjectionEngine'
-]
\ No newline at end of file
+]
@@ -1,13 +1,21 @@
 import math
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
-from PySide6.QtCore import QPoint
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QImage
+from PySide6.QtCore import QPoint, QRect
+import numpy as np
 
 from .projection import ProjectionEngine
 from .matrix4 import Matrix4
 from .camera import Camera
 from ...core.math.vector3 import Vector3
+from ...config import TRAIL_MAX_EDGES, COMPARISON_SLOT_SPACING
+from ..mesh_arrays import MeshArrays
+from ..frame_stats import FrameStats
+from ..performance_hud import PerformanceHUD
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
 
 class CustomRenderer(QWidget): 
     def __init__(self, parent=None):
@@ -25,6 +33,20 @@ class CustomRenderer(QWidget):
         self.original_obj = None
         self.rotated_obj = None
         
+        # Model transform for animated poses (mesh is never re-rotated on the CPU)
+        self.animated_obj = None
+        self.model_rotation = None
+        
+        # Orientation trail: every pose of one mesh is projected in a single batch
+        self.trail_obj = None
+        self.trail_rotations = None
+        
+        # Method comparison: one shared mesh under a (4, 3, 3) rotation stack
+        self.comparison_obj = None
+        self.comparison_rotations = None
+        self.comparison_colors = None
+        self.comparison_labels = []
+        
         # Parameter rotasi 
         self.rotation_axis = Vector3(0, 0, 1)
         self.rotation_angle = 0.0
@@ -55,6 +77,10 @@ class CustomRenderer(QWidget):
         self.rotated_color = QColor(255, 76, 76)
         self.angle_label_color = QColor(255, 255, 255)
         
+        # Per-stage frame timing (disabled unless a benchmark, overlay or trace turns it on)
+        self.frame_stats = FrameStats(name="CustomRenderer.paint")
+        self.hud = PerformanceHUD("Custom")
+        
         # Setup initial camera
         self.setup_initial_camera()
         
@@ -64,10 +90,19 @@ class CustomRenderer(QWidget):
         # Animation timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.update)
-        self.timer.start(33)
+        self.timer.setInterval(33)
 
         self.setMouseTracking(True)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+    
+    def hideEvent(self, event):
+        # A hidden renderer has nothing to repaint
+        self.timer.stop()
+        super().hideEvent(event)
+    
     def setup_initial_camera(self):
         self.camera.distance = 8.0
         self.camera.angle_x = 20.0
@@ -84,6 +119,9 @@ class CustomRenderer(QWidget):
         self.angle_font_metrics = QFontMetrics(self.angle_font)
     
     def paintEvent(self, event):
+        stats = self.frame_stats
+        stats.begin_frame()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         
@@ -99,34 +137,55 @@ class CustomRenderer(QWidget):
             proj_matrix = self.camera.get_projection_matrix(aspect_ratio)
             view_matrix = self.camera.get_view_matrix()
             mvp_matrix = proj_matrix.multiply_matrix(view_matrix)
+            stats.lap("camera")
             
             # Render scene components
             if self.show_coordinate_axes:
                 self._draw_coordinate_system(painter, mvp_matrix)
+            stats.lap("axes")
             
             if self.show_rotation_visualization:
                 self._draw_rotation_visualization(painter, mvp_matrix)
+            stats.lap("rotation_viz")
             
-            # Render 3D objects
-            if self.original_obj:
-                self._draw_obj_data(
-                    painter, mvp_matrix, self.original_obj,
-                    offset=Vector3(-3.0, 0.0, 0.0),
-                    color=self.original_color,
-                    label="Original Object"
-                )
+            # Render 3D objects; the comparison row replaces them while it is shown
+            if self.comparison_obj and self.comparison_rotations is not None:
+                self._draw_method_comparison(painter, mvp_matrix)
+                stats.lap("comparison")
+            else:
+                if self.original_obj:
+                    self._draw_obj_data(
+                        painter, mvp_matrix, self.original_obj,
+                        offset=Vector3(-3.0, 0.0, 0.0),
+                        color=self.original_color,
+                        label="Original Object"
+                    )
             
-            if self.rotated_obj:
-                self._draw_obj_data(
-                    painter, mvp_matrix, self.rotated_obj,
-                    offset=Vector3(3.0, 0.0, 0.0),
-                    color=self.rotated_color,
-                    label="Rotated Object"
-                )
+                if self.animated_obj and self.model_rotation is not None:
+                    model_matrix = Matrix4.translation(3.0, 0.0, 0.0).multiply_matrix(self.model_rotation)
+                    self._draw_obj_data(
+                        painter, mvp_matrix.multiply_matrix(model_matrix), self.animated_obj,
+                        color=self.rotated_color,
+                        label="Rotated Object"
+                    )
+                elif self.rotated_obj:
+                    self._draw_obj_data(
+                        painter, mvp_matrix, self.rotated_obj,
+                        offset=Vector3(3.0, 0.0, 0.0),
+                        color=self.rotated_color,
+                        label="Rotated Object"
+                    )
+                stats.lap("objects")
             
-        except Exception as e:
-            print(f"Error in custom renderer paint: {e}")
+                if self.trail_obj and self.trail_rotations is not None:
+                    self._draw_orientation_trail(painter, mvp_matrix)
+                stats.lap("trail")
             
+        except Exception as e:
+            logger.error("Error in custom renderer paint: %s", e)
+        
+        stats.end_frame()
+        self.hud.draw(painter, stats)
         painter.end()
     
     def _draw_coordinate_system(self, painter: QPainter, mvp_matrix: Matrix4):
@@ -215,9 +274,9 @@ class CustomRenderer(QWidget):
         norm_axis = Vector3(axis.x / axis_mag, axis.y / axis_mag, axis.z / axis_mag)
         
         if abs(norm_axis.z) < 0.9:
-            perp1 = Vector3(0, 0, 1).cross(norm_axis).normalize()
+            perp1 = Vector3.UNIT_Z.cross(norm_axis).normalize()
         else:
-            perp1 = Vector3(1, 0, 0).cross(norm_axis).normalize()
+            perp1 = Vector3.UNIT_X.cross(norm_axis).normalize()
         
         perp2 = norm_axis.cross(perp1).normalize()
         
@@ -261,6 +320,8 @@ class CustomRenderer(QWidget):
         if color is None:
             color = QColor(255, 255, 255)
         
+        self.frame_stats.count('vertices', len(obj_data.vertices))
+        
         # Project all vertices
         projected_vertices = []
         for vertex in obj_data.vertices:
@@ -278,8 +339,11 @@ class CustomRenderer(QWidget):
         painter.setPen(QPen(color, 2))
         painter.setBrush(QBrush())
         
+        drawn = 0
+        edges = 0
         for face in faces:
             if len(face.vertex_indices) >= 3:
+                edges += len(face.vertex_indices)
                 for i in range(len(face.vertex_indices)):
                     start_idx = face.vertex_indices[i]
                     end_idx = face.vertex_indices[(i + 1) % len(face.vertex_indices)]
@@ -297,6 +361,110 @@ class CustomRenderer(QWidget):
                             if (self.projection.is_point_in_viewport(x1, y1) or 
                                 self.projection.is_point_in_viewport(x2, y2)):
                                 painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+                                drawn += 1
+        
+        # Edges behind the camera or outside the viewport are culled
+        stats = self.frame_stats
+        stats.count('draw_calls', drawn)
+        stats.count('edges', edges)
+        stats.count('culled', edges - drawn)
+    
+    def _draw_orientation_trail(self, painter: QPainter, mvp_matrix: Matrix4):
+        mesh = MeshArrays.for_obj(self.trail_obj)
+        if not len(mesh.edges):
+            return
+        
+        # Past the edge budget older ghosts are thinned out; the newest pose is always kept
+        rotations = self.trail_rotations
+        stride = -(-len(rotations) * len(mesh.edges) // TRAIL_MAX_EDGES)
+        if stride > 1:
+            rotations = rotations[::-stride][::-1]
+        
+        # Rotate and project all instances at once: (N, V, 3) world positions
+        world = np.einsum('nij,vj->nvi', rotations, mesh.vertices)
+        world += (3.0, 0.0, 0.0)
+        screen, valid = self.projection.project_points(world, mvp_matrix)
+        
+        starts, ends = mesh.edges[:, 0], mesh.edges[:, 1]
+        visible = valid[:, starts] & valid[:, ends]
+        segments = np.concatenate((screen[:, starts], screen[:, ends]), axis=2)
+        
+        # Older poses fade out; every ghost edge is rasterized into one coverage buffer
+        count = len(rotations)
+        fade = 0.08 + 0.32 * np.arange(1, count + 1) / count
+        weights = np.broadcast_to(fade[:, None], visible.shape)
+        coverage = self.projection.rasterize_lines(segments[visible], weights[visible])
+        
+        # Saturating alpha so overlapping ghosts stay readable
+        color = self.rotated_color
+        self._draw_coverage(painter, 1.0 - np.exp(-coverage), (color.redF(), color.greenF(), color.blueF()))
+        
+        drawn = int(visible.sum())
+        edges = count * len(mesh.edges)
+        stats = self.frame_stats
+        stats.count('draw_calls')
+        stats.count('instances', count)
+        stats.count('edges', edges)
+        stats.count('culled', edges - drawn)
+    
+    def _draw_method_comparison(self, painter: QPainter, mvp_matrix: Matrix4):
+        mesh = MeshArrays.for_obj(self.comparison_obj)
+        if not len(mesh.edges):
+            return
+        
+        # Poses side by side, each scaled so the mesh fits its slot
+        rotations = self.comparison_rotations
+        count = len(rotations)
+        offsets = (np.arange(count) - (count - 1) / 2.0) * COMPARISON_SLOT_SPACING
+        scale = min(1.0, 0.4 * COMPARISON_SLOT_SPACING / mesh.radius) if mesh.radius > 0 else 1.0
+        world = scale * np.einsum('nij,vj->nvi', rotations, mesh.vertices)
+        world[..., 0] += offsets[:, None]
+        screen, valid = self.projection.project_points(world, mvp_matrix)
+        
+        starts, ends = mesh.edges[:, 0], mesh.edges[:, 1]
+        visible = valid[:, starts] & valid[:, ends]
+        segments = np.concatenate((screen[:, starts], screen[:, ends]), axis=2)
+        
+        # Channel 0 counts samples per pixel, the rest sum the edge's deviation colour
+        colors = self.comparison_colors
+        edge_colors = 0.5 * (colors[:, starts] + colors[:, ends])
+        weights = np.concatenate((np.ones(visible.shape + (1,)), edge_colors), axis=-1)
+        coverage = self.projection.rasterize_lines(segments[visible], weights[visible])
+        
+        samples = coverage[..., 0]
+        covered = samples > 0
+        rgb = coverage[..., 1:] / np.where(covered, samples, 1.0)[..., None]
+        self._draw_coverage(painter, covered.astype(np.float64), rgb)
+        
+        painter.setFont(self.axis_font)
+        painter.setPen(self.angle_label_color)
+        for offset, label in zip(offsets, self.comparison_labels):
+            projected = self.projection.project_vertex([offset, -0.5 * COMPARISON_SLOT_SPACING, 0.0], mvp_matrix)
+            if projected:
+                x, y, _ = projected
+                painter.drawText(QRect(int(x) - 90, int(y), 180, 40), Qt.AlignmentFlag.AlignHCenter, label)
+        
+        drawn = int(visible.sum())
+        edges = count * len(mesh.edges)
+        stats = self.frame_stats
+        stats.count('draw_calls')
+        stats.count('instances', count)
+        stats.count('vertices', len(mesh.vertices))
+        stats.count('edges', edges)
+        stats.count('culled', edges - drawn)
+    
+    def _draw_coverage(self, painter: QPainter, alpha: np.ndarray, rgb):
+        # Blits an (h, w) alpha mask with a constant or per-pixel (h, w, 3) colour in [0, 1]
+        height, width = alpha.shape
+        rgb = np.broadcast_to(np.asarray(rgb, dtype=np.float64), (height, width, 3))
+        pixels = np.empty((height, width, 4), dtype=np.uint8)
+        # Premultiplied BGRA, the byte order of Format_ARGB32_Premultiplied
+        pixels[..., 0] = alpha * rgb[..., 2] * 255
+        pixels[..., 1] = alpha * rgb[..., 1] * 255
+        pixels[..., 2] = alpha * rgb[..., 0] * 255
+        pixels[..., 3] = alpha * 255
+        image = QImage(pixels.data, width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        painter.drawImage(0, 0, image)
     
     def _draw_axis_labels_ijk(self, painter: QPainter, mvp_matrix: Matrix4):
         label_ratio = 0.7
@@ -329,9 +497,9 @@ class CustomRenderer(QWidget):
         norm_axis = Vector3(axis.x / axis_mag, axis.y / axis_mag, axis.z / axis_mag)
         
         if abs(norm_axis.z) < 0.9:
-            u = Vector3(0, 0, 1).cross(norm_axis).normalize()
+            u = Vector3.UNIT_Z.cross(norm_axis).normalize()
         else:
-            u = Vector3(1, 0, 0).cross(norm_axis).normalize()
+            u = Vector3.UNIT_X.cross(norm_axis).normalize()
         
         label_radius = 3.0
         mid_angle = math.radians(angle / 2)
@@ -370,6 +538,7 @@ class CustomRenderer(QWidget):
             if (self.projection.is_point_in_viewport(x1, y1) or 
                 self.projection.is_point_in_viewport(x2, y2)):
                 painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+                self.frame_stats.count('draw_calls')
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -412,6 +581,43 @@ class CustomRenderer(QWidget):
         self.rotated_obj = rotated_obj
         self.update()
     
+    def set_model_rotation(self, obj_data, rotation_matrix):
+        self.animated_obj = obj_data
+        self.model_rotation = Matrix4.from_rotation_matrix(rotation_matrix)
+        self.update()
+    
+    def clear_model_rotation(self):
+        self.animated_obj = None
+        self.model_rotation = None
+        self.update()
+    
+    def set_orientation_trail(self, obj_data, rotation_matrices):
+        if not obj_data or len(rotation_matrices) == 0:
+            self.clear_orientation_trail()
+            return
+        self.trail_obj = obj_data
+        self.trail_rotations = np.asarray(rotation_matrices, dtype=np.float64).reshape(-1, 3, 3)
+        self.update()
+    
+    def clear_orientation_trail(self):
+        self.trail_obj = None
+        self.trail_rotations = None
+        self.update()
+    
+    def set_method_comparison(self, obj_data, rotation_matrices, vertex_colors, labels=()):
+        self.comparison_obj = obj_data
+        self.comparison_rotations = np.asarray(rotation_matrices, dtype=np.float64).reshape(-1, 3, 3)
+        self.comparison_colors = np.asarray(vertex_colors, dtype=np.float64)
+        self.comparison_labels = list(labels)
+        self.update()
+    
+    def clear_method_comparison(self):
+        self.comparison_obj = None
+        self.comparison_rotations = None
+        self.comparison_colors = None
+        self.comparison_labels = []
+        self.update()
+    
     def set_rotation_parameters(self, axis: Vector3, angle: float):
         if axis.magnitude() > 0:
             self.rotation_axis = axis.normalize()
@@ -422,4 +628,22 @@ class CustomRenderer(QWidget):
     
     def reset_camera(self):
         self.setup_initial_camera()
+        self.update()
+    
+    def set_hud_visible(self, visible: bool):
+        self.hud.visible = visible
+        self.frame_stats.enabled = visible
+        self.frame_stats.clear()
+        self.update()
+    
+    def toggle_hud(self):
+        self.set_hud_visible(not self.hud.visible)
+    
+    def get_camera_state(self) -> tuple:
+        return (self.camera.angle_x, self.camera.angle_y, self.camera.distance)
+    
+    def set_camera_state(self, rotation_x: float, rotation_y: float, distance: float):
+        self.camera.angle_x = max(-90, min(90, rotation_x))
+        self.camera.angle_y = rotation_y
+        self.camera.distance = max(2.0, min(25.0, distance))
         self.update()
\ No newline at end of file
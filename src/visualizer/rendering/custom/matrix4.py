@@ -31,6 +31,16 @@ class Matrix4:
         result = self.multiply_matrix(trans_matrix)
         self.m = result.m
 
+    @staticmethod
+    def from_rotation_matrix(rotation):
+        # Perluas matriks rotasi 3x3 menjadi matriks model 4x4
+        return Matrix4([
+            [float(rotation[0][0]), float(rotation[0][1]), float(rotation[0][2]), 0.0],
+            [float(rotation[1][0]), float(rotation[1][1]), float(rotation[1][2]), 0.0],
+            [float(rotation[2][0]), float(rotation[2][1]), float(rotation[2][2]), 0.0],
+            [0.0, 0.0, 0.0, 1.0]
+        ])
+
     @staticmethod
     def rotation_x(angle_deg: float):
         angle_rad = math.radians(angle_deg)
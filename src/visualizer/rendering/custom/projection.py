@@ -1,5 +1,7 @@
 import math
 from typing import List, Tuple, Optional
+import numpy as np
+
 from .matrix4 import Matrix4
 
 class ProjectionEngine:
@@ -7,17 +9,25 @@ class ProjectionEngine:
         self.viewport_width = 800
         self.viewport_height = 600
         
-        # Z-buffer for depth testing
+        # Z-buffer for depth testing, allocated on first use and cleared lazily per frame
         self.z_buffer = None
+        self.z_buffer_dirty = True
         self.enable_z_buffer = True
     
     def set_viewport(self, width: int, height: int):
+        # Called every frame; allocating a width x height buffer here dominated frame time
+        if (width, height) != (self.viewport_width, self.viewport_height):
+            self.z_buffer = None
         self.viewport_width = width
         self.viewport_height = height
-        
-        # Initialize Z-buffer
-        if self.enable_z_buffer:
-            self.z_buffer = [[float('inf') for _ in range(width)] for _ in range(height)]
+        self.z_buffer_dirty = True
+    
+    def _ensure_z_buffer(self):
+        if self.z_buffer is None:
+            self.z_buffer = [[float('inf')] * self.viewport_width for _ in range(self.viewport_height)]
+        elif self.z_buffer_dirty:
+            self.clear_z_buffer()
+        self.z_buffer_dirty = False
     
     def clear_z_buffer(self):
         if self.z_buffer:
@@ -56,6 +66,54 @@ class ProjectionEngine:
 
         return (screen_x, screen_y, z)
 
+    def project_points(self, points: np.ndarray, mvp_matrix: Matrix4) -> Tuple[np.ndarray, np.ndarray]:
+        # Batched project_vertex for an (..., 3) array: returns integer screen
+        # coordinates (..., 2) and a mask of points that project_vertex would accept
+        m = np.asarray(mvp_matrix.m, dtype=np.float64)
+        transformed = points @ m[:, :3].T + m[:, 3]
+        
+        w = transformed[..., 3]
+        valid = np.abs(w) >= 1e-6
+        safe_w = np.where(valid, w, 1.0)
+        
+        x = transformed[..., 0] / safe_w
+        y = transformed[..., 1] / safe_w
+        z = transformed[..., 2] / safe_w
+        valid &= (z >= -1.0) & (z <= 1.0)
+        
+        screen = np.empty(points.shape[:-1] + (2,), dtype=np.int64)
+        # Clamping before the integer cast matches int() then clamp in project_vertex
+        screen[..., 0] = np.clip((x + 1.0) * self.viewport_width / 2.0, 0, self.viewport_width - 1)
+        screen[..., 1] = np.clip((1.0 - y) * self.viewport_height / 2.0, 0, self.viewport_height - 1)
+        return screen, valid
+
+    def rasterize_lines(self, segments: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        # Accumulates (M, 4) integer screen segments (x1, y1, x2, y2) into a
+        # (height, width) coverage buffer, one DDA sample per pixel step, all in numpy.
+        # (M, C) weights accumulate C channels at once into (height, width, C)
+        width, height = self.viewport_width, self.viewport_height
+        weights = np.asarray(weights, dtype=np.float64)
+        channels = weights.reshape(len(weights), -1)
+        if not len(segments):
+            return np.zeros((height, width) + weights.shape[1:], dtype=np.float64)
+        
+        x1, y1, x2, y2 = (segments[:, i].astype(np.float64) for i in range(4))
+        dx, dy = x2 - x1, y2 - y1
+        steps = np.maximum(np.abs(dx), np.abs(dy)).astype(np.int64) + 1
+        
+        owner = np.repeat(np.arange(len(segments)), steps)
+        first = np.repeat(np.cumsum(steps) - steps, steps)
+        t = (np.arange(owner.size) - first) / np.maximum(steps - 1, 1)[owner]
+        
+        xs = np.rint(x1[owner] + t * dx[owner]).astype(np.int64)
+        ys = np.rint(y1[owner] + t * dy[owner]).astype(np.int64)
+        pixels = ys * width + xs
+        coverage = np.stack([
+            np.bincount(pixels, weights=channels[owner, c], minlength=width * height)
+            for c in range(channels.shape[1])
+        ], axis=-1)
+        return coverage.reshape((height, width) + weights.shape[1:])
+
     def project_line_3d(self, start_3d: List[float], end_3d: List[float], mvp_matrix: Matrix4) -> Optional[Tuple[Tuple[int, int], Tuple[int,int]]]:
         start_2d = self.project_vertex(start_3d, mvp_matrix)
         end_2d = self.project_vertex(end_3d, mvp_matrix)
@@ -69,11 +127,13 @@ class ProjectionEngine:
         return 0 <= x < self.viewport_width and 0 <= y < self.viewport_height
 
     def depth_test(self, x: int, y: int, z: float) -> bool:
-        if not self.enable_z_buffer or not self.z_buffer:
+        if not self.enable_z_buffer:
             return True
             
         if not self.is_point_in_viewport(x, y):
             return False
+        
+        self._ensure_z_buffer()
             
         if z < self.z_buffer[y][x]:
             self.z_buffer[y][x] = z
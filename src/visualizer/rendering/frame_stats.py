@@ -0,0 +1,128 @@
+import time
+from collections import deque
+
+from ..diagnostics.tracing import tracer
+
+# Jumlah frame terakhir yang disimpan untuk statistik
+DEFAULT_HISTORY = 240
+
+def percentile(samples, q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    # Interpolasi linear seperti numpy.percentile; dipakai juga oleh harness benchmark
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+class FrameStats:
+    # Pencatat waktu per tahap render. Saat tidak aktif setiap pemanggilan
+    # hanya berupa satu pengecekan atribut sehingga aman dibiarkan di paint loop.
+
+    def __init__(self, history: int = DEFAULT_HISTORY, name: str = "frame"):
+        self.enabled = False
+        self.name = name # Nama span frame saat tracing aktif
+        self.frames = deque(maxlen=history)
+        self._stages = None
+        self._counts = None
+        self._start = 0.0
+        self._last = 0.0
+
+    @property
+    def active(self) -> bool:
+        # True selama frame sedang direkam; dipakai untuk melewati perhitungan counter
+        return self._stages is not None
+
+    def begin_frame(self):
+        # Frame juga direkam selama tracing aktif agar setiap tahap menjadi span
+        if not (self.enabled or tracer.enabled):
+            return
+        self._start = self._last = time.perf_counter()
+        self._stages = {}
+        self._counts = {}
+
+    def lap(self, stage: str):
+        # Waktu sejak lap sebelumnya dicatat ke tahap ini
+        stages = self._stages
+        if stages is None:
+            return
+        now = time.perf_counter()
+        stages[stage] = stages.get(stage, 0.0) + (now - self._last)
+        if tracer.enabled:
+            tracer.record(stage, "paint", int(self._last * 1e9), int(now * 1e9))
+        self._last = now
+
+    def count(self, name: str, amount: int = 1):
+        # Counter per frame: draw_calls, vertices, edges, culled
+        counts = self._counts
+        if counts is None:
+            return
+        counts[name] = counts.get(name, 0) + amount
+
+    def end_frame(self):
+        stages = self._stages
+        if stages is None:
+            return
+        now = time.perf_counter()
+        stages['total'] = now - self._start
+        if tracer.enabled:
+            tracer.record(self.name, "paint", int(self._start * 1e9), int(now * 1e9), self._counts or None)
+        self.frames.append((now, stages, self._counts))
+        self._stages = None
+        self._counts = None
+
+    def clear(self):
+        self.frames.clear()
+        self._stages = None
+        self._counts = None
+
+    def last_frame(self) -> dict:
+        return self.frames[-1][1] if self.frames else {}
+
+    def last_counts(self) -> dict:
+        return self.frames[-1][2] if self.frames else {}
+
+    def stage_names(self) -> list:
+        names = []
+        for _, stages, _ in self.frames:
+            for name in stages:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def fps(self) -> float:
+        if len(self.frames) < 2:
+            return 0.0
+        elapsed = self.frames[-1][0] - self.frames[0][0]
+        return (len(self.frames) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def recent_average(self, window: int = 30) -> tuple:
+        # Rata-rata waktu tahap dan counter pada beberapa frame terakhir (untuk overlay)
+        recent = list(self.frames)[-window:]
+        if not recent:
+            return {}, {}
+
+        stages = {}
+        counts = {}
+        for _, frame_stages, frame_counts in recent:
+            for name, value in frame_stages.items():
+                stages[name] = stages.get(name, 0.0) + value
+            for name, value in frame_counts.items():
+                counts[name] = counts.get(name, 0) + value
+
+        size = len(recent)
+        return (
+            {name: value / size for name, value in stages.items()},
+            {name: value / size for name, value in counts.items()}
+        )
+
+    def summary(self, percentiles=(50, 95, 99)) -> dict:
+        # {tahap: {'p50': detik, ...}} untuk semua frame di history
+        result = {}
+        for name in self.stage_names():
+            samples = [stages.get(name, 0.0) for _, stages, _ in self.frames]
+            stats = {f"p{q}": percentile(samples, q) for q in percentiles}
+            stats['mean'] = sum(samples) / len(samples)
+            result[name] = stats
+        return result
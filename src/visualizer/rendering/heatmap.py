@@ -0,0 +1,27 @@
+import numpy as np
+
+class HeatMap:
+    # Green (within tolerance) -> yellow -> red (at or above the upper bound)
+    STOPS = np.array([
+        [0.20, 0.85, 0.30],
+        [1.00, 0.85, 0.20],
+        [1.00, 0.25, 0.20]
+    ], dtype=np.float32)
+
+    @staticmethod
+    def normalize(values, low: float, high: float, log_scale: bool = True) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if log_scale:
+            # Errors span many orders of magnitude, so the ramp follows their exponent
+            low, high = np.log10(low), np.log10(high)
+            values = np.log10(np.maximum(values, 10.0 ** low))
+        return np.clip((values - low) / (high - low), 0.0, 1.0)
+
+    @staticmethod
+    def colors(values, low: float, high: float, log_scale: bool = True) -> np.ndarray:
+        # (...) values to (..., 3) float32 RGB in [0, 1]
+        stops = HeatMap.STOPS
+        t = HeatMap.normalize(values, low, high, log_scale) * (len(stops) - 1)
+        index = np.minimum(t.astype(np.int64), len(stops) - 2)
+        blend = (t - index)[..., None]
+        return ((1.0 - blend) * stops[index] + blend * stops[index + 1]).astype(np.float32)
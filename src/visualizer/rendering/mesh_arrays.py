@@ -0,0 +1,55 @@
+import itertools
+import weakref
+
+import numpy as np
+
+from ..core.io.obj_loader import OBJData
+
+class MeshArrays:
+    # Vertex positions and unique wireframe edges of an OBJData as flat arrays,
+    # built once per mesh and shared by every instance drawn from it
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, obj_data: OBJData):
+        self.source = obj_data.vertices
+        vertex_count = len(obj_data.vertices)
+
+        self.vertices = np.fromiter(
+            (c for vertex in obj_data.vertices for c in (vertex.x, vertex.y, vertex.z)),
+            dtype=np.float32, count=vertex_count * 3
+        ).reshape(vertex_count, 3)
+        self.radius = float(np.linalg.norm(self.vertices, axis=1).max()) if vertex_count else 0.0
+
+        # Closed polygon outlines; shared edges between faces are drawn once.
+        # Filled faces are fan-triangulated, which matches GL_POLYGON for convex faces
+        edges = []
+        triangles = []
+        for face in obj_data.faces:
+            indices = face.vertex_indices
+            if len(indices) >= 3:
+                edges.extend(zip(indices, indices[1:] + indices[:1]))
+                triangles.extend(zip(itertools.repeat(indices[0]), indices[1:-1], indices[2:]))
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        edges = edges[((edges >= 0) & (edges < vertex_count)).all(axis=1)]
+        edges = np.unique(np.sort(edges, axis=1), axis=0)
+        self.edges = edges.astype(np.uint32)
+        triangles = np.array(triangles, dtype=np.int64).reshape(-1, 3)
+        self.triangles = triangles[((triangles >= 0) & (triangles < vertex_count)).all(axis=1)].astype(np.uint32)
+
+    @classmethod
+    def for_obj(cls, obj_data: OBJData) -> 'MeshArrays':
+        mesh = cls._cache.get(obj_data)
+        # A replaced vertex list means the mesh was edited in place
+        if mesh is None or mesh.source is not obj_data.vertices:
+            mesh = cls(obj_data)
+            cls._cache[obj_data] = mesh
+        return mesh
+
+    @staticmethod
+    def instance_matrices(rotation_matrices) -> np.ndarray:
+        # (N, 3, 3) rotations to (N, 16) column-major 4x4 model matrices for glMultMatrixf
+        rotations = np.asarray(rotation_matrices, dtype=np.float32).reshape(-1, 3, 3)
+        instances = np.zeros((len(rotations), 4, 4), dtype=np.float32)
+        instances[:, :3, :3] = rotations.transpose(0, 2, 1)
+        instances[:, 3, 3] = 1.0
+        return instances.reshape(-1, 16)
@@ -1,15 +1,23 @@
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import QTimer, Qt, QRect
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtGui import QMouseEvent, QWheelEvent, QPainter, QFont, QColor
 
 import OpenGL.GL as gl
 import OpenGL.GLU as glu
 import math
+import numpy as np
 
 from typing import Optional
 from ...core.io.obj_loader import OBJData
 from ...core.math.vector3 import Vector3
 from ...core.math.rotation_factory import RotationMethod
+from ...config import COMPARISON_SLOT_SPACING
+from ..mesh_arrays import MeshArrays
+from ..frame_stats import FrameStats
+from ..performance_hud import PerformanceHUD
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
 
 class OpenGLView(QOpenGLWidget):
     def __init__(self, parent=None):
@@ -19,6 +27,25 @@ class OpenGLView(QOpenGLWidget):
         self.original_obj: OBJData = None
         self.rotated_obj: OBJData = None
 
+        # Model transform for animated poses (mesh is never re-rotated on the CPU)
+        self.animated_obj: OBJData = None
+        self.model_rotation = None
+
+        # Compiled (mesh, fill list, edge list) per object slot, rebuilt only when the mesh changes
+        self.object_lists = {}
+
+        # Orientation trail: one uploaded mesh drawn once per instance matrix
+        self.trail_obj: OBJData = None
+        self.trail_instances = None
+        self.trail_alphas = None
+        self.trail_mesh = None
+
+        # Method comparison: the same mesh arrays under a (4, 3, 3) rotation stack
+        self.comparison_obj: OBJData = None
+        self.comparison_instances = None
+        self.comparison_colors = None
+        self.comparison_labels = []
+
         # Rotation parameters
         self.rotation_axis: Vector3 = Vector3(0, 0, 1)
         self.rotation_angle: float = 0.0
@@ -39,21 +66,74 @@ class OpenGLView(QOpenGLWidget):
         # Animation timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.update)
-        self.timer.start(33)  # 30 FPS untuk stability
+        self.timer.setInterval(33)  # 30 FPS untuk stability
         
         # Text rendering setup
         self.label_font = QFont("Arial", 14, QFont.Weight.Bold)
         self.degree_font = QFont("Arial", 16, QFont.Weight.Bold)
+        self.comparison_font = QFont("Arial", 9)
         
         # Label caching untuk prevent flickering
         self.label_cache = {}
         self.cache_counter = 0
+        
+        # Per-stage frame timing (disabled unless a benchmark, overlay or trace turns it on)
+        self.frame_stats = FrameStats(name="OpenGLView.paint")
+        self.hud = PerformanceHUD("OpenGL")
     
     def set_obj_data(self, original_obj: OBJData, rotated_obj: OBJData = None):
         self.original_obj = original_obj
         self.rotated_obj = rotated_obj
         self.update()
 
+    def set_model_rotation(self, obj_data: OBJData, rotation_matrix):
+        self.animated_obj = obj_data
+        # Column-major 4x4 matrix for glMultMatrixf
+        self.model_rotation = [
+            float(rotation_matrix[0][0]), float(rotation_matrix[1][0]), float(rotation_matrix[2][0]), 0.0,
+            float(rotation_matrix[0][1]), float(rotation_matrix[1][1]), float(rotation_matrix[2][1]), 0.0,
+            float(rotation_matrix[0][2]), float(rotation_matrix[1][2]), float(rotation_matrix[2][2]), 0.0,
+            0.0, 0.0, 0.0, 1.0
+        ]
+        self.update()
+
+    def clear_model_rotation(self):
+        self.animated_obj = None
+        self.model_rotation = None
+        self.update()
+
+    def set_orientation_trail(self, obj_data: OBJData, rotation_matrices):
+        if not obj_data or len(rotation_matrices) == 0:
+            self.clear_orientation_trail()
+            return
+        self.trail_obj = obj_data
+        self.trail_instances = MeshArrays.instance_matrices(rotation_matrices)
+        # Older poses fade out
+        count = len(self.trail_instances)
+        self.trail_alphas = [0.08 + 0.32 * (i + 1) / count for i in range(count)]
+        self.update()
+
+    def clear_orientation_trail(self):
+        self.trail_obj = None
+        self.trail_instances = None
+        self.trail_alphas = None
+        self.update()
+
+    def set_method_comparison(self, obj_data: OBJData, rotation_matrices, vertex_colors, labels=()):
+        self.comparison_obj = obj_data
+        self.comparison_instances = MeshArrays.instance_matrices(rotation_matrices)
+        # Per-method (V, 3) colour arrays handed to glColorPointer as they are
+        self.comparison_colors = np.ascontiguousarray(vertex_colors, dtype=np.float32)
+        self.comparison_labels = list(labels)
+        self.update()
+
+    def clear_method_comparison(self):
+        self.comparison_obj = None
+        self.comparison_instances = None
+        self.comparison_colors = None
+        self.comparison_labels = []
+        self.update()
+
     def set_rotation_parameters(self, axis: Vector3, angle: float):
         if axis and axis.magnitude() > 0:
             self.rotation_axis = axis.normalize()
@@ -68,6 +148,34 @@ class OpenGLView(QOpenGLWidget):
         self.camera_rotation_y = 45.0
         self.update()
     
+    def set_hud_visible(self, visible: bool):
+        self.hud.visible = visible
+        self.frame_stats.enabled = visible
+        self.frame_stats.clear()
+        self.update()
+    
+    def toggle_hud(self):
+        self.set_hud_visible(not self.hud.visible)
+    
+    def get_camera_state(self) -> tuple:
+        return (self.camera_rotation_x, self.camera_rotation_y, self.camera_distance)
+    
+    def set_camera_state(self, rotation_x: float, rotation_y: float, distance: float):
+        self.camera_rotation_x = max(-90, min(90, rotation_x))
+        self.camera_rotation_y = rotation_y
+        self.camera_distance = max(2.0, min(25.0, distance))
+        self.label_cache.clear()
+        self.update()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+    
+    def hideEvent(self, event):
+        # A hidden renderer has nothing to repaint
+        self.timer.stop()
+        super().hideEvent(event)
+    
     def initializeGL(self):
         gl.glClearColor(0.1, 0.1, 0.1, 1.0)
         gl.glEnable(gl.GL_DEPTH_TEST)
@@ -98,33 +206,56 @@ class OpenGLView(QOpenGLWidget):
         self.label_cache.clear()
     
     def paintGL(self):
+        stats = self.frame_stats
         try:
             gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
             gl.glLoadIdentity()
             
             # Setup camera
             self.setup_camera()
+            stats.lap("camera")
             
             # Cache matrices setelah camera setup
             self.cache_matrices()
+            stats.lap("cache_matrices")
             
             # Draw coordinate axes
             self.draw_coordinate_axes()
+            stats.lap("axes")
             
             # Draw rotation visualization
             self.draw_rotation_visualization()
+            stats.lap("rotation_viz")
             
-            # Draw objects
-            self.draw_objects()
+            # The comparison row replaces the original/rotated pair while it is shown
+            if self.comparison_obj and self.comparison_instances is not None:
+                self.draw_method_comparison()
+                stats.lap("comparison")
+            else:
+                # Draw objects
+                self.draw_objects()
+                stats.lap("objects")
+                
+                # Translucent ghosts go last so they blend over the solid objects
+                self.draw_orientation_trail()
+                stats.lap("trail")
                 
         except Exception as e:
-            print(f"OpenGL Error: {e}")
+            logger.error("OpenGL Error: %s", e)
     
     def paintEvent(self, event):
+        self.frame_stats.begin_frame()
         super().paintEvent(event)
         # Only draw labels if matrices are cached
         if self.cached_modelview is not None:
             self.draw_2d_labels()
+            self.frame_stats.lap("labels")
+        self.frame_stats.end_frame()
+        
+        if self.hud.visible:
+            painter = QPainter(self)
+            self.hud.draw(painter, self.frame_stats)
+            painter.end()
     
     def cache_matrices(self):
         try:
@@ -132,7 +263,7 @@ class OpenGLView(QOpenGLWidget):
             self.cached_projection = gl.glGetDoublev(gl.GL_PROJECTION_MATRIX)
             self.cached_viewport = gl.glGetIntegerv(gl.GL_VIEWPORT)
         except Exception as e:
-            print(f"Error caching matrices: {e}")
+            logger.error("Error caching matrices: %s", e)
     
     def setup_camera(self):
         glu.gluLookAt(
@@ -176,8 +307,11 @@ class OpenGLView(QOpenGLWidget):
             gl.glEnable(gl.GL_LIGHTING)
             gl.glLineWidth(1.0)
             
+            # One batch for the axis lines plus one per arrow head
+            self.frame_stats.count('draw_calls', 4)
+            
         except Exception as e:
-            print(f"Error drawing axes: {e}")
+            logger.error("Error drawing axes: %s", e)
     
     def draw_arrow_head(self, position: Vector3, direction: Vector3, size: float, color: tuple):
         try:
@@ -194,9 +328,9 @@ class OpenGLView(QOpenGLWidget):
             
             # Create perpendicular vectors for arrow head
             if abs(direction.z) < 0.9:
-                perp1 = Vector3(0, 0, 1).cross(direction).normalize()
+                perp1 = Vector3.UNIT_Z.cross(direction).normalize()
             else:
-                perp1 = Vector3(1, 0, 0).cross(direction).normalize()
+                perp1 = Vector3.UNIT_X.cross(direction).normalize()
             perp2 = direction.cross(perp1).normalize()
             
             # Draw arrow lines
@@ -213,7 +347,7 @@ class OpenGLView(QOpenGLWidget):
             gl.glPopMatrix()
             gl.glLineWidth(1.0)
         except Exception as e:
-            print(f"Error drawing arrow head: {e}")
+            logger.error("Error drawing arrow head: %s", e)
     
     def draw_rotation_visualization(self):
         if abs(self.rotation_angle) < 0.1:
@@ -235,12 +369,13 @@ class OpenGLView(QOpenGLWidget):
             
             # Draw angle arc
             self.draw_angle_arc()
+            self.frame_stats.count('draw_calls', 2)
             
             gl.glEnable(gl.GL_LIGHTING)
             gl.glLineWidth(1.0)
             
         except Exception as e:
-            print(f"Error drawing rotation: {e}")
+            logger.error("Error drawing rotation: %s", e)
     
     def draw_angle_arc(self):
         try:
@@ -249,9 +384,9 @@ class OpenGLView(QOpenGLWidget):
 
             # Create perpendicular vectors
             if abs(axis.z) < 0.9:
-                u = Vector3(0, 0, 1).cross(axis).normalize()
+                u = Vector3.UNIT_Z.cross(axis).normalize()
             else:
-                u = Vector3(1, 0, 0).cross(axis).normalize()
+                u = Vector3.UNIT_X.cross(axis).normalize()
             v = axis.cross(u).normalize()
             
             # Draw arc
@@ -278,63 +413,203 @@ class OpenGLView(QOpenGLWidget):
             gl.glLineWidth(1.0)
             
         except Exception as e:
-            print(f"Error drawing angle arc: {e}")
+            logger.error("Error drawing angle arc: %s", e)
     
     def draw_objects(self):
         try:
             if self.original_obj:
                 gl.glPushMatrix()
                 gl.glTranslatef(-3.0, 0.0, 0.0)
-                self.draw_obj(self.original_obj, color=(0.3, 0.5, 1.0))
+                self.draw_obj(self.original_obj, color=(0.3, 0.5, 1.0), slot="original")
                 gl.glPopMatrix()
             
-            if self.rotated_obj:
+            if self.animated_obj and self.model_rotation is not None:
+                gl.glPushMatrix()
+                gl.glTranslatef(3.0, 0.0, 0.0)
+                gl.glMultMatrixf(self.model_rotation)
+                self.draw_obj(self.animated_obj, color=(1.0, 0.3, 0.3), slot="rotated")
+                gl.glPopMatrix()
+            elif self.rotated_obj:
                 gl.glPushMatrix()
                 gl.glTranslatef(3.0, 0.0, 0.0)
-                self.draw_obj(self.rotated_obj, color=(1.0, 0.3, 0.3))
+                self.draw_obj(self.rotated_obj, color=(1.0, 0.3, 0.3), slot="rotated")
+                gl.glPopMatrix()
+        except Exception as e:
+            logger.error("Error drawing objects: %s", e)
+    
+    def trail_display_list(self) -> int:
+        # The trail mesh is compiled into a display list once; instances only replay it
+        mesh = MeshArrays.for_obj(self.trail_obj)
+        if self.trail_mesh and self.trail_mesh[0] is mesh:
+            return self.trail_mesh[1]
+        
+        if self.trail_mesh:
+            gl.glDeleteLists(self.trail_mesh[1], 1)
+            self.trail_mesh = None
+        
+        list_id = gl.glGenLists(1)
+        gl.glNewList(list_id, gl.GL_COMPILE)
+        # Vertex arrays are copied into the list when it is compiled
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glVertexPointer(3, gl.GL_FLOAT, 0, mesh.vertices)
+        gl.glDrawElements(gl.GL_LINES, mesh.edges.size, gl.GL_UNSIGNED_INT, mesh.edges)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEndList()
+        
+        self.trail_mesh = (mesh, list_id)
+        return list_id
+    
+    def draw_orientation_trail(self):
+        instances = self.trail_instances
+        if not self.trail_obj or instances is None or not self.trail_obj.vertices:
+            return
+        
+        try:
+            list_id = self.trail_display_list()
+            
+            gl.glDisable(gl.GL_LIGHTING)
+            # Ghosts must not hide each other or the solid objects
+            gl.glDepthMask(gl.GL_FALSE)
+            gl.glLineWidth(1.0)
+            gl.glPushMatrix()
+            try:
+                gl.glTranslatef(3.0, 0.0, 0.0)
+                
+                for matrix, alpha in zip(instances, self.trail_alphas):
+                    gl.glColor4f(1.0, 0.3, 0.3, alpha)
+                    gl.glPushMatrix()
+                    try:
+                        gl.glMultMatrixf(matrix)
+                        gl.glCallList(list_id)
+                    finally:
+                        gl.glPopMatrix()
+            finally:
+                # A failed draw must not leave depth writes off for the rest of the scene
+                gl.glPopMatrix()
+                gl.glDepthMask(gl.GL_TRUE)
+                gl.glEnable(gl.GL_LIGHTING)
+            
+            stats = self.frame_stats
+            stats.count('draw_calls', len(instances))
+            stats.count('instances', len(instances))
+            
+        except Exception as e:
+            logger.error("Error drawing orientation trail: %s", e)
+    
+    def comparison_offsets(self) -> list:
+        count = len(self.comparison_instances)
+        return [(i - (count - 1) / 2.0) * COMPARISON_SLOT_SPACING for i in range(count)]
+    
+    def draw_method_comparison(self):
+        mesh = MeshArrays.for_obj(self.comparison_obj)
+        if not len(mesh.edges):
+            return
+        
+        try:
+            # Each pose is scaled so the mesh fits its slot
+            scale = min(1.0, 0.4 * COMPARISON_SLOT_SPACING / mesh.radius) if mesh.radius > 0 else 1.0
+            
+            gl.glDisable(gl.GL_LIGHTING)
+            gl.glLineWidth(1.5)
+            gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+            gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+            # Vertex and index arrays are shared; only the matrix and colour array change per method
+            gl.glVertexPointer(3, gl.GL_FLOAT, 0, mesh.vertices)
+            
+            for offset, matrix, colors in zip(self.comparison_offsets(), self.comparison_instances, self.comparison_colors):
+                gl.glPushMatrix()
+                gl.glTranslatef(offset, 0.0, 0.0)
+                gl.glScalef(scale, scale, scale)
+                gl.glMultMatrixf(matrix)
+                gl.glColorPointer(3, gl.GL_FLOAT, 0, colors)
+                gl.glDrawElements(gl.GL_LINES, mesh.edges.size, gl.GL_UNSIGNED_INT, mesh.edges)
                 gl.glPopMatrix()
+            
+            gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+            gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+            gl.glLineWidth(1.0)
+            gl.glEnable(gl.GL_LIGHTING)
+            
+            count = len(self.comparison_instances)
+            stats = self.frame_stats
+            stats.count('draw_calls', count)
+            stats.count('instances', count)
+            stats.count('vertices', len(mesh.vertices))
+            stats.count('edges', count * len(mesh.edges))
+            
         except Exception as e:
-            print(f"Error drawing objects: {e}")
+            logger.error("Error drawing method comparison: %s", e)
     
-    def draw_obj(self, obj_data: OBJData, color=(1.0, 1.0, 1.0)):
+    def draw_comparison_labels(self, painter: QPainter):
+        painter.setFont(self.comparison_font)
+        painter.setPen(QColor(255, 255, 255))
+        for offset, label in zip(self.comparison_offsets(), self.comparison_labels):
+            screen_pos = self.world_to_screen(offset, -0.5 * COMPARISON_SLOT_SPACING, 0.0)
+            if self.is_position_visible(screen_pos):
+                x, y = screen_pos
+                painter.drawText(QRect(x - 90, y, 180, 40), Qt.AlignmentFlag.AlignHCenter, label)
+    
+    def object_display_lists(self, obj_data: OBJData, slot: str) -> tuple:
+        # Filled faces and wireframe are compiled once per mesh; animated poses only change
+        # the model matrix, so each frame replays the lists instead of re-sending every face
+        mesh = MeshArrays.for_obj(obj_data)
+        compiled = self.object_lists.get(slot)
+        if compiled and compiled[0] is mesh:
+            return compiled
+        
+        if compiled:
+            gl.glDeleteLists(compiled[1], 2)
+            del self.object_lists[slot]
+        
+        fill_id = gl.glGenLists(2)
+        edge_id = fill_id + 1
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glVertexPointer(3, gl.GL_FLOAT, 0, mesh.vertices)
+        
+        gl.glNewList(fill_id, gl.GL_COMPILE)
+        gl.glDrawElements(gl.GL_TRIANGLES, mesh.triangles.size, gl.GL_UNSIGNED_INT, mesh.triangles)
+        gl.glEndList()
+        
+        gl.glNewList(edge_id, gl.GL_COMPILE)
+        gl.glDrawElements(gl.GL_LINES, mesh.edges.size, gl.GL_UNSIGNED_INT, mesh.edges)
+        gl.glEndList()
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        
+        compiled = (mesh, fill_id, edge_id)
+        self.object_lists[slot] = compiled
+        return compiled
+    
+    def draw_obj(self, obj_data: OBJData, color=(1.0, 1.0, 1.0), slot: str = "original"):
         if not obj_data or not obj_data.vertices or not obj_data.faces:
             return
         
         try:
+            mesh, fill_id, edge_id = self.object_display_lists(obj_data, slot)
+            
+            stats = self.frame_stats
+            if stats.active:
+                stats.count('draw_calls', 2)
+                stats.count('vertices', len(mesh.vertices))
+                stats.count('edges', len(mesh.edges))
+            
             # Set material
             gl.glMaterialfv(gl.GL_FRONT, gl.GL_AMBIENT_AND_DIFFUSE, [*color, 1.0])
             
             # Draw faces
-            for face in obj_data.faces:
-                if len(face.vertex_indices) >= 3:
-                    gl.glBegin(gl.GL_POLYGON)
-                    for vertex_index in face.vertex_indices:
-                        if 0 <= vertex_index < len(obj_data.vertices):
-                            vertex = obj_data.vertices[vertex_index]
-                            gl.glVertex3f(vertex.x, vertex.y, vertex.z)
-                    gl.glEnd()
+            gl.glCallList(fill_id)
             
             # Draw wireframe
             gl.glDisable(gl.GL_LIGHTING)
             gl.glColor3f(*[c * 0.8 for c in color])
             gl.glLineWidth(1.5)
-            gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_LINE)
-            
-            for face in obj_data.faces:
-                if len(face.vertex_indices) >= 3:
-                    gl.glBegin(gl.GL_POLYGON)
-                    for vertex_index in face.vertex_indices:
-                        if 0 <= vertex_index < len(obj_data.vertices):
-                            vertex = obj_data.vertices[vertex_index]
-                            gl.glVertex3f(vertex.x, vertex.y, vertex.z)
-                    gl.glEnd()
-            
-            gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
-            gl.glEnable(gl.GL_LIGHTING)
-            gl.glLineWidth(1.0)
+            try:
+                gl.glCallList(edge_id)
+            finally:
+                gl.glEnable(gl.GL_LIGHTING)
+                gl.glLineWidth(1.0)
             
         except Exception as e:
-            print(f"Error drawing object: {e}")
+            logger.error("Error drawing object: %s", e)
     
     def draw_2d_labels(self):
         try:
@@ -366,10 +641,13 @@ class OpenGLView(QOpenGLWidget):
             
             self.draw_stable_degree_label(painter)
             
+            if self.comparison_obj and self.comparison_instances is not None:
+                self.draw_comparison_labels(painter)
+            
             painter.end()
             
         except Exception as e:
-            print(f"Error drawing 2D labels: {e}")
+            logger.error("Error drawing 2D labels: %s", e)
     
     def get_axis_line_positions(self, label_distance):
         positions = {
@@ -407,7 +685,7 @@ class OpenGLView(QOpenGLWidget):
             return positions
             
         except Exception as e:
-            print(f"Error getting axis line positions: {e}")
+            logger.error("Error getting axis line positions: %s", e)
             return positions
     
     def draw_stable_degree_label(self, painter):
@@ -419,9 +697,9 @@ class OpenGLView(QOpenGLWidget):
             
             # Use simpler calculation untuk stability
             if abs(axis.z) < 0.9:
-                u = Vector3(0, 0, 1).cross(axis).normalize()
+                u = Vector3.UNIT_Z.cross(axis).normalize()
             else:
-                u = Vector3(1, 0, 0).cross(axis).normalize()
+                u = Vector3.UNIT_X.cross(axis).normalize()
             
             label_radius = 3.0
             mid_angle = math.radians(self.rotation_angle / 2)
@@ -453,7 +731,7 @@ class OpenGLView(QOpenGLWidget):
                 painter.drawText(int(label_screen[0] + 12), int(label_screen[1]), degree_text)
             
         except Exception as e:
-            print(f"Error drawing stable degree label: {e}")
+            logger.error("Error drawing stable degree label: %s", e)
     
     def stable_world_to_screen(self, x, y, z):
         try:
@@ -0,0 +1,74 @@
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+from .frame_stats import FrameStats
+
+# Urutan dan label tahap yang ditampilkan
+STAGE_LABELS = [
+    ('camera', "Camera setup"),
+    ('cache_matrices', "Cache matrices"),
+    ('axes', "Axes"),
+    ('rotation_viz', "Rotation viz"),
+    ('objects', "Objects"),
+    ('trail', "Trail"),
+    ('comparison', "Comparison"),
+    ('labels', "2D labels")
+]
+
+COUNTER_LABELS = [
+    ('draw_calls', "Draw calls"),
+    ('vertices', "Vertices"),
+    ('edges', "Edges"),
+    ('instances', "Instances"),
+    ('culled', "Culled")
+]
+
+class PerformanceHUD:
+    def __init__(self, title: str = ""):
+        self.title = title
+        self.visible = False
+
+        self.font = QFont("Courier", 9)
+        self.font.setStyleHint(QFont.StyleHint.Monospace)
+        self.font_metrics = QFontMetrics(self.font)
+
+        self.text_color = QColor(220, 220, 220)
+        self.title_color = QColor(255, 200, 80)
+        self.background_color = QColor(0, 0, 0, 170)
+        self.margin = 8
+        self.padding = 6
+
+    def build_lines(self, stats: FrameStats) -> list:
+        stages, counts = stats.recent_average()
+        total = stages.get('total', 0.0)
+
+        lines = [
+            f"{self.title} FPS {stats.fps():6.1f}",
+            f"Frame        {total * 1000.0:7.2f} ms"
+        ]
+        for key, label in STAGE_LABELS:
+            if key in stages:
+                lines.append(f"  {label:<14}{stages[key] * 1000.0:7.2f} ms")
+        for key, label in COUNTER_LABELS:
+            value = f"{counts[key]:,.0f}" if key in counts else "n/a"
+            lines.append(f"{label:<13}{value:>9}")
+        return lines
+
+    def draw(self, painter: QPainter, stats: FrameStats):
+        if not self.visible:
+            return
+
+        lines = self.build_lines(stats)
+        line_height = self.font_metrics.height()
+        width = max(self.font_metrics.horizontalAdvance(line) for line in lines) + 2 * self.padding
+        height = line_height * len(lines) + 2 * self.padding
+
+        painter.save()
+        painter.setFont(self.font)
+        painter.fillRect(self.margin, self.margin, width, height, self.background_color)
+
+        y = self.margin + self.padding + self.font_metrics.ascent()
+        for index, line in enumerate(lines):
+            painter.setPen(self.title_color if index == 0 else self.text_color)
+            painter.drawText(self.margin + self.padding, y, line)
+            y += line_height
+        painter.restore()
@@ -1,22 +1,22 @@
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtCore import Signal
 
-from ..styles.theme import DarkTheme
+from ..styles.theme import set_style_role
 
 class PrimaryButton(QPushButton):
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(DarkTheme.primary_button())
+        set_style_role(self, "primary")
     
 class SecondaryButton(QPushButton):
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(DarkTheme.secondary_button())
+        set_style_role(self, "secondary")
 
 class WarningButton(QPushButton):
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(DarkTheme.warning_button())
+        set_style_role(self, "warning")
 
 class ToggleRendererButton(WarningButton):
     renderer_toggled = Signal(bool)
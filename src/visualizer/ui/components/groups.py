@@ -1,12 +1,9 @@
 from PySide6.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QGridLayout
 from PySide6.QtCore import Qt
 
-from ..styles.theme import DarkTheme
-
 class BaseGroupBox(QGroupBox):
     def __init__(self, title="", parent=None):
         super().__init__(title, parent)
-        self.setStyleSheet(DarkTheme.group_box())
 
 class VerticalGroupBox(BaseGroupBox):
     def __init__(self, title="", parent=None):
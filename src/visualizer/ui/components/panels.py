@@ -1,12 +1,12 @@
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QWidget
 from PySide6.QtCore import Qt
 
-from ..styles.theme import DarkTheme
+from ..styles.theme import set_style_role
 
 class BasePanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(DarkTheme.control_panel())
+        set_style_role(self, "panel")
         self.setFrameStyle(QFrame.styledPanel)
 
 class ControlPanel(BasePanel):
@@ -1,12 +1,15 @@
 from .colors import UIColors, VisualizationColors, hex_to_rgb, rgb_to_hex, get_method_color
 from .fonts import UIFonts
-from .theme import DarkTheme
+from .theme import DarkTheme, set_style_role
+from .theme_engine import ThemeEngine
 
 __all__ = [
     'UIColors',
     'VisualizationColors', 
     'UIFonts',
     'DarkTheme',
+    'ThemeEngine',
+    'set_style_role',
     'hex_to_rgb',
     'rgb_to_hex',
     'get_method_color'
@@ -40,6 +40,11 @@ class UIColors:
     BORDER_COLOR = "#555555" # Default
     BORDER_HOVER = "#777777" # Hover
 
+    # Warna tampilan nilai hasil perhitungan
+    TEXT_VALUE = "#E0E0E0"
+    VALUE_BACKGROUND = "#2A2A2A"
+    VALUE_BORDER = "#404040"
+
     # Warna scrollbar
     SCROLLBAR_BACKGROUND = "#2b2b2b" # Background
     SCROLLBAR_HANDLE = "#555555" # Handle
@@ -5,16 +5,16 @@ class DarkTheme:
     @staticmethod
     def main_window() -> str:
         return f"""
-        QMainWindow {{
+        QMainWindow, QDialog {{
             background-color: {UIColors.BACKGROUND_DARK};
             color: {UIColors.TEXT_PRIMARY};
         }}
         """
     
     @staticmethod
-    def title_label() -> str:
+    def title_label(selector: str = "QLabel") -> str:
         return f"""
-        QLabel {{ 
+        {selector} {{ 
             color: {UIColors.PRIMARY_BLUE}; 
             padding: 4px;
             border-bottom: 1px solid {UIColors.PRIMARY_BLUE};
@@ -28,9 +28,9 @@ class DarkTheme:
         """
     
     @staticmethod
-    def control_panel() -> str:
+    def control_panel(selector: str = "QFrame") -> str:
         return f"""
-        QFrame {{
+        {selector} {{
             background-color: {UIColors.PANEL_BACKGROUND};
             color: {UIColors.TEXT_PRIMARY};
             border: 1px solid {UIColors.BORDER_COLOR};
@@ -39,9 +39,9 @@ class DarkTheme:
         """
     
     @staticmethod
-    def section_title() -> str:
+    def section_title(selector: str = "QLabel") -> str:
         return f"""
-        QLabel {{ 
+        {selector} {{ 
             color: {UIColors.ACCENT_BLUE}; 
             border-bottom: 1px solid {UIColors.ACCENT_BLUE}; 
             padding-bottom: 3px; 
@@ -76,9 +76,9 @@ class DarkTheme:
         """
     
     @staticmethod
-    def primary_button() -> str:
+    def primary_button(selector: str = "QPushButton") -> str:
         return f"""
-        QPushButton {{ 
+        {selector} {{ 
             padding: 8px; 
             font-size: {UIFonts.NORMAL_SIZE}px; 
             font-weight: bold;
@@ -89,22 +89,22 @@ class DarkTheme:
             border: none;
             font-family: {UIFonts.FAMILY};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {UIColors.PRIMARY_BLUE_HOVER};
         }}
-        QPushButton:pressed {{
+        {selector}:pressed {{
             background-color: {UIColors.PRIMARY_BLUE_PRESSED};
         }}
-        QPushButton:disabled {{
+        {selector}:disabled {{
             background-color: {UIColors.BUTTON_DISABLED};
             color: {UIColors.TEXT_DISABLED};
         }}
         """
     
     @staticmethod
-    def secondary_button() -> str:
+    def secondary_button(selector: str = "QPushButton") -> str:
         return f"""
-        QPushButton {{ 
+        {selector} {{ 
             padding: 6px; 
             font-size: {UIFonts.SMALL_SIZE}px; 
             background-color: {UIColors.BUTTON_SECONDARY};
@@ -114,19 +114,19 @@ class DarkTheme:
             min-height: 24px;
             font-family: {UIFonts.FAMILY};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {UIColors.BUTTON_SECONDARY_HOVER};
             border: 1px solid {UIColors.BORDER_HOVER};
         }}
-        QPushButton:pressed {{
+        {selector}:pressed {{
             background-color: {UIColors.BUTTON_SECONDARY_PRESSED};
         }}
         """
     
     @staticmethod
-    def warning_button() -> str:
+    def warning_button(selector: str = "QPushButton") -> str:
         return f"""
-        QPushButton {{ 
+        {selector} {{ 
             padding: 6px; 
             font-size: {UIFonts.SMALL_SIZE}px; 
             background-color: {UIColors.WARNING_ORANGE};
@@ -136,10 +136,10 @@ class DarkTheme:
             min-height: 24px;
             font-family: {UIFonts.FAMILY};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {UIColors.WARNING_ORANGE_HOVER};
         }}
-        QPushButton:pressed {{
+        {selector}:pressed {{
             background-color: {UIColors.WARNING_ORANGE_PRESSED};
         }}
         """
@@ -226,14 +226,26 @@ class DarkTheme:
         """
     
     @staticmethod
-    def separator() -> str:
+    def separator(selector: str = "QFrame") -> str:
         return f"""
-        QFrame {{
+        {selector} {{
             background-color: {UIColors.BORDER_COLOR};
             border: none;
         }}
         """
     
+    @staticmethod
+    def value_display(selector: str = "QLabel", padding: str = "2px 4px", radius: int = 2) -> str:
+        return f"""
+        {selector} {{
+            color: {UIColors.TEXT_VALUE};
+            background-color: {UIColors.VALUE_BACKGROUND};
+            padding: {padding};
+            border: 1px solid {UIColors.VALUE_BORDER};
+            border-radius: {radius}px;
+        }}
+        """
+    
     @staticmethod
     def get_complete_stylesheet() -> str:
         return f"""
@@ -248,4 +260,33 @@ class DarkTheme:
         {DarkTheme.combo_box()}
         {DarkTheme.label()}
         {DarkTheme.separator()}
-        """
\ No newline at end of file
+        """
+    
+    @staticmethod
+    def application_stylesheet() -> str:
+        # Satu stylesheet untuk seluruh aplikasi; gaya khusus dipilih lewat
+        # properti "role" (lihat set_style_role) atau objectName, bukan setStyleSheet per widget
+        return f"""
+        {DarkTheme.main_window()}
+        {DarkTheme.label()}
+        {DarkTheme.group_box()}
+        {DarkTheme.secondary_button()}
+        {DarkTheme.primary_button('QPushButton[role="primary"]')}
+        {DarkTheme.warning_button('QPushButton[role="warning"]')}
+        {DarkTheme.text_edit()}
+        {DarkTheme.spin_box()}
+        {DarkTheme.combo_box()}
+        {DarkTheme.control_panel('QFrame[role="panel"]')}
+        {DarkTheme.separator('QFrame[role="separator"]')}
+        {DarkTheme.title_label('QLabel[role="title"]')}
+        {DarkTheme.section_title('QLabel[role="section"]')}
+        {DarkTheme.value_display('QLabel[role="value"]')}
+        {DarkTheme.value_display('QLabel#angleDisplay', padding="4px 8px", radius=3)}
+        QGroupBox QPushButton {{
+            font-weight: bold;
+        }}
+        """
+
+def set_style_role(widget, role: str):
+    # Dipanggil sebelum widget tampil agar tidak perlu re-polish
+    widget.setProperty("role", role)
@@ -0,0 +1,72 @@
+import hashlib
+from pathlib import Path
+
+from .theme import DarkTheme
+from ...config.paths import CACHE_DIR
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
+
+THEME_CACHE_FILE = CACHE_DIR / "theme.qss"
+
+# Cache dianggap basi jika salah satu file sumber tema berubah
+_THEME_SOURCES = tuple(Path(__file__).parent / name for name in ("theme.py", "colors.py", "fonts.py"))
+
+class ThemeEngine:
+    # Stylesheet aplikasi dikompilasi sekali per proses dan disimpan di CACHE_DIR antar run
+    _compiled = None
+
+    @staticmethod
+    def source_key() -> str:
+        digest = hashlib.sha1()
+        for path in _THEME_SOURCES:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def compile() -> str:
+        # Rapikan whitespace agar parser Qt membaca teks sesingkat mungkin
+        lines = (line.strip() for line in DarkTheme.application_stylesheet().splitlines())
+        return "\n".join(line for line in lines if line)
+
+    @staticmethod
+    def load_cached(key: str, path: Path = THEME_CACHE_FILE) -> str:
+        try:
+            header, _, body = path.read_text(encoding="utf-8").partition("\n")
+        except OSError:
+            return None
+        return body if header == f"/* {key} */" else None
+
+    @staticmethod
+    def save_cached(key: str, stylesheet: str, path: Path = THEME_CACHE_FILE):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"/* {key} */\n{stylesheet}", encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write theme cache %s: %s", path, e)
+
+    @staticmethod
+    def stylesheet() -> str:
+        if ThemeEngine._compiled is None:
+            try:
+                key = ThemeEngine.source_key()
+            except OSError:
+                key = None
+
+            stylesheet = ThemeEngine.load_cached(key) if key else None
+            if stylesheet is None:
+                stylesheet = ThemeEngine.compile()
+                if key:
+                    ThemeEngine.save_cached(key, stylesheet)
+            ThemeEngine._compiled = stylesheet
+        return ThemeEngine._compiled
+
+    @staticmethod
+    def apply(app) -> bool:
+        # Qt mem-parse ulang stylesheet pada setiap setStyleSheet, jadi lewati jika sudah terpasang
+        stylesheet = ThemeEngine.stylesheet()
+        if app.styleSheet() == stylesheet:
+            return False
+        app.setStyleSheet(stylesheet)
+        return True
@@ -3,11 +3,15 @@ from .quaternion_controls import QuaternionControls
 from .euler_controls import EulerControls
 from .tait_bryan_controls import TaitBryanControls
 from .exponential_controls import ExponentialControls
+from .playback_controls import PlaybackControls
+from .live_feed_controls import LiveFeedControls
 
 __all__ = [
     "RotationMethodWidget",
     "QuaternionControls",
     "EulerControls", 
     "TaitBryanControls",
-    "ExponentialControls"
+    "ExponentialControls",
+    "PlaybackControls",
+    "LiveFeedControls"
 ]
\ No newline at end of file
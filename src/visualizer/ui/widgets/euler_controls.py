@@ -3,7 +3,6 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Signal
 
 from ...core.math.euler_angle import EulerAngle
-from ..styles.theme import DarkTheme
 from ..styles.fonts import UIFonts
 
 class EulerControls(QWidget):
@@ -22,18 +21,15 @@ class EulerControls(QWidget):
         # Rotation order
         order_label = QLabel("Rotation Order:")
         order_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        order_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(order_label, 0, 0)
         
         self.order_combo = QComboBox()
         self.order_combo.addItems(EulerAngle.ROTATION_ORDERS)
-        self.order_combo.setStyleSheet(DarkTheme.combo_box())
         layout.addWidget(self.order_combo, 0, 1)
         
         # X rotation
         x_label = QLabel("X Rotation (°):")
         x_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        x_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(x_label, 1, 0)
         
         self.x_angle_spin = QDoubleSpinBox()
@@ -41,13 +37,11 @@ class EulerControls(QWidget):
         self.x_angle_spin.setValue(0.0)
         self.x_angle_spin.setSingleStep(1.0)
         self.x_angle_spin.setDecimals(1)
-        self.x_angle_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.x_angle_spin, 1, 1)
         
         # Y rotation
         y_label = QLabel("Y Rotation (°):")
         y_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        y_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(y_label, 2, 0)
         
         self.y_angle_spin = QDoubleSpinBox()
@@ -55,13 +49,11 @@ class EulerControls(QWidget):
         self.y_angle_spin.setValue(0.0)
         self.y_angle_spin.setSingleStep(1.0)
         self.y_angle_spin.setDecimals(1)
-        self.y_angle_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.y_angle_spin, 2, 1)
         
         # Z rotation
         z_label = QLabel("Z Rotation (°):")
         z_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        z_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(z_label, 3, 0)
         
         self.z_angle_spin = QDoubleSpinBox()
@@ -69,14 +61,13 @@ class EulerControls(QWidget):
         self.z_angle_spin.setValue(45.0)
         self.z_angle_spin.setSingleStep(1.0)
         self.z_angle_spin.setDecimals(1)
-        self.z_angle_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.z_angle_spin, 3, 1)
     
     def connect_signals(self):
-        self.order_combo.currentTextChanged.connect(self.valueChanged.emit)
-        self.x_angle_spin.valueChanged.connect(self.valueChanged.emit)
-        self.y_angle_spin.valueChanged.connect(self.valueChanged.emit)
-        self.z_angle_spin.valueChanged.connect(self.valueChanged.emit)
+        self.order_combo.currentTextChanged.connect(lambda _: self.valueChanged.emit())
+        self.x_angle_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
+        self.y_angle_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
+        self.z_angle_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
     
     def get_rotation(self):
         return EulerAngle(
@@ -86,6 +77,12 @@ class EulerControls(QWidget):
             self.order_combo.currentText()
         )
         
+    def set_rotation(self, euler_angle):
+        self.order_combo.setCurrentText(euler_angle.order)
+        self.x_angle_spin.setValue(euler_angle.x_angle)
+        self.y_angle_spin.setValue(euler_angle.y_angle)
+        self.z_angle_spin.setValue(euler_angle.z_angle)
+        
     def reset_to_identity(self):
         self.x_angle_spin.setValue(0.0)
         self.y_angle_spin.setValue(0.0)
@@ -0,0 +1,123 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit
+from PySide6.QtCore import Signal, QTimer, QElapsedTimer
+from PySide6.QtGui import QFont
+
+from ...config import ANIMATION_FRAME_RATE, LIVE_FEED_ADDRESS
+from ...core.io.orientation_feed import OrientationFeed
+from ...core.math.rotation_conversion import RotationConversion
+from ...diagnostics.log import get_logger
+from ..styles.theme import set_style_role
+from ..styles.fonts import UIFonts
+
+logger = get_logger(__name__)
+
+class LiveFeedControls(QWidget):
+    # Emits the 3x3 rotation matrix of the newest received pose, at most once per frame
+    pose_changed = Signal(object)
+    feed_started = Signal()
+    feed_stopped = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.feed = None
+        self.poses_shown = 0
+
+        # Polling at the display rate is what coalesces the feed: every message that
+        # arrived since the last tick is replaced by the newest one
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / ANIMATION_FRAME_RATE)))
+        self.timer.timeout.connect(self.on_tick)
+
+        self.status_clock = QElapsedTimer()
+        self.status_counts = (0, 0)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        address_row = QHBoxLayout()
+        self.address_input = QLineEdit(LIVE_FEED_ADDRESS)
+        self.address_input.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
+        self.address_input.setToolTip("udp://host:port, tcp://host:port or unix:///path")
+        address_row.addWidget(self.address_input, 1)
+
+        self.listen_button = QPushButton("Listen")
+        self.listen_button.setFixedWidth(56)
+        self.listen_button.clicked.connect(self.toggle_feed)
+        set_style_role(self.listen_button, "secondary")
+        address_row.addWidget(self.listen_button)
+        layout.addLayout(address_row)
+
+        self.status_label = QLabel("Not listening")
+        self.status_label.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
+        layout.addWidget(self.status_label)
+
+    def toggle_feed(self):
+        if self.feed:
+            self.stop_feed()
+        else:
+            self.start_feed(self.address_input.text().strip())
+
+    def start_feed(self, address: str) -> bool:
+        self.stop_feed()
+        try:
+            feed = OrientationFeed(address)
+            feed.start()
+        except (ValueError, OSError) as e:
+            logger.error("Could not start orientation feed %s: %s", address, e)
+            self.status_label.setText(f"Error: {e}")
+            return False
+
+        self.feed = feed
+        self.address_input.setText(address)
+        self.address_input.setEnabled(False)
+        self.listen_button.setText("Stop")
+        self.poses_shown = 0
+        self.status_counts = (0, 0)
+        self.status_clock.start()
+        self.status_label.setText(f"Listening on {address}")
+        self.timer.start()
+        self.feed_started.emit()
+        return True
+
+    def stop_feed(self):
+        if not self.feed:
+            return
+        self.timer.stop()
+        self.feed.stop()
+        stats = self.feed.stats()
+        logger.info("Orientation feed %s closed: %d received, %d shown, %d coalesced, %d invalid",
+                    self.feed.address, stats['received'], stats['delivered'], stats['coalesced'], stats['errors'])
+        self.feed = None
+        self.address_input.setEnabled(True)
+        self.listen_button.setText("Listen")
+        self.status_label.setText("Not listening")
+        self.feed_stopped.emit()
+
+    def on_tick(self):
+        rotation = self.feed.take_latest()
+        if rotation:
+            # Streamed poses are one-off; converting directly keeps them out of the rotation cache
+            rotation_obj, _ = rotation
+            self.pose_changed.emit(RotationConversion.quaternion_to_matrix(RotationConversion.rotation_to_array(rotation_obj)))
+            self.poses_shown += 1
+
+        if self.status_clock.elapsed() >= 1000:
+            self.update_status()
+
+    def update_status(self):
+        elapsed_s = self.status_clock.restart() / 1000.0
+        stats = self.feed.stats()
+        received, shown = self.status_counts
+        self.status_counts = (stats['received'], self.poses_shown)
+
+        text = (f"{(stats['received'] - received) / elapsed_s:6.0f} msg/s -> "
+                f"{(self.poses_shown - shown) / elapsed_s:3.0f} poses/s")
+        if stats['errors']:
+            text += f", {stats['errors']} invalid"
+        self.status_label.setText(text)
+        if self.feed.last_error:
+            self.status_label.setToolTip(self.feed.last_error)
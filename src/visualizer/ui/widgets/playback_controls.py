@@ -0,0 +1,287 @@
+from pathlib import Path
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QComboBox, QSlider, QCheckBox, QFileDialog, QMessageBox, QApplication
+)
+from PySide6.QtCore import Qt, Signal, QTimer, QElapsedTimer
+from PySide6.QtGui import QFont
+
+from ...config import ANIMATION_FRAME_RATE
+from ...core.animation.orientation_playback import OrientationPlayback
+from ...core.io.orientation_log import OrientationLog
+from ...core.math.euler_angle import EulerAngle
+from ...core.math.orientation_average import OrientationStatisticsJob
+from ...core.math.rotation_conversion import RotationConversion
+from ...diagnostics.tracing import traced
+from ...diagnostics.log import get_logger
+from ..workers.rotation_worker import RotationWorker
+from ..styles.theme import set_style_role
+from ..styles.fonts import UIFonts
+
+logger = get_logger(__name__)
+
+# (label, representation, Euler order); None lets the CSV header decide
+LOG_FORMATS = (
+    [("Auto (header)", None, "XYZ"), ("Quaternion", "quaternion", "XYZ")]
+    + [(f"Euler {order}", "euler", order) for order in EulerAngle.ROTATION_ORDERS]
+    + [("Tait-Bryan", "tait_bryan", "XYZ"), ("Exponential Map", "exp_map", "XYZ")]
+)
+
+PLAYBACK_SPEEDS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 10.0)
+
+class PlaybackControls(QWidget):
+    # Emits the 3x3 rotation matrix of the pose at the playback position
+    pose_changed = Signal(object)
+    playback_closed = Signal()
+    # Playback or a log statistics job takes over the pose (e.g. from a live feed)
+    playback_started = Signal()
+    # Mean orientation and cluster summary of the whole log
+    statistics_ready = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.playback = None
+
+        # Ticks at the display rate; the wall clock decides how far playback moves
+        self.clock = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / ANIMATION_FRAME_RATE)))
+        self.timer.timeout.connect(self.on_tick)
+
+        # Averaging and clustering a long log takes seconds; it runs off the GUI thread
+        self.statistics_worker = RotationWorker(self, max_threads=1)
+        self.statistics_worker.progress.connect(self.on_average_progress)
+        self.statistics_worker.finished.connect(self.on_average_finished)
+        self.statistics_worker.failed.connect(self.on_average_failed)
+
+        self.setup_ui()
+        self.update_controls()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        file_row = QHBoxLayout()
+        self.format_combo = QComboBox()
+        self.format_combo.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
+        for label, _, _ in LOG_FORMATS:
+            self.format_combo.addItem(label)
+        file_row.addWidget(self.format_combo, 1)
+
+        self.open_button = QPushButton("Open Log")
+        self.open_button.clicked.connect(self.open_log)
+        set_style_role(self.open_button, "secondary")
+        file_row.addWidget(self.open_button)
+        layout.addLayout(file_row)
+
+        transport_row = QHBoxLayout()
+        self.play_button = QPushButton("Play")
+        self.play_button.setFixedWidth(56)
+        self.play_button.clicked.connect(self.toggle_playback)
+        set_style_role(self.play_button, "primary")
+        transport_row.addWidget(self.play_button)
+
+        self.position_slider = QSlider(Qt.Orientation.Horizontal)
+        self.position_slider.valueChanged.connect(self.on_slider_moved)
+        transport_row.addWidget(self.position_slider, 1)
+        layout.addLayout(transport_row)
+
+        status_row = QHBoxLayout()
+        self.time_label = QLabel("No log loaded")
+        self.time_label.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
+        status_row.addWidget(self.time_label, 1)
+
+        self.speed_combo = QComboBox()
+        self.speed_combo.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
+        for speed in PLAYBACK_SPEEDS:
+            self.speed_combo.addItem(f"{speed:g}x", speed)
+        self.speed_combo.setCurrentIndex(PLAYBACK_SPEEDS.index(1.0))
+        self.speed_combo.currentIndexChanged.connect(self.on_speed_changed)
+        status_row.addWidget(self.speed_combo)
+
+        self.loop_checkbox = QCheckBox("Loop")
+        self.loop_checkbox.toggled.connect(self.on_loop_toggled)
+        status_row.addWidget(self.loop_checkbox)
+
+        self.average_button = QPushButton("Average")
+        self.average_button.setToolTip("Show the mean orientation of the whole log and cluster its poses")
+        self.average_button.clicked.connect(self.show_average)
+        set_style_role(self.average_button, "secondary")
+        status_row.addWidget(self.average_button)
+        layout.addLayout(status_row)
+
+    @traced("PlaybackControls.open_log", "ui")
+    def open_log(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Orientation Log",
+            str(Path.home()),
+            "Orientation Logs (*.csv *.txt *.npy *.bin);;All Files (*)"
+        )
+        if file_path:
+            self.load_log(file_path)
+
+    def load_log(self, file_path: str) -> bool:
+        _, method, order = LOG_FORMATS[self.format_combo.currentIndex()]
+
+        # The first open of a CSV converts it to a memory-mapped cache file
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            log = OrientationLog.open(file_path, method, order)
+        except Exception as e:
+            logger.error("Error loading orientation log %s: %s", file_path, e)
+            QMessageBox.critical(self, "Log Error", f"Error loading orientation log: {e}")
+            return False
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.close_log()
+        self.playback = OrientationPlayback(log)
+        self.playback.speed = self.speed_combo.currentData()
+        self.playback.loop = self.loop_checkbox.isChecked()
+        logger.info("Loaded orientation log %s: %d %s samples, %.1f s", log.path.name, len(log), log.method, log.duration)
+
+        self.update_controls()
+        self.emit_pose()
+        return True
+
+    def close_log(self):
+        if not self.playback:
+            return
+        self.statistics_worker.cancel()
+        self.timer.stop()
+        self.playback = None
+        self.update_controls()
+        self.playback_closed.emit()
+
+    def toggle_playback(self):
+        if not self.playback:
+            return
+        if self.playback.playing:
+            self.pause()
+        else:
+            self.playback_started.emit()
+            self.playback.play()
+            self.clock.start()
+            self.timer.start()
+            self.update_controls()
+
+    def pause(self):
+        if self.playback and self.playback.playing:
+            self.playback.pause()
+            self.timer.stop()
+            self.update_controls()
+
+    def release_pose(self):
+        # Another pose source took over: stop playback and drop a pending average result
+        self.pause()
+        if self.statistics_worker.busy:
+            self.statistics_worker.cancel()
+            self.update_controls()
+
+    def on_tick(self):
+        if not self.playback:
+            self.timer.stop()
+            return
+
+        # Wall-clock delta keeps playback in real time even when ticks are late
+        self.playback.advance(self.clock.restart() / 1000.0)
+        self.emit_pose()
+        if not self.playback.playing:
+            self.timer.stop()
+        self.update_controls()
+
+    def on_slider_moved(self, frame: int):
+        if not self.playback:
+            return
+        self.playback.seek(frame / self.playback.frame_rate)
+        self.emit_pose()
+        self.update_time_label()
+
+    def on_speed_changed(self, index: int):
+        if self.playback:
+            self.playback.speed = self.speed_combo.itemData(index)
+
+    def on_loop_toggled(self, checked: bool):
+        if self.playback:
+            self.playback.loop = checked
+
+    def emit_pose(self):
+        if self.playback:
+            try:
+                self.pose_changed.emit(self.playback.matrix())
+            except Exception as e:
+                logger.error("Error reading orientation log: %s", e)
+                self.pause()
+
+    @traced("PlaybackControls.show_average", "ui")
+    def show_average(self):
+        # A second click while the statistics job runs cancels it
+        if self.statistics_worker.busy:
+            self.statistics_worker.cancel()
+            self.update_controls()
+            return
+        if not self.playback:
+            return
+        self.pause()
+        self.playback_started.emit()
+
+        # The memmap is converted chunk by chunk on every pass
+        log = self.playback.log
+        self.statistics_worker.start(OrientationStatisticsJob(log.data, log.rows_to_quaternions))
+        self.average_button.setText("Cancel")
+
+    def on_average_progress(self, percent: int):
+        self.average_button.setText(f"Cancel {percent}%")
+
+    def on_average_finished(self, job, result):
+        average, clusters = result
+        self.update_controls()
+        try:
+            mean = average.mean()
+        except ValueError as e:
+            self.on_average_failed(job, str(e))
+            return
+
+        axis, angle = RotationConversion.quaternion_to_axis_angle(mean)
+        w, x, y, z = mean
+        self.pose_changed.emit(RotationConversion.quaternion_to_matrix(mean))
+        self.statistics_ready.emit(
+            f"Mean orientation of {len(average):,} samples: q = ({w:.4f}, {x:.4f}, {y:.4f}, {z:.4f}), "
+            f"{angle:.2f}° about ({axis[0]:.3f}, {axis[1]:.3f}, {axis[2]:.3f}), "
+            f"concentration {average.concentration:.4f}\n{clusters.summary()}"
+        )
+
+    def on_average_failed(self, job, message: str):
+        self.update_controls()
+        logger.error("Error averaging orientation log: %s", message)
+        QMessageBox.critical(self, "Log Error", f"Error averaging orientation log: {message}")
+
+    def shutdown(self):
+        self.statistics_worker.shutdown()
+
+    def update_controls(self):
+        loaded = self.playback is not None
+        self.play_button.setEnabled(loaded)
+        self.average_button.setEnabled(loaded)
+        if not self.statistics_worker.busy:
+            self.average_button.setText("Average")
+        self.position_slider.setEnabled(loaded)
+        self.play_button.setText("Pause" if loaded and self.playback.playing else "Play")
+
+        # Moving the slider from code must not trigger another seek
+        self.position_slider.blockSignals(True)
+        if loaded:
+            self.position_slider.setRange(0, self.playback.frame_count - 1)
+            self.position_slider.setValue(self.playback.frame_at(self.playback.position))
+        else:
+            self.position_slider.setRange(0, 0)
+        self.position_slider.blockSignals(False)
+        self.update_time_label()
+
+    def update_time_label(self):
+        if not self.playback:
+            self.time_label.setText("No log loaded")
+            return
+        self.time_label.setText(f"{self.playback.position:8.2f} / {self.playback.duration:.2f} s")
@@ -9,7 +9,7 @@ from PySide6.QtGui import QFont
 
 from ...core.math.quaternion import Quaternion
 from ...core.math.vector3 import Vector3
-from ..styles.theme import DarkTheme
+from ..styles.theme import set_style_role
 from ..styles.fonts import UIFonts
 
 class QuaternionControls(QWidget):
@@ -35,7 +35,6 @@ class QuaternionControls(QWidget):
         """Input for Unit Quaternion as per specification"""
         group = QGroupBox("Unit Quaternion Input (w + xi + yj + zk)")
         group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE, QFont.Weight.Bold))
-        group.setStyleSheet(DarkTheme.group_box())
         
         layout = QFormLayout(group)
         layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
@@ -54,7 +53,6 @@ class QuaternionControls(QWidget):
             spinbox.setDecimals(4)
             spinbox.setSingleStep(0.01)
             spinbox.setMinimumWidth(100)
-            spinbox.setStyleSheet(DarkTheme.spin_box())
         
         # Set default identity quaternion
         self.w_input.setValue(1.0)
@@ -65,22 +63,18 @@ class QuaternionControls(QWidget):
         # Add to layout with proper labels
         w_label = QLabel("w:")
         w_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        w_label.setStyleSheet(DarkTheme.label())
         layout.addRow(w_label, self.w_input)
         
         x_label = QLabel("x:")
         x_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        x_label.setStyleSheet(DarkTheme.label())
         layout.addRow(x_label, self.x_input)
         
         y_label = QLabel("y:")
         y_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        y_label.setStyleSheet(DarkTheme.label())
         layout.addRow(y_label, self.y_input)
         
         z_label = QLabel("z:")
         z_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        z_label.setStyleSheet(DarkTheme.label())
         layout.addRow(z_label, self.z_input)
         
         parent_layout.addWidget(group)
@@ -88,7 +82,6 @@ class QuaternionControls(QWidget):
     def setup_computed_display_group(self, parent_layout):
         group = QGroupBox("Computed Axis & Angle")
         group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE, QFont.Weight.Bold))
-        group.setStyleSheet(DarkTheme.group_box())
         
         layout = QFormLayout(group)
         layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
@@ -107,21 +100,18 @@ class QuaternionControls(QWidget):
         
         for label in [self.axis_x_display, self.axis_y_display, self.axis_z_display]:
             label.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
-            label.setStyleSheet(f"color: #E0E0E0; background-color: #2A2A2A; padding: 2px 4px; border: 1px solid #404040; border-radius: 2px;")
+            set_style_role(label, "value")
             label.setMinimumWidth(50)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         x_label = QLabel("x:")
         x_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        x_label.setStyleSheet(DarkTheme.label())
         
         y_label = QLabel("y:")
         y_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        y_label.setStyleSheet(DarkTheme.label())
         
         z_label = QLabel("z:")
         z_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        z_label.setStyleSheet(DarkTheme.label())
         
         axis_layout.addWidget(x_label)
         axis_layout.addWidget(self.axis_x_display)
@@ -133,19 +123,17 @@ class QuaternionControls(QWidget):
         
         axis_title = QLabel("Axis:")
         axis_title.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        axis_title.setStyleSheet(DarkTheme.label())
         layout.addRow(axis_title, axis_container)
         
         # Angle display
         self.angle_display = QLabel("0.0°")
         self.angle_display.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
-        self.angle_display.setStyleSheet(f"color: #E0E0E0; background-color: #2A2A2A; padding: 4px 8px; border: 1px solid #404040; border-radius: 3px;")
+        self.angle_display.setObjectName("angleDisplay")
         self.angle_display.setMinimumWidth(80)
         self.angle_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         angle_title = QLabel("Angle:")
         angle_title.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        angle_title.setStyleSheet(DarkTheme.label())
         layout.addRow(angle_title, self.angle_display)
         
         parent_layout.addWidget(group)
@@ -163,7 +151,10 @@ class QuaternionControls(QWidget):
         y = self.y_input.value()
         z = self.z_input.value()
         
-        self.current_quaternion = Quaternion(w, x, y, z)
+        self.apply_quaternion(Quaternion(w, x, y, z))
+        
+    def apply_quaternion(self, quaternion):
+        self.current_quaternion = quaternion
         self.update_computed_values()
         
         # Emit signals
@@ -200,6 +191,18 @@ class QuaternionControls(QWidget):
         
         self.on_quaternion_changed()
         
+    def set_rotation(self, quaternion):
+        self.block_signals(True)
+        self.w_input.setValue(quaternion.w)
+        self.x_input.setValue(quaternion.x)
+        self.y_input.setValue(quaternion.y)
+        self.z_input.setValue(quaternion.z)
+        self.block_signals(False)
+        
+        # The spinboxes only show 4 decimals; keep the exact quaternion (e.g. from undo/redo)
+        # until the user edits a value
+        self.apply_quaternion(quaternion.copy())
+        
     def get_current_quaternion(self):
         return self.current_quaternion
         
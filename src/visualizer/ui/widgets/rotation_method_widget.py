@@ -7,14 +7,36 @@ from .quaternion_controls import QuaternionControls
 from .euler_controls import EulerControls
 from .tait_bryan_controls import TaitBryanControls
 from .exponential_controls import ExponentialControls
-from ..styles.theme import DarkTheme
+from ..styles.theme import set_style_role
 from ..styles.fonts import UIFonts
+from ...diagnostics.log import get_logger
+from ...diagnostics.tracing import tracer
+
+logger = get_logger(__name__)
 
 class RotationMethodWidget(QWidget):
     rotation_changed = Signal(object)  # Emit rotation object
     
+    # (method, label, page class, attribute, change signal, handler) in combo order
+    PAGE_SPECS = [
+        (RotationMethod.QUATERNION, "Unit Quaternion", QuaternionControls,
+         'quaternion_widget', 'quaternion_changed', 'on_quaternion_changed'),
+        (RotationMethod.EULER_ANGLE, "Euler Angle", EulerControls,
+         'euler_widget', 'valueChanged', 'on_euler_changed'),
+        (RotationMethod.TAIT_BRYAN, "Tait-Bryan", TaitBryanControls,
+         'tait_bryan_widget', 'valueChanged', 'on_tait_bryan_changed'),
+        (RotationMethod.EXPONENTIAL_MAP, "Exponential Map", ExponentialControls,
+         'exponential_widget', 'valueChanged', 'on_exponential_changed'),
+    ]
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Control pages are created the first time their method is selected
+        self.quaternion_widget = None
+        self.euler_widget = None
+        self.tait_bryan_widget = None
+        self.exponential_widget = None
+        
         self.setup_ui()
         self.connect_signals()
     
@@ -24,56 +46,61 @@ class RotationMethodWidget(QWidget):
         # Method selection
         title_label = QLabel("Rotation Method")
         title_label.setFont(QFont(UIFonts.FAMILY, UIFonts.NORMAL_SIZE, QFont.Weight.Bold))
-        title_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(title_label)
         
         self.method_combo = QComboBox()
-        self.method_combo.addItem("Unit Quaternion", RotationMethod.QUATERNION)
-        self.method_combo.addItem("Euler Angle", RotationMethod.EULER_ANGLE)
-        self.method_combo.addItem("Tait-Bryan", RotationMethod.TAIT_BRYAN)
-        self.method_combo.addItem("Exponential Map", RotationMethod.EXPONENTIAL_MAP)
-        self.method_combo.setStyleSheet(DarkTheme.combo_box())
+        for method, label, *_ in self.PAGE_SPECS:
+            self.method_combo.addItem(label, method)
         layout.addWidget(self.method_combo)
         
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet(DarkTheme.separator())
+        set_style_role(separator, "separator")
         layout.addWidget(separator)
         
-        # Stacked widget for different control types
+        # Stacked widget for different control types; empty placeholders keep
+        # the stack indices aligned with the combo until a page is built
         self.parameter_stack = QStackedWidget()
-        
-        # Initialize control widgets
-        self.quaternion_widget = QuaternionControls()
-        self.parameter_stack.addWidget(self.quaternion_widget)
-        
-        self.euler_widget = EulerControls()
-        self.parameter_stack.addWidget(self.euler_widget)
-        
-        self.tait_bryan_widget = TaitBryanControls()
-        self.parameter_stack.addWidget(self.tait_bryan_widget)
-        
-        self.exponential_widget = ExponentialControls()
-        self.parameter_stack.addWidget(self.exponential_widget)
+        self.pages = [None] * len(self.PAGE_SPECS)
+        for _ in self.PAGE_SPECS:
+            self.parameter_stack.addWidget(QWidget())
         
         layout.addWidget(self.parameter_stack)
         
         # Set default to quaternion
         self.method_combo.setCurrentIndex(0)
-        self.parameter_stack.setCurrentIndex(0)
+        self.show_page(0)
+    
+    def ensure_page(self, index: int) -> QWidget:
+        page = self.pages[index]
+        if page is not None:
+            return page
+        
+        _, _, page_class, attribute, signal_name, handler_name = self.PAGE_SPECS[index]
+        with tracer.span("RotationMethodWidget.create_page", "ui", page=page_class.__name__):
+            page = page_class()
+        
+        placeholder = self.parameter_stack.widget(index)
+        self.parameter_stack.removeWidget(placeholder)
+        self.parameter_stack.insertWidget(index, page)
+        placeholder.deleteLater()
+        
+        getattr(page, signal_name).connect(getattr(self, handler_name))
+        setattr(self, attribute, page)
+        self.pages[index] = page
+        return page
+    
+    def show_page(self, index: int):
+        self.ensure_page(index)
+        self.parameter_stack.setCurrentIndex(index)
     
     def connect_signals(self):
         self.method_combo.currentIndexChanged.connect(self.on_method_changed)
-        
-        self.quaternion_widget.quaternion_changed.connect(self.on_quaternion_changed)
-        self.euler_widget.valueChanged.connect(self.on_euler_changed)
-        self.tait_bryan_widget.valueChanged.connect(self.on_tait_bryan_changed)
-        self.exponential_widget.valueChanged.connect(self.on_exponential_changed)
     
     def on_method_changed(self, index):
-        self.parameter_stack.setCurrentIndex(index)
+        self.show_page(index)
         # Emit current rotation immediately when method changes
         self.emit_current_rotation()
     
@@ -109,17 +136,17 @@ class RotationMethodWidget(QWidget):
                 if rotation:
                     self.rotation_changed.emit(rotation)
                 else:
-                    print(f"Warning: get_rotation() returned None for {type(current_widget).__name__}")
+                    logger.warning("get_rotation() returned None for %s", type(current_widget).__name__)
             else:
-                print(f"Warning: Current widget {type(current_widget).__name__} has no get_rotation() method")
+                logger.warning("Current widget %s has no get_rotation() method", type(current_widget).__name__)
         except Exception as e:
-            print(f"Error in emit_current_rotation: {e}")
+            logger.error("Error in emit_current_rotation: %s", e)
     
     def get_current_method(self):
         try:
             return self.method_combo.currentData()
         except Exception as e:
-            print(f"Error getting current method: {e}")
+            logger.error("Error getting current method: %s", e)
             return RotationMethod.QUATERNION
     
     def get_current_rotation(self):
@@ -127,22 +154,38 @@ class RotationMethodWidget(QWidget):
             current_widget = self.parameter_stack.currentWidget()
             method = self.get_current_method()
             
-            print(f"DEBUG: Current method: {method}")
-            print(f"DEBUG: Current widget: {type(current_widget).__name__}")
+            logger.debug("Current method: %s", method)
+            logger.debug("Current widget: %s", type(current_widget).__name__)
             
             if hasattr(current_widget, 'get_rotation'):
                 rotation = current_widget.get_rotation()
-                print(f"DEBUG: Rotation object: {rotation}")
-                print(f"DEBUG: Rotation type: {type(rotation).__name__ if rotation else 'None'}")
+                logger.debug("Rotation object: %s", rotation)
+                logger.debug("Rotation type: %s", type(rotation).__name__ if rotation else 'None')
                 return rotation
             else:
-                print(f"ERROR: Widget {type(current_widget).__name__} has no get_rotation() method")
+                logger.error("Widget %s has no get_rotation() method", type(current_widget).__name__)
                 return None
                 
         except Exception as e:
-            print(f"Error getting current rotation: {e}")
+            logger.error("Error getting current rotation: %s", e)
             return None
     
+    def set_rotation(self, method, rotation_obj):
+        # Restore a method page and its parameters, then emit the rotation once
+        index = next(i for i, spec in enumerate(self.PAGE_SPECS) if spec[0] == method)
+        page = self.ensure_page(index)
+        page.blockSignals(True)
+        try:
+            page.set_rotation(rotation_obj)
+        finally:
+            page.blockSignals(False)
+        
+        self.method_combo.blockSignals(True)
+        self.method_combo.setCurrentIndex(index)
+        self.method_combo.blockSignals(False)
+        self.show_page(index)
+        self.emit_current_rotation()
+    
     def reset_to_identity(self):
         try:
             current_widget = self.parameter_stack.currentWidget()
@@ -151,6 +194,6 @@ class RotationMethodWidget(QWidget):
                 # Emit reset rotation
                 self.emit_current_rotation()
             else:
-                print(f"Warning: Widget {type(current_widget).__name__} has no reset_to_identity() method")
+                logger.warning("Widget %s has no reset_to_identity() method", type(current_widget).__name__)
         except Exception as e:
-            print(f"Error resetting to identity: {e}")
\ No newline at end of file
+            logger.error("Error resetting to identity: %s", e)
\ No newline at end of file
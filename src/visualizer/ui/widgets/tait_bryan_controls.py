@@ -3,7 +3,6 @@ from PySide6.QtGui import QFont
 from PySide6.QtCore import Signal
 
 from ...core.math.tait_bryan import TaitBryan
-from ..styles.theme import DarkTheme
 from ..styles.fonts import UIFonts
 
 class TaitBryanControls(QWidget):
@@ -22,13 +21,11 @@ class TaitBryanControls(QWidget):
         # Info label
         info_label = QLabel("Tait-Bryan Rotation:")
         info_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        info_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(info_label, 0, 0, 1, 2)
         
         # Roll control
         roll_label = QLabel("Roll (X-axis, °):")
         roll_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        roll_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(roll_label, 1, 0)
         
         self.roll_spin = QDoubleSpinBox()
@@ -36,13 +33,11 @@ class TaitBryanControls(QWidget):
         self.roll_spin.setValue(0.0)
         self.roll_spin.setSingleStep(1.0)
         self.roll_spin.setDecimals(1)
-        self.roll_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.roll_spin, 1, 1)
         
         # Pitch control
         pitch_label = QLabel("Pitch (Y-axis, °):")
         pitch_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        pitch_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(pitch_label, 2, 0)
         
         self.pitch_spin = QDoubleSpinBox()
@@ -50,13 +45,11 @@ class TaitBryanControls(QWidget):
         self.pitch_spin.setValue(0.0)
         self.pitch_spin.setSingleStep(1.0)
         self.pitch_spin.setDecimals(1)
-        self.pitch_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.pitch_spin, 2, 1)
         
         # Yaw control
         yaw_label = QLabel("Yaw (Z-axis, °):")
         yaw_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        yaw_label.setStyleSheet(DarkTheme.label())
         layout.addWidget(yaw_label, 3, 0)
         
         self.yaw_spin = QDoubleSpinBox()
@@ -64,13 +57,12 @@ class TaitBryanControls(QWidget):
         self.yaw_spin.setValue(45.0)
         self.yaw_spin.setSingleStep(1.0)
         self.yaw_spin.setDecimals(1)
-        self.yaw_spin.setStyleSheet(DarkTheme.spin_box())
         layout.addWidget(self.yaw_spin, 3, 1)
     
     def connect_signals(self):
-        self.roll_spin.valueChanged.connect(self.valueChanged.emit)
-        self.pitch_spin.valueChanged.connect(self.valueChanged.emit)
-        self.yaw_spin.valueChanged.connect(self.valueChanged.emit)
+        self.roll_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
+        self.pitch_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
+        self.yaw_spin.valueChanged.connect(lambda _: self.valueChanged.emit())
     
     def get_rotation(self):
         return TaitBryan(
@@ -79,6 +71,11 @@ class TaitBryanControls(QWidget):
             self.yaw_spin.value()
         )
         
+    def set_rotation(self, tait_bryan):
+        self.roll_spin.setValue(tait_bryan.roll)
+        self.pitch_spin.setValue(tait_bryan.pitch)
+        self.yaw_spin.setValue(tait_bryan.yaw)
+        
     def reset_to_identity(self):
         self.roll_spin.setValue(0.0)
         self.pitch_spin.setValue(0.0)
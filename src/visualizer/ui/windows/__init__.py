@@ -1,3 +1,4 @@
 from .main_window import MainWindow
+from .sweep_window import SingularitySweepWindow
 
-__all__ = ["MainWindow"]
\ No newline at end of file
+__all__ = ["MainWindow", "SingularitySweepWindow"]
\ No newline at end of file
@@ -1,24 +1,46 @@
 import sys
 import os
+import time
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QFrame, QLabel, QGroupBox, QPushButton, 
-    QTextEdit, QMessageBox, QFileDialog
+    QTextEdit, QMessageBox, QFileDialog, QApplication, QProgressBar, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer
+from PySide6.QtGui import QFont, QKeySequence, QShortcut
 
-from ...config import APP_NAME
+from ...config import (
+    APP_NAME, ANIMATION_DURATION_MS, ANIMATION_FRAME_RATE, SMOOTH_ANIMATION,
+    SHOW_PERFORMANCE_HUD, PERFORMANCE_HUD_SHORTCUT, TRACE_SHORTCUT, LOGS_DIR,
+    PROFILE_SHORTCUT, PROFILE_DURATION_S, ORIENTATION_TRAIL_SIZE, SHOW_ORIENTATION_TRAIL,
+    COMPARISON_ROUND_INPUTS, COMPARISON_DEVIATION_RANGE, CUMULATIVE_ROTATION, UNDO_SHORTCUT, REDO_SHORTCUT
+)
+from ...core.animation.keyframe_animation import KeyframeAnimation
+from ...core.animation.orientation_trail import OrientationTrail
 from ...core.io.obj_loader import OBJLoader
 from ...core.math.rotation_factory import RotationFactory, RotationMethod
 from ...core.math.vector3 import Vector3
-from ...rendering.opengl.opengl_view import OpenGLView
-from ...rendering.custom.custom_renderer import CustomRenderer
+from ...core.math.quaternion import Quaternion
+from ...core.math.method_comparison import MethodComparison
+from ...core.math.cumulative_rotation import CumulativeRotation
+from ...core.math.rotation_history import RotationHistory, RotationState
+from ...rendering.mesh_arrays import MeshArrays
+from ...rendering.heatmap import HeatMap
+from ...diagnostics.tracing import tracer, traced
+from ...diagnostics.profiler import profiler
+from ...diagnostics.log import get_logger
 from ..widgets.rotation_method_widget import RotationMethodWidget
-from ..styles.theme import DarkTheme
+from ..widgets.playback_controls import PlaybackControls
+from ..widgets.live_feed_controls import LiveFeedControls
+from ..workers.rotation_worker import RotationWorker
+from .sweep_window import SingularitySweepWindow
+from ..styles.theme import set_style_role
+from ..styles.theme_engine import ThemeEngine
 from ..styles.fonts import UIFonts
 
+logger = get_logger(__name__)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -31,6 +53,46 @@ class MainWindow(QMainWindow):
         self.custom_view = None
         self.current_renderer = "opengl"
         
+        # Rotation animation (poses are precomputed into a keyframe buffer)
+        self.current_pose = Quaternion.IDENTITY
+        self.animation = None
+        self.animation_clock = QElapsedTimer()
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(max(1, int(1000 / ANIMATION_FRAME_RATE)))
+        self.animation_timer.timeout.connect(self.on_animation_frame)
+        
+        # Cumulative mode composes each applied rotation into one orientation quaternion;
+        # the rotated object is then the original mesh under that single transform
+        self.cumulative_mode = CUMULATIVE_ROTATION
+        self.cumulative_rotation = CumulativeRotation()
+        # Whether the rotated object currently shows current_pose
+        self.pose_applied = False
+        
+        # Undo/redo keeps rotation inputs, pose and camera only; meshes are re-derived on restore
+        self.rotation_history = RotationHistory()
+        self.materialize_job = None
+        
+        # Ghosted intermediate poses: SLERP steps of the last rotation or recent external poses
+        self.orientation_trail = OrientationTrail(ORIENTATION_TRAIL_SIZE)
+        self.trail_visible = SHOW_ORIENTATION_TRAIL
+        
+        # All four rotation methods side by side for the current rotation input
+        self.comparison_visible = False
+        
+        # Created on first use; the sweep runs on its own worker
+        self.sweep_window = None
+        
+        # Mesh rotations run off the GUI thread; only the latest job is applied
+        self.rotation_worker = RotationWorker(self)
+        self.rotation_worker.progress.connect(self.on_rotation_progress)
+        self.rotation_worker.finished.connect(self.on_rotation_finished)
+        self.rotation_worker.failed.connect(self.on_rotation_failed)
+        
+        # Stops a timed profiling session
+        self.profile_timer = QTimer(self)
+        self.profile_timer.setSingleShot(True)
+        self.profile_timer.timeout.connect(self.stop_profiling)
+        
         self.init_ui()
         self.setup_connections()
         
@@ -39,11 +101,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 600)
         self.resize(1200, 700)
         
-        # Apply theme safely
+        # The theme is one application-wide stylesheet; widgets only set style roles
         try:
-            self.setStyleSheet(DarkTheme.get_complete_stylesheet())
+            ThemeEngine.apply(QApplication.instance())
         except Exception as e:
-            print(f"Warning: Could not apply stylesheet: {e}")
+            logger.warning("Could not apply stylesheet: %s", e)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -70,10 +132,7 @@ class MainWindow(QMainWindow):
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
         panel.setFixedWidth(320)
         
-        try:
-            panel.setStyleSheet(DarkTheme.control_panel())
-        except Exception as e:
-            print(f"Warning: Could not apply panel stylesheet: {e}")
+        set_style_role(panel, "panel")
         
         layout = QVBoxLayout(panel)
         layout.setSpacing(8)
@@ -83,10 +142,7 @@ class MainWindow(QMainWindow):
         title_label = QLabel(f"{APP_NAME}")
         title_label.setFont(QFont(UIFonts.FAMILY, UIFonts.TITLE_SIZE, QFont.Weight.Bold))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        try:
-            title_label.setStyleSheet(DarkTheme.title_label())
-        except Exception:
-            pass
+        set_style_role(title_label, "title")
         layout.addWidget(title_label)
         
         # File operations
@@ -101,6 +157,14 @@ class MainWindow(QMainWindow):
         actions_group = self.create_actions_group()
         layout.addWidget(actions_group)
         
+        # Orientation log playback
+        playback_group = self.create_playback_group()
+        layout.addWidget(playback_group)
+        
+        # Live orientation feed
+        live_feed_group = self.create_live_feed_group()
+        layout.addWidget(live_feed_group)
+        
         # Object info
         info_group = self.create_info_group()
         layout.addWidget(info_group)
@@ -112,10 +176,6 @@ class MainWindow(QMainWindow):
     def create_file_operations_group(self) -> QGroupBox:
         file_group = QGroupBox("File Operations")
         file_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        try:
-            file_group.setStyleSheet(DarkTheme.group_box())
-        except Exception:
-            pass
         
         file_layout = QVBoxLayout(file_group)
         file_layout.setContentsMargins(8, 15, 8, 8)
@@ -123,10 +183,7 @@ class MainWindow(QMainWindow):
         
         self.load_button = QPushButton("Load OBJ File")
         self.load_button.clicked.connect(self.load_obj_file)
-        try:
-            self.load_button.setStyleSheet(DarkTheme.secondary_button())
-        except Exception:
-            pass
+        set_style_role(self.load_button, "secondary")
         file_layout.addWidget(self.load_button)
         
         return file_group
@@ -134,10 +191,6 @@ class MainWindow(QMainWindow):
     def create_rotation_configuration_group(self) -> QGroupBox:
         rotation_group = QGroupBox("Rotation Configuration")
         rotation_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        try:
-            rotation_group.setStyleSheet(DarkTheme.group_box())
-        except Exception:
-            pass
         
         rotation_layout = QVBoxLayout(rotation_group)
         rotation_layout.setContentsMargins(8, 15, 8, 8)
@@ -150,10 +203,6 @@ class MainWindow(QMainWindow):
     def create_actions_group(self) -> QGroupBox:
         actions_group = QGroupBox("Actions")
         actions_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        try:
-            actions_group.setStyleSheet(DarkTheme.group_box())
-        except Exception:
-            pass
         
         actions_layout = QVBoxLayout(actions_group)
         actions_layout.setContentsMargins(8, 15, 8, 8)
@@ -161,37 +210,97 @@ class MainWindow(QMainWindow):
         
         self.apply_button = QPushButton("Apply Rotation")
         self.apply_button.clicked.connect(self.apply_rotation)
-        try:
-            self.apply_button.setStyleSheet(DarkTheme.primary_button())
-        except Exception:
-            pass
+        set_style_role(self.apply_button, "primary")
         actions_layout.addWidget(self.apply_button)
         
+        self.rotation_progress = QProgressBar()
+        self.rotation_progress.setRange(0, 100)
+        self.rotation_progress.setMaximumHeight(12)
+        self.rotation_progress.setTextVisible(False)
+        self.rotation_progress.hide()
+        actions_layout.addWidget(self.rotation_progress)
+        
+        self.cumulative_checkbox = QCheckBox("Cumulative Rotation")
+        self.cumulative_checkbox.setChecked(self.cumulative_mode)
+        self.cumulative_checkbox.setToolTip("Apply each rotation on top of the current orientation")
+        self.cumulative_checkbox.toggled.connect(self.set_cumulative_mode)
+        actions_layout.addWidget(self.cumulative_checkbox)
+        
+        self.trail_checkbox = QCheckBox("Show Orientation Trail")
+        self.trail_checkbox.setChecked(self.trail_visible)
+        self.trail_checkbox.toggled.connect(self.set_trail_visible)
+        actions_layout.addWidget(self.trail_checkbox)
+        
+        self.comparison_checkbox = QCheckBox("Compare All Methods")
+        self.comparison_checkbox.setChecked(self.comparison_visible)
+        self.comparison_checkbox.toggled.connect(self.set_comparison_visible)
+        actions_layout.addWidget(self.comparison_checkbox)
+        
+        self.sweep_button = QPushButton("Gimbal Lock Sweep...")
+        self.sweep_button.clicked.connect(self.show_sweep_window)
+        set_style_role(self.sweep_button, "secondary")
+        actions_layout.addWidget(self.sweep_button)
+        
         self.toggle_renderer_button = QPushButton("Switch to Custom Renderer")
         self.toggle_renderer_button.clicked.connect(self.toggle_renderer)
-        try:
-            self.toggle_renderer_button.setStyleSheet(DarkTheme.warning_button())
-        except Exception:
-            pass
+        set_style_role(self.toggle_renderer_button, "warning")
         actions_layout.addWidget(self.toggle_renderer_button)
         
+        history_row = QHBoxLayout()
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.clicked.connect(self.undo_rotation)
+        set_style_role(self.undo_button, "secondary")
+        history_row.addWidget(self.undo_button)
+        
+        self.redo_button = QPushButton("Redo")
+        self.redo_button.clicked.connect(self.redo_rotation)
+        set_style_role(self.redo_button, "secondary")
+        history_row.addWidget(self.redo_button)
+        actions_layout.addLayout(history_row)
+        self.update_history_buttons()
+        
         self.reset_button = QPushButton("Reset")
         self.reset_button.clicked.connect(self.reset_view)
-        try:
-            self.reset_button.setStyleSheet(DarkTheme.secondary_button())
-        except Exception:
-            pass
+        set_style_role(self.reset_button, "secondary")
         actions_layout.addWidget(self.reset_button)
         
         return actions_group
     
+    def create_playback_group(self) -> QGroupBox:
+        playback_group = QGroupBox("Orientation Log Playback")
+        playback_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
+        
+        playback_layout = QVBoxLayout(playback_group)
+        playback_layout.setContentsMargins(8, 15, 8, 8)
+        
+        self.playback_controls = PlaybackControls()
+        self.playback_controls.pose_changed.connect(self.on_external_pose)
+        self.playback_controls.playback_closed.connect(self.stop_rotation_animation)
+        self.playback_controls.statistics_ready.connect(lambda text: self.output_text.append(f"\n{text}"))
+        playback_layout.addWidget(self.playback_controls)
+        
+        return playback_group
+    
+    def create_live_feed_group(self) -> QGroupBox:
+        live_feed_group = QGroupBox("Live Orientation Feed")
+        live_feed_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
+        
+        live_feed_layout = QVBoxLayout(live_feed_group)
+        live_feed_layout.setContentsMargins(8, 15, 8, 8)
+        
+        self.live_feed_controls = LiveFeedControls()
+        self.live_feed_controls.pose_changed.connect(self.on_external_pose)
+        # Playback and the live feed both drive the pose; starting one stops the other
+        self.live_feed_controls.feed_started.connect(self.playback_controls.release_pose)
+        self.playback_controls.playback_started.connect(self.live_feed_controls.stop_feed)
+        self.live_feed_controls.feed_stopped.connect(self.stop_rotation_animation)
+        live_feed_layout.addWidget(self.live_feed_controls)
+        
+        return live_feed_group
+    
     def create_info_group(self) -> QGroupBox:
         info_group = QGroupBox("Object Information")
         info_group.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
-        try:
-            info_group.setStyleSheet(DarkTheme.group_box())
-        except Exception:
-            pass
         
         info_layout = QVBoxLayout(info_group)
         info_layout.setContentsMargins(8, 15, 8, 8)
@@ -200,10 +309,6 @@ class MainWindow(QMainWindow):
         self.output_text.setMaximumHeight(120)
         self.output_text.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
         self.output_text.setReadOnly(True)
-        try:
-            self.output_text.setStyleSheet(DarkTheme.text_edit())
-        except Exception:
-            pass
         self.output_text.setText("No model loaded. Please select an OBJ file to begin.")
         info_layout.addWidget(self.output_text)
         
@@ -211,40 +316,130 @@ class MainWindow(QMainWindow):
         
     def create_viewer_panel(self) -> QWidget:
         self.renderer_container = QWidget()
-        renderer_layout = QVBoxLayout(self.renderer_container)
-        renderer_layout.setContentsMargins(0, 0, 0, 0)
-        renderer_layout.setSpacing(0)
+        self.renderer_layout = QVBoxLayout(self.renderer_container)
+        self.renderer_layout.setContentsMargins(0, 0, 0, 0)
+        self.renderer_layout.setSpacing(0)
+        
+        # Only the visible renderer is built; the other one on first switch
+        self.ensure_renderer(self.current_renderer)
+        
+        return self.renderer_container
+    
+    def ensure_renderer(self, name: str):
+        existing = self.opengl_view if name == "opengl" else self.custom_view
+        if existing:
+            return existing
         
         try:
-            self.opengl_view = OpenGLView()
-            self.custom_view = CustomRenderer()
+            with tracer.span("MainWindow.create_renderer", "ui", renderer=name):
+                # Renderer modules are imported here so the unused one is never loaded
+                if name == "opengl":
+                    from ...rendering.opengl.opengl_view import OpenGLView as renderer_class
+                else:
+                    from ...rendering.custom.custom_renderer import CustomRenderer as renderer_class
+                view = renderer_class()
+            view.hide()
+            self.renderer_layout.addWidget(view)
             
-            renderer_layout.addWidget(self.opengl_view)
-            renderer_layout.addWidget(self.custom_view)
+            if name == "opengl":
+                self.opengl_view = view
+            else:
+                self.custom_view = view
             
-            self.custom_view.hide()
+            if hasattr(view, 'set_hud_visible'):
+                view.set_hud_visible(getattr(self, 'performance_hud_visible', SHOW_PERFORMANCE_HUD))
+            if name == self.current_renderer:
+                view.show()
+            return view
             
         except Exception as e:
-            print(f"Error initializing renderers: {e}")
-            error_label = QLabel(f"Error initializing 3D renderers: {e}")
+            logger.error("Error initializing %s renderer: %s", name, e)
+            error_label = QLabel(f"Error initializing 3D renderer: {e}")
             error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            try:
-                error_label.setStyleSheet(DarkTheme.label())
-            except Exception:
-                pass
-            renderer_layout.addWidget(error_label)
-        
-        return self.renderer_container
+            self.renderer_layout.addWidget(error_label)
+            return None
     
     def setup_connections(self):
         try:
             if hasattr(self, 'rotation_method_widget'):
                 if hasattr(self.rotation_method_widget, 'rotation_changed'):
                     self.rotation_method_widget.rotation_changed.connect(self.on_rotation_changed)
+            
+            # Performance overlay works regardless of which widget has focus
+            self.hud_shortcut = QShortcut(QKeySequence(PERFORMANCE_HUD_SHORTCUT), self)
+            self.hud_shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+            self.hud_shortcut.activated.connect(self.toggle_performance_hud)
+            self.set_performance_hud_visible(SHOW_PERFORMANCE_HUD)
+            
+            self.trace_shortcut = QShortcut(QKeySequence(TRACE_SHORTCUT), self)
+            self.trace_shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+            self.trace_shortcut.activated.connect(self.toggle_trace_recording)
+            
+            self.profile_shortcut = QShortcut(QKeySequence(PROFILE_SHORTCUT), self)
+            self.profile_shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+            self.profile_shortcut.activated.connect(self.toggle_profiling)
+            
+            self.undo_shortcut = QShortcut(QKeySequence(UNDO_SHORTCUT), self)
+            self.undo_shortcut.activated.connect(self.undo_rotation)
+            self.redo_shortcut = QShortcut(QKeySequence(REDO_SHORTCUT), self)
+            self.redo_shortcut.activated.connect(self.redo_rotation)
                     
         except Exception as e:
-            print(f"Warning: Could not setup all connections: {e}")
+            logger.warning("Could not setup all connections: %s", e)
+    
+    def set_performance_hud_visible(self, visible: bool):
+        self.performance_hud_visible = visible
+        for renderer in (self.opengl_view, self.custom_view):
+            if renderer and hasattr(renderer, 'set_hud_visible'):
+                renderer.set_hud_visible(visible)
+    
+    def toggle_performance_hud(self):
+        self.set_performance_hud_visible(not getattr(self, 'performance_hud_visible', False))
+    
+    def toggle_trace_recording(self):
+        if not tracer.enabled:
+            tracer.start()
+            self.output_text.append(f"\nTrace recording started ({TRACE_SHORTCUT} again to save)")
+            return
+        
+        tracer.stop()
+        try:
+            LOGS_DIR.mkdir(exist_ok=True)
+            file_path = LOGS_DIR / f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+            count = tracer.export(file_path)
+            self.output_text.append(f"\nTrace saved: {file_path} ({count} events)")
+        except Exception as e:
+            self.output_text.append(f"\nError saving trace: {e}")
+        finally:
+            tracer.clear()
+    
+    def start_profiling(self, duration_s: float = PROFILE_DURATION_S):
+        if profiler.running:
+            return
+        
+        profiler.start()
+        self.profile_timer.start(int(duration_s * 1000))
+        self.output_text.append(f"\nProfiling for {duration_s:g} s ({PROFILE_SHORTCUT} to stop early)")
+    
+    def stop_profiling(self):
+        self.profile_timer.stop()
+        try:
+            result = profiler.stop()
+            if result:
+                self.output_text.append(
+                    f"\nProfile saved ({result['duration']:.1f} s, {result['samples']} samples):\n"
+                    f"  {result['pstats']}\n  {result['collapsed']}"
+                )
+        except Exception as e:
+            self.output_text.append(f"\nError saving profile: {e}")
     
+    def toggle_profiling(self):
+        if profiler.running:
+            self.stop_profiling()
+        else:
+            self.start_profiling()
+    
+    @traced("MainWindow.on_rotation_changed", "ui")
     def on_rotation_changed(self, rotation_obj):
         try:
             if rotation_obj:
@@ -259,49 +454,20 @@ class MainWindow(QMainWindow):
                 # Update method for visualization data
                 self.current_method = self.rotation_method_widget.get_current_method()
                 
+                if self.comparison_visible:
+                    self.update_method_comparison()
+                
         except Exception as e:
-            print(f"Error handling rotation change: {e}")
+            logger.error("Error handling rotation change: %s", e)
     
     def extract_axis_angle(self, rotation_obj):
         try:
-            if hasattr(rotation_obj, 'to_axis_angle'):
-                return rotation_obj.to_axis_angle()
-            
-            elif hasattr(rotation_obj, 'get_axis') and hasattr(rotation_obj, 'get_angle'):
-                return rotation_obj.get_axis(), rotation_obj.get_angle()
-            
-            elif hasattr(rotation_obj, 'to_quaternion'):
-                quaternion = rotation_obj.to_quaternion()
-                if hasattr(quaternion, 'to_axis_angle'):
-                    return quaternion.to_axis_angle()
-                elif hasattr(quaternion, 'get_axis') and hasattr(quaternion, 'get_angle'):
-                    return quaternion.get_axis(), quaternion.get_angle()
-            
-            elif hasattr(rotation_obj, 'x') and hasattr(rotation_obj, 'y') and hasattr(rotation_obj, 'z'):
-                # Use the largest rotation as primary axis
-                angles = [rotation_obj.x, rotation_obj.y, rotation_obj.z]
-                axes = [Vector3(1, 0, 0), Vector3(0, 1, 0), Vector3(0, 0, 1)]
-                max_index = max(range(len(angles)), key=lambda i: abs(angles[i]))
-                return axes[max_index], angles[max_index]
-            
-            elif hasattr(rotation_obj, 'roll') and hasattr(rotation_obj, 'pitch') and hasattr(rotation_obj, 'yaw'):
-                # Use yaw as primary (Z-axis rotation)
-                return Vector3(0, 0, 1), rotation_obj.yaw
-            
-            elif hasattr(rotation_obj, 'omega'):
-                omega = rotation_obj.omega
-                if hasattr(omega, 'magnitude') and omega.magnitude() > 0:
-                    axis = omega.normalize()
-                    angle = omega.magnitude() * 180.0 / 3.14159265359  # Convert to degrees
-                    return axis, angle
-            
-            # Default fallback
-            return Vector3(0, 0, 1), 0.0
-            
+            return RotationFactory.get_axis_angle(rotation_obj)
         except Exception as e:
-            print(f"Error extracting axis-angle: {e}")
+            logger.error("Error extracting axis-angle: %s", e)
             return Vector3(0, 0, 1), 0.0
     
+    @traced("MainWindow.load_obj_file", "ui")
     def load_obj_file(self):
         try:
             file_dialog = QFileDialog()
@@ -314,8 +480,16 @@ class MainWindow(QMainWindow):
             )
             
             if file_path:
+                self.cancel_rotation_job()
+                self.stop_rotation_animation()
                 self.current_obj_data = OBJLoader.load_obj(file_path)
                 self.rotated_obj_data = None
+                self.current_pose = Quaternion.IDENTITY
+                self.pose_applied = False
+                self.cumulative_rotation.reset()
+                self.show_resting_pose()
+                self.orientation_trail.clear()
+                self.update_orientation_trail()
                 
                 # Update renderers
                 if self.opengl_view and hasattr(self.opengl_view, 'set_obj_data'):
@@ -323,13 +497,20 @@ class MainWindow(QMainWindow):
                 if self.custom_view and hasattr(self.custom_view, 'set_obj_data'):
                     self.custom_view.set_obj_data(self.current_obj_data, None)
                 
+                # History starts over with the freshly loaded model
+                self.rotation_history.clear()
+                self.record_state()
+                
                 self.display_obj_data()
+                self.playback_controls.emit_pose()
+                self.update_method_comparison()
                 
         except Exception as e:
             error_msg = f"Error loading OBJ file: {e}"
             QMessageBox.critical(self, "Load Error", error_msg)
             self.output_text.setText(error_msg)
     
+    @traced("MainWindow.apply_rotation", "ui")
     def apply_rotation(self):
         try:
             if not self.current_obj_data:
@@ -345,26 +526,167 @@ class MainWindow(QMainWindow):
             # Get current method
             method = self.rotation_method_widget.get_current_method()
             
-            # Apply rotation using RotationFactory with method parameter
-            try:
-                self.rotated_obj_data = RotationFactory.rotate_obj_data(
-                    self.current_obj_data, rotation_obj, method
-                )
-            except Exception as e:
-                print(f"Warning: RotationFactory.rotate_obj_data failed with method parameter: {e}")
-                # Create a simple rotation by converting to quaternion
-                if hasattr(rotation_obj, 'to_quaternion'):
-                    quaternion = rotation_obj.to_quaternion()
-                    # Apply quaternion rotation manually or use a simplified approach
-                    self.rotated_obj_data = self.apply_rotation_manually(self.current_obj_data, rotation_obj)
-                else:
-                    raise e
+            if self.cumulative_mode:
+                self.apply_cumulative_rotation(rotation_obj, method)
+                return
             
-            # Update renderers
-            if self.opengl_view and hasattr(self.opengl_view, 'set_obj_data'):
-                self.opengl_view.set_obj_data(self.current_obj_data, self.rotated_obj_data)
-            if self.custom_view and hasattr(self.custom_view, 'set_obj_data'):
-                self.custom_view.set_obj_data(self.current_obj_data, self.rotated_obj_data)
+            # The mesh is rotated on the worker pool; a newer click supersedes this job
+            self.rotation_worker.submit(self.current_obj_data, rotation_obj, method)
+            self.rotation_progress.setValue(0)
+            self.rotation_progress.show()
+            
+        except Exception as e:
+            error_msg = f"Error applying rotation: {e}"
+            self.output_text.append(f"\n{error_msg}")
+            QMessageBox.critical(self, "Rotation Error", error_msg)
+    
+    def apply_cumulative_rotation(self, rotation_obj, method):
+        # O(1) per step: no vertices are touched, renderers draw the original with the composed pose
+        pose = self.cumulative_rotation.compose(RotationFactory.get_quaternion(rotation_obj, method))
+        self.cancel_rotation_job()
+        self.start_rotation_animation(pose)
+        self.pose_applied = True
+        self.record_state(rotation_obj, method)
+        
+        axis, angle = pose.to_axis_angle()
+        current_renderer = self.get_current_renderer()
+        if current_renderer and hasattr(current_renderer, 'set_rotation_parameters'):
+            current_renderer.set_rotation_parameters(axis, angle)
+        
+        self.output_text.append(
+            f"\nComposed {method.value} rotation (step {len(self.cumulative_rotation)})"
+            f"\nOrientation: {pose}"
+            f"\nAxis: ({axis.x:.3f}, {axis.y:.3f}, {axis.z:.3f}), Angle: {angle:.2f}°"
+        )
+    
+    def set_cumulative_mode(self, enabled: bool):
+        if enabled == self.cumulative_mode:
+            return
+        self.cumulative_mode = enabled
+        if enabled:
+            # Continue from whatever pose is shown now
+            self.cancel_rotation_job()
+            self.cumulative_rotation.reset(self.current_pose)
+            self.stop_rotation_animation()
+        elif self.current_obj_data and self.pose_applied:
+            # Leaving the mode materializes the composed pose once, from the pristine mesh
+            self.stop_rotation_animation()
+            self.materialize_pose()
+        else:
+            self.stop_rotation_animation()
+    
+    def materialize_pose(self):
+        # The pose is shown at once through the model transform while the worker
+        # rebuilds the rotated mesh from the original in the background
+        for renderer in (self.opengl_view, self.custom_view):
+            if renderer and hasattr(renderer, 'set_model_rotation'):
+                renderer.set_model_rotation(self.current_obj_data, self.current_pose.to_rotation_matrix())
+        self.materialize_job = self.rotation_worker.submit(
+            self.current_obj_data, self.current_pose, RotationMethod.QUATERNION
+        )
+        self.rotation_progress.setValue(0)
+        self.rotation_progress.show()
+    
+    def on_pose_materialized(self, job, rotated_obj_data):
+        self.materialize_job = None
+        if job.obj_data is not self.current_obj_data:
+            return
+        self.rotated_obj_data = rotated_obj_data
+        for renderer in (self.opengl_view, self.custom_view):
+            if renderer and hasattr(renderer, 'set_obj_data'):
+                renderer.set_obj_data(self.current_obj_data, self.rotated_obj_data)
+        if not self.animation:
+            self.show_resting_pose()
+    
+    def record_state(self, rotation_obj=None, method=None):
+        if rotation_obj is None:
+            rotation_obj = self.rotation_method_widget.get_current_rotation()
+            method = self.rotation_method_widget.get_current_method()
+        if rotation_obj is None:
+            return
+        
+        current_renderer = self.get_current_renderer()
+        camera = None
+        if current_renderer and hasattr(current_renderer, 'get_camera_state'):
+            camera = current_renderer.get_camera_state()
+        self.rotation_history.push(RotationState(method, rotation_obj, self.current_pose, camera, self.pose_applied))
+        self.update_history_buttons()
+    
+    def update_history_buttons(self):
+        self.undo_button.setEnabled(self.rotation_history.can_undo)
+        self.redo_button.setEnabled(self.rotation_history.can_redo)
+    
+    def undo_rotation(self):
+        state = self.rotation_history.undo()
+        if state:
+            self.restore_state(state)
+    
+    def redo_rotation(self):
+        state = self.rotation_history.redo()
+        if state:
+            self.restore_state(state)
+    
+    @traced("MainWindow.restore_state", "ui")
+    def restore_state(self, state: RotationState):
+        self.update_history_buttons()
+        try:
+            self.cancel_rotation_job()
+            self.playback_controls.pause()
+            self.rotation_method_widget.set_rotation(state.method, state.rotation)
+            
+            self.current_pose = state.pose
+            self.pose_applied = state.applied
+            self.cumulative_rotation.reset(state.pose)
+            self.orientation_trail.clear()
+            self.update_orientation_trail()
+            self.stop_rotation_animation()
+            
+            if state.camera is not None:
+                for renderer in (self.opengl_view, self.custom_view):
+                    if renderer and hasattr(renderer, 'set_camera_state'):
+                        renderer.set_camera_state(*state.camera)
+            
+            if not self.current_obj_data:
+                return
+            if not state.applied:
+                self.rotated_obj_data = None
+                for renderer in (self.opengl_view, self.custom_view):
+                    if renderer and hasattr(renderer, 'set_obj_data'):
+                        renderer.set_obj_data(self.current_obj_data, None)
+            elif not self.cumulative_mode:
+                self.materialize_pose()
+            
+            axis, angle = state.pose.to_axis_angle()
+            current_renderer = self.get_current_renderer()
+            if current_renderer and hasattr(current_renderer, 'set_rotation_parameters'):
+                current_renderer.set_rotation_parameters(axis, angle)
+        except Exception as e:
+            logger.error("Error restoring rotation state: %s", e)
+    
+    def on_rotation_progress(self, percent: int):
+        self.rotation_progress.setValue(percent)
+    
+    @traced("MainWindow.on_rotation_finished", "ui")
+    def on_rotation_finished(self, job, rotated_obj_data):
+        self.rotation_progress.hide()
+        if job is self.materialize_job:
+            self.on_pose_materialized(job, rotated_obj_data)
+            return
+        try:
+            rotation_obj, method = job.rotation_obj, job.method
+            if job.obj_data is not self.current_obj_data:
+                return
+            
+            # Swap the result into both renderers in one GUI-thread step
+            self.rotated_obj_data = rotated_obj_data
+            for renderer in (self.opengl_view, self.custom_view):
+                if renderer and hasattr(renderer, 'set_obj_data'):
+                    renderer.set_obj_data(self.current_obj_data, self.rotated_obj_data)
+            
+            # Animate from the previous pose to the new one
+            self.start_rotation_animation(RotationFactory.get_quaternion(rotation_obj, method))
+            self.pose_applied = True
+            self.record_state(rotation_obj, method)
             
             # Update visualization
             axis, angle = self.extract_axis_angle(rotation_obj)
@@ -394,50 +716,168 @@ class MainWindow(QMainWindow):
             self.output_text.append(f"\n{error_msg}")
             QMessageBox.critical(self, "Rotation Error", error_msg)
     
-    def apply_rotation_manually(self, obj_data, rotation_obj):
+    def on_rotation_failed(self, job, message: str):
+        self.rotation_progress.hide()
+        error_msg = f"Error applying rotation: {message}"
+        self.output_text.append(f"\n{error_msg}")
+        QMessageBox.critical(self, "Rotation Error", error_msg)
+    
+    def cancel_rotation_job(self):
+        self.rotation_worker.cancel()
+        self.rotation_progress.hide()
+    
+    def closeEvent(self, event):
+        # Let a running rotation stop at its next chunk before Qt tears down
+        self.rotation_worker.shutdown()
+        self.playback_controls.shutdown()
+        self.live_feed_controls.stop_feed()
+        if self.sweep_window:
+            self.sweep_window.close()
+        super().closeEvent(event)
+    
+    def show_sweep_window(self):
+        if self.sweep_window is None:
+            self.sweep_window = SingularitySweepWindow(self)
+        self.sweep_window.show()
+        self.sweep_window.raise_()
+        self.sweep_window.activateWindow()
+    
+    def start_rotation_animation(self, target_pose: Quaternion):
+        self.playback_controls.pause()
+        self.stop_rotation_animation()
+        start_pose = self.current_pose
+        self.current_pose = target_pose
+        
+        self.orientation_trail.set_path(start_pose, target_pose)
+        self.update_orientation_trail()
+        
+        if not SMOOTH_ANIMATION or not self.current_obj_data:
+            return
+        
         try:
-            # Create new OBJData
-            from ...core.io.obj_loader import OBJData, Vertex
-            
-            rotated_data = OBJData()
-            rotated_data.filename = f"{obj_data.filename}_rotated"
-            rotated_data.faces = obj_data.faces.copy()
-            
-            # Apply rotation to each vertex
-            for vertex in obj_data.vertices:
-                vector = Vector3(vertex.x, vertex.y, vertex.z)
-                
-                # Try to rotate using the rotation object
-                if hasattr(rotation_obj, 'rotate_vector'):
-                    rotated_vector = rotation_obj.rotate_vector(vector)
-                else:
-                    # Simple identity transformation
-                    rotated_vector = vector
-                
-                rotated_vertex = Vertex(rotated_vector.x, rotated_vector.y, rotated_vector.z)
-                rotated_data.vertices.append(rotated_vertex)
-            
-            return rotated_data
-            
+            self.animation = KeyframeAnimation.between(start_pose, target_pose, ANIMATION_DURATION_MS, ANIMATION_FRAME_RATE)
+            self.animation_clock.start()
+            self.animation_timer.start()
+            self.on_animation_frame()
         except Exception as e:
-            print(f"Error in manual rotation: {e}")
-            return obj_data  # Return original if rotation fails
+            logger.error("Error starting rotation animation: %s", e)
+            self.stop_rotation_animation()
+    
+    @traced("MainWindow.on_animation_frame", "ui")
+    def on_animation_frame(self):
+        if not self.animation:
+            return
+        
+        elapsed = self.animation_clock.elapsed()
+        if self.animation.is_finished(elapsed):
+            self.stop_rotation_animation()
+            return
+        
+        # Only the model transform changes per frame
+        current_renderer = self.get_current_renderer()
+        if current_renderer and hasattr(current_renderer, 'set_model_rotation'):
+            current_renderer.set_model_rotation(self.current_obj_data, self.animation.matrix_at(elapsed))
+    
+    def on_external_pose(self, rotation_matrix):
+        # Log playback and the live feed drive the rotated object through the same model transform as animations
+        if self.animation:
+            self.animation_timer.stop()
+            self.animation = None
+        
+        current_renderer = self.get_current_renderer()
+        if self.current_obj_data and current_renderer and hasattr(current_renderer, 'set_model_rotation'):
+            current_renderer.set_model_rotation(self.current_obj_data, rotation_matrix)
+        
+        self.orientation_trail.append(rotation_matrix)
+        if self.trail_visible:
+            self.update_orientation_trail()
+    
+    def set_trail_visible(self, visible: bool):
+        self.trail_visible = visible
+        self.update_orientation_trail()
     
+    def update_orientation_trail(self):
+        # Renderers draw one mesh per trail matrix instead of one rotated copy per pose
+        current_renderer = self.get_current_renderer()
+        if not current_renderer or not hasattr(current_renderer, 'set_orientation_trail'):
+            return
+        if self.trail_visible and self.current_obj_data and len(self.orientation_trail):
+            current_renderer.set_orientation_trail(self.current_obj_data, self.orientation_trail.matrices())
+        else:
+            current_renderer.clear_orientation_trail()
+    
+    def set_comparison_visible(self, visible: bool):
+        self.comparison_visible = visible
+        self.update_method_comparison(report=visible)
+    
+    @traced("MainWindow.update_method_comparison", "ui")
+    def update_method_comparison(self, report: bool = False):
+        # The four methods are one (4, 3, 3) rotation stack over the shared mesh arrays
+        current_renderer = self.get_current_renderer()
+        if not current_renderer or not hasattr(current_renderer, 'set_method_comparison'):
+            return
+        
+        rotation_obj = self.rotation_method_widget.get_current_rotation()
+        if not (self.comparison_visible and self.current_obj_data and rotation_obj):
+            current_renderer.clear_method_comparison()
+            return
+        
+        try:
+            euler_widget = self.rotation_method_widget.euler_widget
+            euler_order = euler_widget.get_rotation().order if euler_widget else "XYZ"
+            comparison = MethodComparison(RotationFactory.get_quaternion(rotation_obj), euler_order, COMPARISON_ROUND_INPUTS)
+            
+            # Deviations are coloured relative to the mesh size so every model uses the same scale
+            mesh = MeshArrays.for_obj(self.current_obj_data)
+            deviation = comparison.vertex_deviation(mesh.vertices)
+            colors = HeatMap.colors(deviation / (mesh.radius or 1.0), *COMPARISON_DEVIATION_RANGE)
+            labels = [
+                f"{method.value}\nmax {per_vertex.max(initial=0.0):.1e}"
+                for method, per_vertex in zip(comparison.METHODS, deviation)
+            ]
+            current_renderer.set_method_comparison(self.current_obj_data, comparison.matrices, colors, labels)
+            
+            if report:
+                self.output_text.append(f"\n{comparison.summary(deviation)}")
+        except Exception as e:
+            logger.error("Error comparing rotation methods: %s", e)
+    
+    def stop_rotation_animation(self):
+        self.animation_timer.stop()
+        self.animation = None
+        self.show_resting_pose()
+    
+    def show_resting_pose(self):
+        # In cumulative mode the resting rotated object is the original under the composed pose
+        for renderer in (self.opengl_view, self.custom_view):
+            if not renderer or not hasattr(renderer, 'clear_model_rotation'):
+                continue
+            if self.cumulative_mode and self.current_obj_data:
+                renderer.set_model_rotation(self.current_obj_data, self.current_pose.to_rotation_matrix())
+            else:
+                renderer.clear_model_rotation()
+    
+    @traced("MainWindow.toggle_renderer", "ui")
     def toggle_renderer(self):
         try:
-            if self.current_renderer == "opengl":
-                if self.opengl_view:
-                    self.opengl_view.hide()
-                if self.custom_view:
-                    self.custom_view.show()
-                self.current_renderer = "custom"
+            self.stop_rotation_animation()
+            
+            previous_renderer = self.get_current_renderer()
+            if previous_renderer and hasattr(previous_renderer, 'clear_orientation_trail'):
+                previous_renderer.clear_orientation_trail()
+            if previous_renderer and hasattr(previous_renderer, 'clear_method_comparison'):
+                previous_renderer.clear_method_comparison()
+            self.current_renderer = "custom" if self.current_renderer == "opengl" else "opengl"
+            
+            next_renderer = self.ensure_renderer(self.current_renderer)
+            if previous_renderer:
+                previous_renderer.hide()
+            if next_renderer:
+                next_renderer.show()
+            
+            if self.current_renderer == "custom":
                 self.toggle_renderer_button.setText("Switch to OpenGL Renderer")
             else:
-                if self.custom_view:
-                    self.custom_view.hide()
-                if self.opengl_view:
-                    self.opengl_view.show()
-                self.current_renderer = "opengl"
                 self.toggle_renderer_button.setText("Switch to Custom Renderer")
             
             # Update current renderer with existing data
@@ -449,9 +889,15 @@ class MainWindow(QMainWindow):
                 if rotation_obj and hasattr(current_renderer, 'set_rotation_parameters'):
                     axis, angle = self.extract_axis_angle(rotation_obj)
                     current_renderer.set_rotation_parameters(axis, angle)
+            
+            # A paused log keeps its pose on the newly shown renderer
+            self.show_resting_pose()
+            self.playback_controls.emit_pose()
+            self.update_orientation_trail()
+            self.update_method_comparison()
                 
         except Exception as e:
-            print(f"Error toggling renderer: {e}")
+            logger.error("Error toggling renderer: %s", e)
     
     def get_current_renderer(self):
         if self.current_renderer == "opengl":
@@ -459,6 +905,7 @@ class MainWindow(QMainWindow):
         else:
             return self.custom_view
     
+    @traced("MainWindow.reset_view", "ui")
     def reset_view(self):
         try:
             if hasattr(self, 'rotation_method_widget'):
@@ -466,7 +913,16 @@ class MainWindow(QMainWindow):
                     self.rotation_method_widget.reset_to_identity()
             
             # Clear rotated object
+            self.cancel_rotation_job()
+            self.playback_controls.pause()
+            self.stop_rotation_animation()
             self.rotated_obj_data = None
+            self.current_pose = Quaternion.IDENTITY
+            self.pose_applied = False
+            self.cumulative_rotation.reset()
+            self.show_resting_pose()
+            self.orientation_trail.clear()
+            self.update_orientation_trail()
             
             # Reset renderers
             if self.opengl_view:
@@ -481,14 +937,15 @@ class MainWindow(QMainWindow):
                 if hasattr(self.custom_view, 'reset_camera'):
                     self.custom_view.reset_camera()
             
-            # Reset display
+            # Reset display; the reset itself can be undone
             if self.current_obj_data:
+                self.record_state()
                 self.display_obj_data()
             else:
                 self.output_text.setText("No model loaded. Please select an OBJ file to begin.")
                 
         except Exception as e:
-            print(f"Error resetting view: {e}")
+            logger.error("Error resetting view: %s", e)
     
     def display_obj_data(self):
         try:
@@ -0,0 +1,238 @@
+import numpy as np
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
+    QComboBox, QDoubleSpinBox, QProgressBar, QTextEdit, QFileDialog, QSizePolicy
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QImage, QPixmap
+
+from ...config import SWEEP_STEP_DEGREES, SWEEP_MIN_STEP_DEGREES, SWEEP_CONDITION_RANGE, SWEEP_ERROR_RANGE
+from ...core.math.singularity_sweep import SingularitySweep
+from ...rendering.heatmap import HeatMap
+from ...diagnostics.log import get_logger
+from ..workers.rotation_worker import RotationWorker
+from ..styles.theme import set_style_role
+from ..styles.fonts import UIFonts
+
+logger = get_logger(__name__)
+
+class SweepHeatMapView(QLabel):
+    # One (middle angle x first angle) map; hovering shows the value under the cursor
+    def __init__(self, title: str, value_range: tuple, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.value_range = value_range
+        self.values = None
+        self.first = None
+        self.middle = None
+        self.axis_names = None
+
+        self.setMinimumSize(240, 120)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # One pixel per grid cell, stretched by QLabel; no rescaling on resize
+        self.setScaledContents(True)
+        self.setMouseTracking(True)
+        self.setText(title)
+
+    def set_map(self, values: np.ndarray, first: np.ndarray, middle: np.ndarray, axis_names: tuple):
+        self.values, self.first, self.middle, self.axis_names = values, first, middle, axis_names
+        self.update_pixmap()
+
+    def update_pixmap(self):
+        if self.values is None:
+            return
+        # Rows flipped so the positive middle angle is at the top
+        rgb = HeatMap.colors(self.values[::-1], *self.value_range)
+        pixels = np.ascontiguousarray((rgb * 255.0 + 0.5).astype(np.uint8))
+        height, width = pixels.shape[:2]
+        image = QImage(pixels.data, width, height, width * 3, QImage.Format.Format_RGB888).copy()
+        self.setPixmap(QPixmap.fromImage(image))
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        if self.values is None or self.pixmap().isNull():
+            return
+        # The pixmap fills the contents rect, so cursor position maps linearly onto the grid
+        rect = self.contentsRect()
+        u = (event.position().x() - rect.x()) / max(1, rect.width())
+        v = (event.position().y() - rect.y()) / max(1, rect.height())
+        rows, columns = self.values.shape
+        row = rows - 1 - min(rows - 1, max(0, int(v * rows)))
+        column = min(columns - 1, max(0, int(u * columns)))
+        first_name, middle_name = self.axis_names[0], self.axis_names[1]
+        self.setToolTip(
+            f"{first_name} = {self.first[column]:.1f}°, {middle_name} = {self.middle[row]:.1f}°\n"
+            f"{self.title}: {self.values[row, column]:.3g}"
+        )
+
+class SingularitySweepWindow(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result = None
+
+        # A separate single-thread worker so a sweep never competes with mesh rotations
+        self.worker = RotationWorker(self, max_threads=1)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.failed.connect(self.on_failed)
+
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle("Gimbal Lock Sweep")
+        self.resize(900, 560)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Convention:"))
+        self.convention_combo = QComboBox()
+        self.convention_combo.addItems(SingularitySweep.CONVENTIONS)
+        controls.addWidget(self.convention_combo)
+
+        controls.addWidget(QLabel("Step:"))
+        self.step_spin = QDoubleSpinBox()
+        self.step_spin.setRange(SWEEP_MIN_STEP_DEGREES, 30.0)
+        self.step_spin.setSingleStep(0.25)
+        self.step_spin.setDecimals(2)
+        self.step_spin.setSuffix("°")
+        self.step_spin.setValue(SWEEP_STEP_DEGREES)
+        self.step_spin.valueChanged.connect(self.update_sample_count)
+        controls.addWidget(self.step_spin)
+
+        self.samples_label = QLabel()
+        self.samples_label.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
+        controls.addWidget(self.samples_label)
+        controls.addStretch()
+
+        self.run_button = QPushButton("Run Sweep")
+        self.run_button.clicked.connect(self.run_sweep)
+        set_style_role(self.run_button, "primary")
+        controls.addWidget(self.run_button)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_sweep)
+        self.cancel_button.setEnabled(False)
+        set_style_role(self.cancel_button, "warning")
+        controls.addWidget(self.cancel_button)
+
+        self.export_button = QPushButton("Export...")
+        self.export_button.clicked.connect(self.export_result)
+        self.export_button.setEnabled(False)
+        set_style_role(self.export_button, "secondary")
+        controls.addWidget(self.export_button)
+        layout.addLayout(controls)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumHeight(12)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        # Condition uses a log ramp from well-conditioned (1) to near-singular
+        maps = QGridLayout()
+        self.condition_view = SweepHeatMapView("Jacobian condition", SWEEP_CONDITION_RANGE)
+        self.parameter_view = SweepHeatMapView("Parameter error (°)", SWEEP_ERROR_RANGE)
+        self.rotation_view = SweepHeatMapView("Rotation error (°)", SWEEP_ERROR_RANGE)
+        for column, view in enumerate((self.condition_view, self.parameter_view, self.rotation_view)):
+            title = QLabel(view.title)
+            set_style_role(title, "section")
+            maps.addWidget(title, 0, column)
+            maps.addWidget(view, 1, column)
+        self.axes_label = QLabel()
+        self.axes_label.setFont(QFont(UIFonts.FAMILY, UIFonts.SMALL_SIZE))
+        maps.addWidget(self.axes_label, 2, 0, 1, 3)
+        maps.setRowStretch(1, 1)
+        layout.addLayout(maps, 1)
+
+        self.summary_text = QTextEdit()
+        self.summary_text.setReadOnly(True)
+        self.summary_text.setMaximumHeight(110)
+        self.summary_text.setFont(QFont(UIFonts.MONOSPACE_FAMILY, UIFonts.SMALL_SIZE))
+        layout.addWidget(self.summary_text)
+
+        self.update_sample_count()
+
+    def update_sample_count(self):
+        step = self.step_spin.value()
+        samples = int(round(360.0 / step)) ** 2 * (int(round(180.0 / step)) + 1)
+        self.samples_label.setText(f"{samples:,} samples")
+
+    def run_sweep(self):
+        try:
+            sweep = SingularitySweep(self.convention_combo.currentText(), self.step_spin.value())
+        except ValueError as e:
+            self.summary_text.setText(str(e))
+            return
+
+        self.worker.start(sweep)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.run_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.summary_text.setText(f"Sweeping {sweep.convention} ({sweep.samples:,} samples)...")
+
+    def cancel_sweep(self):
+        self.worker.cancel()
+        self.summary_text.append("Cancelled.")
+        self.on_sweep_ended()
+
+    def on_sweep_ended(self):
+        self.progress_bar.hide()
+        self.run_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def on_progress(self, percent: int):
+        self.progress_bar.setValue(percent)
+
+    def on_finished(self, sweep, result):
+        self.on_sweep_ended()
+        self.result = result
+        self.export_button.setEnabled(True)
+
+        first_name, middle_name = result.axis_names[0], result.axis_names[1]
+        self.condition_view.set_map(result.condition_map(), result.first, result.middle, result.axis_names)
+        self.parameter_view.set_map(result.error_map("parameter"), result.first, result.middle, result.axis_names)
+        self.rotation_view.set_map(result.error_map("rotation"), result.first, result.middle, result.axis_names)
+        self.axes_label.setText(
+            f"Horizontal: {first_name} (-180° to 180°), vertical: {middle_name} (-90° bottom to 90° top); "
+            f"errors are the worst case over {result.axis_names[2]}"
+        )
+        self.summary_text.setText(result.summary())
+        logger.info("Singularity sweep %s: %d samples in %.2f s", result.convention, result.samples, result.elapsed_s)
+
+    def on_failed(self, sweep, message: str):
+        self.on_sweep_ended()
+        self.summary_text.setText(f"Sweep failed: {message}")
+
+    def export_result(self):
+        if self.result is None:
+            return
+        default_name = f"sweep_{self.result.convention.lower().replace('-', '_')}.npz"
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Sweep", default_name, "NumPy Archive (*.npz)")
+        if not file_path:
+            return
+        try:
+            self.result.save(file_path)
+            self.summary_text.append(f"Exported to {file_path}")
+        except OSError as e:
+            self.summary_text.append(f"Export failed: {e}")
+
+    def stop_sweep(self):
+        # Hiding the dialog must not leave a sweep running in the background
+        if self.worker.busy:
+            self.cancel_sweep()
+        self.worker.shutdown()
+
+    def reject(self):
+        # Escape rejects the dialog without a close event
+        self.stop_sweep()
+        super().reject()
+
+    def closeEvent(self, event):
+        self.stop_sweep()
+        super().closeEvent(event)
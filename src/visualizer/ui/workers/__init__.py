@@ -0,0 +1,3 @@
+from .rotation_worker import RotationWorker
+
+__all__ = ["RotationWorker"]
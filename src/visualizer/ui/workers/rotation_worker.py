@@ -0,0 +1,97 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ...config import ROTATION_WORKER_THREADS
+from ...core.math.rotation_job import RotationJob, RotationCancelled
+from ...diagnostics.log import get_logger
+
+logger = get_logger(__name__)
+
+class _RotationRunnable(QRunnable):
+    def __init__(self, job, worker: 'RotationWorker'):
+        super().__init__()
+        self.job = job
+        self.worker = worker
+    
+    def run(self):
+        job = self.job
+        last_percent = -1
+        
+        def report(fraction):
+            # Emit only on whole-percent steps to keep the GUI event queue short
+            nonlocal last_percent
+            percent = int(fraction * 100)
+            if percent != last_percent:
+                last_percent = percent
+                self.worker._job_progress.emit(job, percent)
+        
+        try:
+            result = job.run(report)
+        except RotationCancelled:
+            return
+        except Exception as e:
+            self.worker._job_failed.emit(job, str(e))
+            return
+        self.worker._job_finished.emit(job, result)
+
+class RotationWorker(QObject):
+    # Public signals only fire for the latest submitted job; superseded jobs are dropped.
+    # Any job with run(progress), cancel() and job_id can be started, e.g. a SingularitySweep
+    progress = Signal(int)              # percent
+    finished = Signal(object, object)   # (job, result), e.g. (RotationJob, rotated OBJData)
+    failed = Signal(object, str)        # (job, error message)
+    
+    # Emitted from pool threads, delivered to this object's (GUI) thread
+    _job_progress = Signal(object, int)
+    _job_finished = Signal(object, object)
+    _job_failed = Signal(object, str)
+    
+    def __init__(self, parent=None, max_threads: int = ROTATION_WORKER_THREADS):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, max_threads))
+        self.current_job = None
+        
+        self._job_progress.connect(self._on_job_progress)
+        self._job_finished.connect(self._on_job_finished)
+        self._job_failed.connect(self._on_job_failed)
+    
+    @property
+    def busy(self) -> bool:
+        return self.current_job is not None
+    
+    def submit(self, obj_data, rotation_obj, method) -> RotationJob:
+        job = self.start(RotationJob(obj_data, rotation_obj, method))
+        logger.debug("Rotation job %d submitted (%d vertices)", job.job_id, len(obj_data.vertices))
+        return job
+    
+    def start(self, job):
+        # Only the newest job matters: the previous one stops at its next chunk
+        self.cancel()
+        self.current_job = job
+        self.pool.start(_RotationRunnable(job, self))
+        return job
+    
+    def cancel(self):
+        if self.current_job is not None:
+            self.current_job.cancel()
+            self.current_job = None
+    
+    def shutdown(self, timeout_ms: int = 2000):
+        self.cancel()
+        self.pool.waitForDone(timeout_ms)
+    
+    def _on_job_progress(self, job, percent):
+        if job is self.current_job:
+            self.progress.emit(percent)
+    
+    def _on_job_finished(self, job, result):
+        if job is not self.current_job:
+            return
+        self.current_job = None
+        self.finished.emit(job, result)
+    
+    def _on_job_failed(self, job, message):
+        if job is not self.current_job:
+            return
+        self.current_job = None
+        self.failed.emit(job, message)